@@ -17,6 +17,14 @@ from datetime import datetime
 import math, random
 print('6')
 from typing import Optional, Tuple
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+from beta.export_watch_b import wait_for_export
+
+CLIPSTORE_DIR = Path("/Users/marcus/Downloads/reddit1_filmora_clipstore")
 
 
 
@@ -785,7 +793,7 @@ def make_edits(background_reddit1, audio_duration, target_dir_audio, target_name
     pyautogui.click(1077,305)
     time.sleep(0.1)
 
-    navigate_open_dialog_to_folder("/Users/marcus/Downloads/reddit1_filmora_clipstore")
+    navigate_open_dialog_to_folder(str(CLIPSTORE_DIR))
 
     pyautogui.move(1153, 582)
     time.sleep(2.0)
@@ -820,24 +828,8 @@ def make_edits(background_reddit1, audio_duration, target_dir_audio, target_name
     time.sleep(0.5)
     pyautogui.leftClick(1092, 760)
 
-    #Checking until export is finished exporting LOL
-    
-    if audio_duration > 900:
-        pause_wait = 90
-    elif audio_duration > 400:
-        pause_wait = 30
-    else:
-        pause_wait = 20
-
-    time.sleep(pause_wait)
-    while True:
-        has_match = area_has_color_match(394, 481)   # saves into ./captures/
-
-        print(f"[watch] match={has_match}")
-        if has_match:
-            time.sleep(3.0)
-            continue
-        break
+    #Wait on the exported file itself (size settles, ffprobe reads full duration)
+    wait_for_export(CLIPSTORE_DIR / f"{export_title}.mp4", expected_duration=audio_duration)
 
     pyautogui.moveTo(359, 216)
     time.sleep(1.0)
@@ -0,0 +1,22 @@
+# alpha/phonemes.py
+"""
+Alpha's entry to the persistent grapheme-to-phoneme cache. The cache itself (schema, keying,
+sentence/word levels) lives in beta/phoneme_cache_b.py and is imported from there, so both
+pipelines share one implementation over the same SQLite file.
+"""
+import re, sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from beta.phoneme_cache_b import (CACHE_PATH, WORD_LEVEL, STATS, _norm,   # noqa: F401  (re-exported)
+                                  phonemize_cached, cache_stats, reset_stats)
+
+_SENT_SPLIT = re.compile(r"(?<=[.!?…])\s+")
+
+def phonemize_text(tokenizer, text: str, lang: str = "en-us") -> str:
+    """Phonemize a whole script sentence by sentence through the cache."""
+    parts = [p for p in _SENT_SPLIT.split(_norm(text)) if p]
+    return " ".join(phonemize_cached(tokenizer, p, lang) for p in parts)
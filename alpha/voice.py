@@ -16,6 +16,11 @@ except Exception:
 
 from kokoro_onnx import Kokoro, SAMPLE_RATE
 
+try:
+    from alpha.phonemes import phonemize_text, cache_stats
+except ImportError:  # run from inside alpha/
+    from phonemes import phonemize_text, cache_stats
+
 # ----- asset discovery -----
 def _resolve_kokoro_assets():
     print("[kokoro] resolving asset paths…", flush=True)
@@ -64,7 +69,11 @@ def _to_mono_float32(y):
 def compile_audio(text: str, voice: str = "am_adam", speed: float = 1.05, rate: int = SAMPLE_RATE):
     print(f"[kokoro] synth start | voice={voice} speed={speed} sr={rate} text_len={len(text)}", flush=True)
     t0 = time.perf_counter()
-    y = _TTS.create(text, voice=voice, speed=speed)  # ndarray or (L,R)
+    ph = phonemize_text(_TTS.tokenizer, text)  # cached G2P in front of Kokoro
+    st = cache_stats()
+    print(f"[kokoro] phonemes ready in {(time.perf_counter() - t0)*1000:.0f} ms | "
+          f"sentence hit rate={st['sentence_hit_rate']:.0%}", flush=True)
+    y = _TTS.create(ph, voice=voice, speed=speed, is_phonemes=True)  # ndarray or (L,R)
     t1 = time.perf_counter()
     try:
         y_shape = np.asarray(y).shape
@@ -5,12 +5,13 @@ from pathlib import Path
 from datetime import datetime
 import re, subprocess, json 
 import time
-import pyautogui
 
-from editing_b import beta_make_edits
+from render_b import render_single_pass, render_cached
+from footage_b import CLIPSTORE_DIR
 from script_b import generate_script2
-from voice_b import compile_audio, showtime
+from voice_b import compile_audio, showtime, audio_suffix, variant_for_channel
 from captions_b import beta_captions
+from handoff_b import release_audio
 from thumbnail_b import render_black_topleft
 from upload_b import upload_youtube2  # v2 for channel-specific upload
 from first_sentence_b import first_sentence
@@ -61,6 +62,7 @@ HASHTAGS = "#aita  #redditconfessions  #relationshipstories #redditfamilydrama #
 TAGS = ["redditfamilydrama", "reddit", "redditrelationship", "shorts"]  
 SCHEDULE_AT_LOCAL = None
 MODE = "private"  # switch to "public" when ready
+CHANNEL_API_JSON = "whatreallyhappened.json"
 
 
 #=========#=========#=========#=========#=========#=========#SCRIPT===#=========#=========#=========#=========#=========#=========#=========#=========#=========#========
@@ -83,9 +85,8 @@ But anyway, the next day I find out the old crazy guy is my uncles best friend,
 I have to admit, it was a good prank, even if I was terrified of being murdered for a day or two.
 
 '''
-text = clean_script_text(text)
+text = clean_script_text(text, replace_commas=False)  # pauses come from voice_b.PAUSE_SEC now
 thumbnail_sentence = first_sentence(text)
-display_time = showtime(thumbnail_sentence)
 
 TITLE = thumbnail_sentence
 
@@ -107,33 +108,57 @@ thumbnail_box_path = render_black_topleft(
     # font_path=None,                      # leave None to auto-find Arial
 )
 
-# TTS
-wav_bytes, duration_sec = compile_audio(text)
+# TTS (timings holds per-sentence sample offsets; sentence 0 == thumbnail_sentence)
+VOICE_FMT = "edit"  # PCM16 WAV for the editor import (see voice_b.STAGE_FORMATS)
+SHORTS_MAX_VOICE_SEC = 178.0  # leaves headroom under the 180 s Shorts limit checked below
+voice_bytes, duration_sec, timings = compile_audio(text, fmt=VOICE_FMT, variant=variant_for_channel(CHANNEL_API_JSON),
+                                                   max_duration=SHORTS_MAX_VOICE_SEC, handoff="shm")
+display_time = showtime(timings, 0)
 
 # Save audio
 INBOX = Path("/Users/marcus/Movies/FilmoraInbox/reddit1_pipeline")
 INBOX.mkdir(parents=True, exist_ok=True)
-file_path  = INBOX / f"voice_{datetime.now():%Y%m%d_%H%M%S}.wav"
-file_path.write_bytes(wav_bytes)
+file_path  = INBOX / f"voice_{datetime.now():%Y%m%d_%H%M%S}{audio_suffix(VOICE_FMT)}"
+file_path.write_bytes(voice_bytes)
 target_dir_audio  = file_path.parent.as_posix()
 target_name_audio = file_path.name
 
-# Build video in Filmora (CHANGE MEDIA)
-export_title = beta_make_edits(16, duration_sec, target_dir_audio, target_name_audio)
-combined_no_captions_path = f"/Users/marcus/Downloads/reddit1_filmora_clipstore/{export_title}.mp4"
-
-#Captions with thumbnail
-combined_yes_captions_path = beta_captions(
-    combined_no_captions_path,
+# Build video (CHANGE MEDIA):
+#   "ffmpeg"  = render_b single pass: background, voice, captions and intro card in one encode
+#   "cached"  = render_b.render_cached: cached uncaptioned base + caption burn, so restyles
+#               (python render_b.py <voice file>) only rerun the burn
+#   "filmora" = GUI automation export, then a separate caption burn
+EDIT_ENGINE = "filmora"
+INTRO_KW = dict(
     intro_card_src=thumbnail_box_path,
-    intro_secs=display_time ,
+    intro_secs=display_time,
     intro_fade=0.1,
     intro_scale=0.80,
     intro_crop_bottom=0.25,
     intro_offset_x=0,
     intro_offset_y=0,
-    intro_round_px=45
+    intro_round_px=45,
 )
+try:
+    if EDIT_ENGINE == "ffmpeg":
+        combined_yes_captions_path = render_single_pass(16, duration_sec, target_dir_audio, target_name_audio,
+                                                        audio=timings["audio"], **INTRO_KW)
+    elif EDIT_ENGINE == "cached":
+        combined_yes_captions_path = render_cached(16, duration_sec, target_dir_audio, target_name_audio,
+                                                   audio=timings["audio"], **INTRO_KW)
+    else:
+        from editing_b import beta_make_edits   # GUI automation: needs a display, so only loaded here
+        export_title = beta_make_edits(16, duration_sec, target_dir_audio, target_name_audio)
+        combined_no_captions_path = f"{CLIPSTORE_DIR}/{export_title}.mp4"
+
+        #Captions with thumbnail
+        combined_yes_captions_path = beta_captions(
+            combined_no_captions_path,
+            **INTRO_KW,
+            audio=timings["audio"],  # Whisper reads the TTS samples from shared memory, not the MP4
+        )
+finally:
+    release_audio(timings["audio"])   # free the shared-memory voiceover even if the render fails
 
 
 # --- NEW: verify the final render qualifies as a Short ---
@@ -151,7 +176,7 @@ upload_youtube2(
     TAGS = TAGS,
     MODE = MODE,
     SCHEDULE_AT_LOCAL = SCHEDULE_AT_LOCAL,
-    channel_api_json="whatreallyhappened.json"
+    channel_api_json=CHANNEL_API_JSON
 )
 print("SENT WOOSH")
 
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Encode a short representative clip with candidate encoders/presets on this machine,
+measure speed (fps), size (kbps) and quality (SSIM against the source), and save the pick
+per render stage to encoder_profile_b.ENCODER_PROFILE_PATH.
+
+Candidates: libx264 and libx265 presets, plus libsvtav1 when this ffmpeg has it. CRFs are
+set per codec to land at comparable quality. For each stage the choice is the fastest
+candidate that meets the SSIM floor and the stage's size budget (a multiple of the smallest
+passing bitrate): render favours speed, concat favours size.
+
+Usage:
+  python bench_encoders_b.py [clip.mp4] [--seconds 10] [--min-ssim 0.97]
+                             [--budget render=1.5,concat=1.1] [--no-save]
+"""
+import re, sys, time, argparse, subprocess, tempfile
+from pathlib import Path
+
+from encoder_profile_b import save_profile, ENCODER_PROFILE_PATH
+
+CANDIDATES = {
+    "libx264":   {"crf": 18, "presets": ["ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow"]},
+    "libx265":   {"crf": 22, "presets": ["ultrafast", "superfast", "veryfast", "fast", "medium"]},
+    "libsvtav1": {"crf": 30, "presets": ["12", "10", "8", "6"]},
+}
+OUT_W, OUT_H = 1080, 1920   # bench at the Shorts canvas the renders produce
+
+def available_encoders() -> set[str]:
+    out = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"], check=True, text=True, capture_output=True).stdout
+    return {name for name in CANDIDATES if re.search(rf"\s{name}\s", out)}
+
+def make_sample(src: Path, seconds: float, out: Path) -> None:
+    """Lossless (x264 qp 0) 9:16 reference clip, so every candidate starts from the same frames."""
+    vf = f"scale={OUT_W}:{OUT_H}:force_original_aspect_ratio=increase,crop={OUT_W}:{OUT_H},setsar=1,format=yuv420p"
+    subprocess.run(["ffmpeg", "-y", "-hide_banner", "-loglevel", "error", "-ss", "60", "-t", str(seconds),
+                    "-i", str(src), "-an", "-vf", vf, "-c:v", "libx264", "-preset", "ultrafast", "-qp", "0", str(out)],
+                   check=True)
+
+def count_frames(path: Path) -> int:
+    cmd = ["ffprobe", "-v", "error", "-select_streams", "v:0", "-count_packets",
+           "-show_entries", "stream=nb_read_packets", "-of", "csv=p=0", str(path)]
+    return int(subprocess.run(cmd, check=True, text=True, capture_output=True).stdout.strip() or 0)
+
+def ssim(test: Path, ref: Path) -> float:
+    run = subprocess.run(["ffmpeg", "-hide_banner", "-i", str(test), "-i", str(ref), "-lavfi", "ssim", "-f", "null", "-"],
+                         check=False, text=True, capture_output=True)
+    m = re.search(r"All:([0-9.]+)", run.stderr or "")
+    return float(m.group(1)) if m else 0.0
+
+def bench_one(vcodec: str, preset: str, crf: int, ref: Path, frames: int, seconds: float, td: Path) -> dict:
+    out = td / f"{vcodec}_{preset}.mp4"
+    t0 = time.perf_counter()
+    run = subprocess.run(["ffmpeg", "-y", "-hide_banner", "-loglevel", "error", "-i", str(ref),
+                          "-c:v", vcodec, "-preset", preset, "-crf", str(crf), "-pix_fmt", "yuv420p", str(out)],
+                         check=False, text=True, capture_output=True)
+    wall = time.perf_counter() - t0
+    if run.returncode != 0:
+        return {"vcodec": vcodec, "preset": preset, "crf": crf, "error": (run.stderr or "").strip()[-200:]}
+    return {"vcodec": vcodec, "preset": preset, "crf": crf, "fps": frames / wall,
+            "kbps": out.stat().st_size * 8 / 1000 / seconds, "ssim": ssim(out, ref)}
+
+def pick(results: list[dict], min_ssim: float, budget: float) -> dict | None:
+    ok = [r for r in results if "error" not in r and r["ssim"] >= min_ssim]
+    if not ok:
+        return None
+    cap = min(r["kbps"] for r in ok) * budget
+    within = [r for r in ok if r["kbps"] <= cap]
+    return max(within, key=lambda r: r["fps"])
+
+def main():
+    parser = argparse.ArgumentParser(description="Video encoder autotune")
+    parser.add_argument("clip", nargs="?", default=None, help="Source clip (default: first catalogued background)")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--min-ssim", type=float, default=0.97)
+    parser.add_argument("--budget", default="render=1.5,concat=1.1",
+                        help="Per-stage size budget as a multiple of the smallest passing bitrate")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    if args.clip:
+        src = Path(args.clip)
+    else:
+        from catalog_b import all_footage, scan
+        scan()
+        rows = all_footage()
+        if not rows:
+            sys.exit("[bench] no clip given and the footage catalog is empty")
+        src = Path(rows[0]["path"])
+    budgets = {k: float(v) for k, v in (kv.split("=") for kv in args.budget.split(",") if kv)}
+    encoders = available_encoders()
+    print(f"[bench] source {src.name} | {args.seconds:.0f}s @ {OUT_W}x{OUT_H} | encoders: {', '.join(sorted(encoders))}")
+
+    results = []
+    with tempfile.TemporaryDirectory() as td:
+        td = Path(td)
+        ref = td / "ref.mkv"
+        make_sample(src, args.seconds, ref)
+        frames = count_frames(ref)
+        for vcodec in sorted(encoders):
+            spec = CANDIDATES[vcodec]
+            for preset in spec["presets"]:
+                r = bench_one(vcodec, preset, spec["crf"], ref, frames, args.seconds, td)
+                results.append(r)
+                if "error" in r:
+                    print(f"  {vcodec:<10} {preset:<10} failed: {r['error']}")
+                else:
+                    print(f"  {vcodec:<10} {preset:<10} {r['fps']:7.1f} fps {r['kbps']:8.0f} kbps  SSIM {r['ssim']:.4f}")
+
+    stages = {}
+    for stage, budget in budgets.items():
+        best = pick(results, args.min_ssim, budget)
+        if best is None:
+            print(f"[bench] {stage}: nothing meets SSIM >= {args.min_ssim}; keeping defaults")
+            continue
+        stages[stage] = {"vcodec": best["vcodec"], "preset": best["preset"], "crf": best["crf"]}
+        print(f"[bench] {stage}: {best['vcodec']} {best['preset']} crf {best['crf']} "
+              f"({best['fps']:.1f} fps, {best['kbps']:.0f} kbps, budget x{budget})")
+
+    if not args.no_save and stages:
+        print(f"[bench] saved → {save_profile({'stages': stages, 'results': results})}")
+    elif not stages:
+        print(f"[bench] nothing saved to {ENCODER_PROFILE_PATH}")
+
+if __name__ == "__main__":
+    main()
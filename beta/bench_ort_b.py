@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Sweep ONNX Runtime settings for the Kokoro engine on this machine and save the fastest
+one to voice_b.ORT_PROFILE_PATH, where voice_b.get_tts() picks it up on later runs.
+
+Usage:
+  python bench_ort_b.py [--reps 3] [--threads 1,2,4,8] [--no-save]
+"""
+import os, sys, time, argparse, itertools
+
+from voice_b import (build_tts, save_ort_profile, load_ort_settings, ORT_DEFAULTS,
+                     ORT_PROFILE_PATH, _to_mono_float32, SAMPLE_RATE)
+
+BENCH_TEXT = (
+    "He starts going through attendance, not looking up the whole time. "
+    "Then he gets to my name. Starts to say it, then stops. "
+    "Looks up, scans the room, looks directly at me."
+)
+
+def _thread_choices(arg: str | None) -> list[int]:
+    if arg:
+        return [int(x) for x in arg.split(",") if x.strip()]
+    n = os.cpu_count() or 4
+    return sorted({1, 2, 4, max(1, n // 2), n})
+
+def bench_once(settings: dict, reps: int, voice: str = "am_adam", speed: float = 1.05) -> dict:
+    t0 = time.perf_counter()
+    tts = build_tts(settings)
+    load_s = time.perf_counter() - t0
+    tts.create("Warm up.", voice=voice, speed=speed)  # first run pays allocation/graph costs
+    best = float("inf")
+    samples = 0
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        y = tts.create(BENCH_TEXT, voice=voice, speed=speed)
+        best = min(best, time.perf_counter() - t0)
+        samples = _to_mono_float32(y).shape[0]
+    audio_s = samples / float(SAMPLE_RATE)
+    return {"synth_s": best, "load_s": load_s, "rtf": best / audio_s if audio_s else float("inf")}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ONNX Runtime settings for Kokoro")
+    parser.add_argument("--reps", type=int, default=3, help="Timed runs per setting (best is kept)")
+    parser.add_argument("--threads", default=None, help="Comma list of intra-op thread counts")
+    parser.add_argument("--no-save", action="store_true", help="Print results without saving the profile")
+    args = parser.parse_args()
+
+    grid = []
+    for intra, opt, arena in itertools.product(_thread_choices(args.threads), ("extended", "all"), (True, False)):
+        grid.append({**ORT_DEFAULTS, "intra_op_threads": intra, "graph_opt": opt, "mem_arena": arena})
+    # inter-op threads only matter with the parallel executor; try it once per thread count
+    for intra in _thread_choices(args.threads):
+        grid.append({**ORT_DEFAULTS, "intra_op_threads": intra, "inter_op_threads": 2, "exec_mode": "parallel"})
+
+    print(f"[bench] current settings: {load_ort_settings()}")
+    print(f"[bench] {len(grid)} configurations × {args.reps} reps")
+    results = []
+    for i, cfg in enumerate(grid, 1):
+        try:
+            r = bench_once(cfg, args.reps)
+        except Exception as e:
+            print(f"[{i}/{len(grid)}] skip {cfg}: {e}")
+            continue
+        results.append((r["synth_s"], cfg, r))
+        print(f"[{i}/{len(grid)}] {r['synth_s']*1000:7.0f} ms  rtf={r['rtf']:.3f}  load={r['load_s']:.2f}s  {cfg}")
+
+    if not results:
+        sys.exit("[bench] no configuration ran successfully")
+    results.sort(key=lambda t: t[0])
+    best_s, best_cfg, best_r = results[0]
+    print(f"\n[bench] fastest: {best_s*1000:.0f} ms (rtf={best_r['rtf']:.3f}) with {best_cfg}")
+    if not args.no_save:
+        path = save_ort_profile(best_cfg, {"rtf": best_r["rtf"], "cpu_count": os.cpu_count(),
+                                           "measured_at": time.strftime("%Y-%m-%d %H:%M:%S")})
+        print(f"[bench] saved profile → {path}")
+    else:
+        print(f"[bench] not saved (profile path would be {ORT_PROFILE_PATH})")
+
+if __name__ == "__main__":
+    main()
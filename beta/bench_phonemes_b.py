@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark the phoneme cache against uncached espeak phonemization, and show what share of
+synthesis time phonemization is for a real script.
+
+Runs against a throwaway cache file so the real cache is left untouched.
+
+Usage:
+  python bench_phonemes_b.py [script.txt] [--word-level] [--synth N]
+"""
+import sys, time, tempfile, argparse
+from pathlib import Path
+
+import phoneme_cache_b
+from first_sentence_b import split_sentences
+from voice_b import get_tokenizer, _synth, LANG
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SCRIPT = REPO_ROOT / "app" / "scripts" / "gen_scripts" / "1text.txt"
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+def main():
+    parser = argparse.ArgumentParser(description="Phoneme cache benchmark")
+    parser.add_argument("script", nargs="?", default=str(DEFAULT_SCRIPT))
+    parser.add_argument("--word-level", action="store_true", help="Also assemble misses from the word cache")
+    parser.add_argument("--synth", type=int, default=20, help="Sentences to synthesize for the share estimate (0 = skip)")
+    args = parser.parse_args()
+
+    text = Path(args.script).read_text(encoding="utf-8")
+    sentences = split_sentences(text)
+    tok = get_tokenizer()
+    print(f"[bench] {len(sentences)} sentences, {len(text.split())} words from {args.script}")
+
+    ref, t_plain = _timed(lambda: [tok.phonemize(s, LANG) for s in sentences])
+    print(f"[bench] uncached phonemize : {t_plain*1000:8.0f} ms")
+
+    with tempfile.TemporaryDirectory() as td:
+        phoneme_cache_b.CACHE_PATH = Path(td) / "phonemes.sqlite"
+        phoneme_cache_b._conn = None
+        for label in ("cold cache", "warm cache"):
+            phoneme_cache_b.reset_stats()
+            got, t = _timed(lambda: [phoneme_cache_b.phonemize_cached(tok, s, LANG, args.word_level) for s in sentences])
+            st = phoneme_cache_b.cache_stats()
+            print(f"[bench] {label:<19}: {t*1000:8.0f} ms | x{t_plain / max(t, 1e-9):6.1f} | "
+                  f"sentence hit rate={st['sentence_hit_rate']:.0%} word hit rate={st['word_hit_rate']:.0%} "
+                  f"assembled={st['word_assembled']}")
+        same = sum(a == b for a, b in zip(ref, got))
+        print(f"[bench] phoneme parity vs uncached: {same}/{len(ref)} sentences identical")
+        phoneme_cache_b._conn.close()
+        phoneme_cache_b._conn = None
+
+    if args.synth:
+        sample = sentences[: args.synth]
+        phs = ref[: args.synth]
+        _, t_ph = _timed(lambda: [tok.phonemize(s, LANG) for s in sample])
+        _, t_syn = _timed(lambda: [_synth(p, "am_adam", 1.05) for p in phs])
+        share = t_ph / (t_ph + t_syn) if (t_ph + t_syn) else 0.0
+        print(f"[bench] {len(sample)} sentences: phonemize {t_ph*1000:.0f} ms + inference {t_syn*1000:.0f} ms "
+              f"→ phonemization share {share:.1%} of uncached synthesis")
+
+if __name__ == "__main__":
+    sys.exit(main())
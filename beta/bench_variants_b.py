@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Compare Kokoro model variants (voice_b.MODEL_VARIANTS) on fixed scripts:
+real-time factor, resident memory, and an objective audio difference against fp32.
+
+Each variant runs in its own subprocess so RSS is measured in isolation.
+The difference score is the log-spectral distance (dB, lower = closer) between the
+variant's and the fp32 rendering of each script, over their common length, plus the
+duration delta (quantized duration predictors can shift timing slightly).
+
+Usage:
+  python bench_variants_b.py [--variants fp32,fp16,int8] [--voice am_adam] [--speed 1.05]
+"""
+import os, sys, json, time, argparse, subprocess, tempfile
+from pathlib import Path
+import numpy as np
+
+FIXED_SCRIPTS = [
+    "What was the best prank someone ever pulled on you?",
+    "He starts going through attendance, not looking up the whole time. Then he gets to my name.",
+    "I'm shocked, mortified. I can't find the words to respond, this creeper has just described my family.",
+    "I have to admit, it was a good prank, even if I was terrified of being murdered for a day or two.",
+]
+
+def _stft_logmag(x: np.ndarray, n_fft: int = 1024, hop: int = 256) -> np.ndarray:
+    if x.shape[0] < n_fft:
+        x = np.pad(x, (0, n_fft - x.shape[0]))
+    frames = np.lib.stride_tricks.sliding_window_view(x, n_fft)[::hop] * np.hanning(n_fft)
+    return 20 * np.log10(np.abs(np.fft.rfft(frames, axis=1)) + 1e-6)
+
+def log_spectral_distance(ref: np.ndarray, test: np.ndarray) -> float:
+    n = min(ref.shape[0], test.shape[0])
+    a, b = _stft_logmag(ref[:n]), _stft_logmag(test[:n])
+    return float(np.mean(np.sqrt(np.mean((a - b) ** 2, axis=1))))
+
+def run_one(variant: str, voice: str, speed: float, out_dir: Path) -> dict:
+    """Child-process body: load one variant, synthesize the fixed scripts, report numbers."""
+    import psutil
+    from voice_b import build_tts, _to_mono_float32, SAMPLE_RATE
+    proc = psutil.Process()
+    rss0 = proc.memory_info().rss
+    t0 = time.perf_counter()
+    tts = build_tts(variant=variant)
+    load_s = time.perf_counter() - t0
+    tts.create("Warm up.", voice=voice, speed=speed)
+    synth_s, audio_s = 0.0, 0.0
+    for i, text in enumerate(FIXED_SCRIPTS):
+        t0 = time.perf_counter()
+        y = _to_mono_float32(tts.create(text, voice=voice, speed=speed))
+        synth_s += time.perf_counter() - t0
+        audio_s += y.shape[0] / float(SAMPLE_RATE)
+        np.save(out_dir / f"{variant}_{i}.npy", y)
+    return {"variant": variant, "load_s": load_s, "synth_s": synth_s, "audio_s": audio_s,
+            "rtf": synth_s / audio_s if audio_s else float("inf"),
+            "rss_mb": proc.memory_info().rss / 1e6, "rss_delta_mb": (proc.memory_info().rss - rss0) / 1e6}
+
+def main():
+    parser = argparse.ArgumentParser(description="Kokoro model variant benchmark")
+    parser.add_argument("--variants", default="fp32,fp16,int8")
+    parser.add_argument("--voice", default="am_adam")
+    parser.add_argument("--speed", type=float, default=1.05)
+    parser.add_argument("--one", default=None, help=argparse.SUPPRESS)       # child mode
+    parser.add_argument("--out-dir", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.one:
+        print("RESULT " + json.dumps(run_one(args.one, args.voice, args.speed, Path(args.out_dir))), flush=True)
+        return
+
+    variants = [v.strip() for v in args.variants.split(",") if v.strip()]
+    if "fp32" not in variants:
+        variants.insert(0, "fp32")  # reference for the difference score
+    results = {}
+    with tempfile.TemporaryDirectory() as td:
+        for v in variants:
+            cmd = [sys.executable, os.path.abspath(__file__), "--one", v, "--out-dir", td,
+                   "--voice", args.voice, "--speed", str(args.speed)]
+            run = subprocess.run(cmd, capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+            line = next((l for l in run.stdout.splitlines() if l.startswith("RESULT ")), None)
+            if run.returncode != 0 or line is None:
+                tail = "\n".join((run.stderr or run.stdout).splitlines()[-5:])
+                print(f"[bench] {v}: failed\n{tail}")
+                continue
+            results[v] = json.loads(line[len("RESULT "):])
+
+        if "fp32" not in results:
+            sys.exit("[bench] fp32 reference failed; cannot score differences")
+        for v, r in results.items():
+            lsd, ddur = [], []
+            for i in range(len(FIXED_SCRIPTS)):
+                ref = np.load(Path(td) / f"fp32_{i}.npy")
+                test = np.load(Path(td) / f"{v}_{i}.npy")
+                lsd.append(log_spectral_distance(ref, test))
+                ddur.append((test.shape[0] - ref.shape[0]) / max(1, ref.shape[0]))
+            r["lsd_db"] = float(np.mean(lsd))
+            r["dur_delta_pct"] = 100 * float(np.mean(np.abs(ddur)))
+
+    print(f"\n{'variant':<8} {'rtf':>7} {'load s':>7} {'RSS MB':>8} {'ΔRSS MB':>8} {'LSD dB':>7} {'|Δdur| %':>9}")
+    for v, r in results.items():
+        print(f"{v:<8} {r['rtf']:7.3f} {r['load_s']:7.2f} {r['rss_mb']:8.0f} {r['rss_delta_mb']:8.0f} "
+              f"{r['lsd_db']:7.2f} {r['dur_delta_pct']:9.2f}")
+
+if __name__ == "__main__":
+    main()
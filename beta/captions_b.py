@@ -11,6 +11,9 @@ FILENAME_TEMPLATE = "exported_{ts}.mp4"
 
 MODEL_NAME        = "small.en"       # tiny/base/small/medium/large-v3; *.en faster for English
 
+# Word timestamps are cached per audio content + model, so restyles skip Whisper
+TRANSCRIPT_CACHE_DIR = Path.home() / ".cache" / "reddit1_footage" / "transcripts"
+
 # Caption look
 FONT_SIZE         = 210
 UPPERCASE         = True
@@ -55,10 +58,13 @@ INTRO_OFFSET_Y     = 0
 INTRO_ROUND_PX     = 40   
 # ========================================================================
 
-import os, subprocess, shutil, platform, re, sys
+import os, subprocess, shutil, platform, re, sys, json, hashlib
 from datetime import timedelta
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, decode_audio
 from datetime import datetime
+from handoff_b import whisper_input, attach_audio, WHISPER_RATE
+from encoder_profile_b import encoder_args
+from export_watch_b import probe_duration
 
 def timestamp(fmt: str = "%Y%m%d_%H%M%S") -> str:
     return datetime.now().strftime(fmt)
@@ -297,34 +303,62 @@ def resolve_intro_image(src: Path | None) -> Path | None:
         return imgs[0] if imgs else None
     return None
 
-# ---------- MAIN ----------------------------------------------------------
-def beta_captions(INPUT_VIDEO: str | Path,
-                  intro_card_src: Path | None = INTRO_CARD_SRC,
-                  intro_enabled: bool = INTRO_ENABLED,
-                  intro_secs: float = INTRO_SECS,
-                  intro_fade: float = INTRO_FADE,
-                  intro_scale: float = INTRO_SCALE,
-                  intro_crop_bottom: float = INTRO_CROP_BOTTOM,
-                  intro_offset_x: int = INTRO_OFFSET_X,
-                  intro_offset_y: int = INTRO_OFFSET_Y,
-                  intro_round_px: int = INTRO_ROUND_PX) -> str:
-
-    video_path = Path(INPUT_VIDEO).expanduser().resolve()
-    assert video_path.exists(), f"Video not found: {video_path}"
-    print("[info] video:", video_path)
-
-    PLAY_W, PLAY_H = probe_resolution(video_path) if AUTO_PLAYRES else (1920, 1080)
-    if CENTER_X is None or CENTER_Y is None:
-        cx, cy = PLAY_W // 2, PLAY_H // 2
+# ---------- transcription ---------------------------------------------
+def media_hash(source) -> str:
+    """Content hash of a media file, or of the samples behind a handoff_b handle."""
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(source, dict):
+        h.update(f"{source['rate']}:".encode())
+        with attach_audio(source) as view:
+            h.update(view)
     else:
-        cx, cy = CENTER_X, CENTER_Y
-    print(f"[info] PlayRes set to: {PLAY_W}x{PLAY_H} | Center=({cx},{cy})")
+        with open(source, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+    return h.hexdigest()
+
+def transcribe_words(source, cache: bool = True, key: str | None = None,
+                     until: float | None = None) -> list[dict]:
+    """
+    Word timestamps from Whisper: [{"start", "end", "text"}, ...].
+    `source` is a media path, or a handoff_b handle to the voiceover samples (no decode).
+    Results are cached in TRANSCRIPT_CACHE_DIR by content hash (`key`, default
+    media_hash(source)) and MODEL_NAME; pass the voice file's hash as `key` when reading
+    from a handle, so the handle and the file share one cache entry.
+    With `until`, only words starting before `until` seconds are needed (a preview): they are
+    taken from the full transcript when it is cached, else only that much audio is transcribed.
+    """
+    cache_path = None
+    if cache:
+        stem = f"{key or media_hash(source)}_{sanitize_stem(MODEL_NAME)}"
+        cache_path = TRANSCRIPT_CACHE_DIR / f"{stem}.json"
+        try:
+            words = json.loads(cache_path.read_text(encoding="utf-8"))
+            if until is not None:
+                words = [w for w in words if w["start"] < until]
+            print(f"[info] words from transcript cache: {len(words)}")
+            return words
+        except (OSError, ValueError):
+            pass
+        if until is not None:
+            cache_path = TRANSCRIPT_CACHE_DIR / f"{stem}_first{until:.3f}s.json"
+            try:
+                words = json.loads(cache_path.read_text(encoding="utf-8"))
+                print(f"[info] words from transcript cache (first {until:.1f}s): {len(words)}")
+                return words
+            except (OSError, ValueError):
+                pass
 
     print("[info] loading Whisper model …")
     model = load_whisper_auto(MODEL_NAME)
 
     print("[info] transcribing (word timestamps) …")
-    segments, _ = model.transcribe(str(video_path), vad_filter=True, word_timestamps=True)
+    asr_input = whisper_input(source) if isinstance(source, dict) else str(source)
+    if until is not None:
+        if not isinstance(source, dict):
+            asr_input = decode_audio(asr_input, sampling_rate=WHISPER_RATE)
+        asr_input = asr_input[: int(round(until * WHISPER_RATE))]
+    segments, _ = model.transcribe(asr_input, vad_filter=True, word_timestamps=True)
 
     words = []
     for seg in segments:
@@ -335,11 +369,19 @@ def beta_captions(INPUT_VIDEO: str | Path,
                     words.append({"start": float(w.start), "end": float(w.end), "text": tok})
 
     print(f"[info] words captured: {len(words)}")
-
-    # ---------- Build ASS ----------
+    if cache_path is not None:
+        ensure_dir(cache_path.parent)
+        tmp = cache_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(words), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    return words
+
+# ---------- ASS document ----------------------------------------------
+def build_ass_text(words: list[dict], play_w: int, play_h: int) -> str:
+    """Group words into captions and render the full ASS script for a play_w×play_h frame."""
     _, FONT_NAME = pick_custom_font(CUSTOM_FONT_DIR)
     ASS_HEADER = ASS_HEADER_TMPL.format(
-        play_w=PLAY_W, play_h=PLAY_H, font=FONT_NAME, size=FONT_SIZE,
+        play_w=play_w, play_h=play_h, font=FONT_NAME, size=FONT_SIZE,
         border=_fmt_float(BORDER_PX), shadow=_fmt_float(SHADOW_PX)
     )
 
@@ -354,7 +396,7 @@ def beta_captions(INPUT_VIDEO: str | Path,
 
     ass_events = build_center_caption_events(
         caption_lines,
-        play_w=PLAY_W, play_h=PLAY_H,
+        play_w=play_w, play_h=play_h,
         uppercase=UPPERCASE,
         min_caption=MIN_CAPTION_SEC,
         cut_ahead=CUT_AHEAD_SEC,
@@ -366,7 +408,64 @@ def beta_captions(INPUT_VIDEO: str | Path,
         stabilize_outline=STABILIZE_OUTLINE,
         blur_px=BLUR_PX
     )
-    ass_text = ASS_HEADER + "\n".join(ass_events)
+    return ASS_HEADER + "\n".join(ass_events)
+
+def write_ass_temp(ass_text: str) -> Path:
+    """Write the ASS script to a temp file (caller deletes it)."""
+    with tempfile.NamedTemporaryFile("w", suffix=".ass", delete=False, encoding="utf-8") as tmp:
+        tmp.write(ass_text)
+        tmp.flush()
+        return Path(tmp.name)
+
+# ---------- filter-graph pieces ---------------------------------------
+def ass_burn_chain(ass_path: Path) -> str:
+    """Filter chain that burns `ass_path` (in 4:4:4 when YUV444_RENDER)."""
+    fontsdir_arg = f":fontsdir={CUSTOM_FONT_DIR.as_posix()}"
+    return (f"format=yuv444p,ass={ass_path.as_posix()}{fontsdir_arg}"
+            if YUV444_RENDER else
+            f"ass={ass_path.as_posix()}{fontsdir_arg}")
+
+def video_encoder_args() -> list[str]:
+    """Encoder args for the caption burn: VideoToolbox on macOS, else the benchmarked profile."""
+    if platform.system() == "Darwin":
+        return ["-c:v", "h264_videotoolbox", "-preset", "veryfast", "-crf", "18"]
+    return encoder_args("render")
+
+# ---------- MAIN ----------------------------------------------------------
+def beta_captions(INPUT_VIDEO: str | Path,
+                  intro_card_src: Path | None = INTRO_CARD_SRC,
+                  intro_enabled: bool = INTRO_ENABLED,
+                  intro_secs: float = INTRO_SECS,
+                  intro_fade: float = INTRO_FADE,
+                  intro_scale: float = INTRO_SCALE,
+                  intro_crop_bottom: float = INTRO_CROP_BOTTOM,
+                  intro_offset_x: int = INTRO_OFFSET_X,
+                  intro_offset_y: int = INTRO_OFFSET_Y,
+                  intro_round_px: int = INTRO_ROUND_PX,
+                  audio: dict | None = None) -> str:
+    """
+    Burn word captions (and the intro card) into INPUT_VIDEO.
+    `audio` is an optional handoff_b handle to the voiceover samples (voice starts at t=0 in
+    the video); when given, Whisper transcribes straight from that buffer instead of decoding
+    the video's audio track.
+    For a fresh edit, render_b.render_single_pass() does the edit and this burn in one encode.
+    """
+
+    video_path = Path(INPUT_VIDEO).expanduser().resolve()
+    assert video_path.exists(), f"Video not found: {video_path}"
+    print("[info] video:", video_path)
+
+    PLAY_W, PLAY_H = probe_resolution(video_path) if AUTO_PLAYRES else (1920, 1080)
+    if CENTER_X is None or CENTER_Y is None:
+        cx, cy = PLAY_W // 2, PLAY_H // 2
+    else:
+        cx, cy = CENTER_X, CENTER_Y
+    print(f"[info] PlayRes set to: {PLAY_W}x{PLAY_H} | Center=({cx},{cy})")
+
+    words = transcribe_words(audio if audio is not None else video_path)
+
+    # ---------- Build ASS ----------
+    ass_text = build_ass_text(words, PLAY_W, PLAY_H)
 
     # ---------- Output path ----------
     out_dir = ensure_dir(Path(OUTPUT_DIR))
@@ -380,96 +479,49 @@ def beta_captions(INPUT_VIDEO: str | Path,
     if not shutil.which("ffmpeg"):
         raise SystemExit("FFmpeg not found on PATH. Install it and rerun.")
 
-    fontsdir_arg = f":fontsdir={CUSTOM_FONT_DIR.as_posix()}"
-
     tmp_path = None
     try:
         # write ASS to temp file
-        with tempfile.NamedTemporaryFile("w", suffix=".ass", delete=False, encoding="utf-8") as tmp:
-            tmp.write(ass_text)
-            tmp.flush()
-            tmp_path = Path(tmp.name)
+        tmp_path = write_ass_temp(ass_text)
 
-        vcodec = "h264_videotoolbox" if platform.system() == "Darwin" else "libx264"
+        venc = video_encoder_args()
 
         intro_img = resolve_intro_image(intro_card_src) if intro_enabled else None
         print(f"[debug] intro_enabled={intro_enabled} intro_secs={intro_secs} intro_fade={intro_fade}")
         print(f"[debug] resolved intro image: {intro_img}")
 
         if intro_img and intro_secs > 0:
-            # subtitles chain for base video
-            base_chain = (f"format=yuv444p,ass={tmp_path.as_posix()}{fontsdir_arg}"
-                        if YUV444_RENDER else
-                        f"ass={tmp_path.as_posix()}{fontsdir_arg}")
-
-            fade_d     = max(0.0, min(float(intro_fade), float(intro_secs)))
-            crop_keep  = max(0.0, min(1.0, 1.0 - float(intro_crop_bottom)))
-            scale_frac = max(0.05, min(2.0, float(intro_scale)))
-            scaled_w   = int(round(PLAY_W * scale_frac))
-            if scaled_w % 2: scaled_w -= 1
-            if scaled_w < 2: scaled_w = 2
-
-            enable_expr = f"between(t\\,0\\,{intro_secs})"  # escape commas
-
-            round_px = max(0, int(intro_round_px))
-            print(f"[debug] overlay params: crop_keep={crop_keep} scale_frac={scale_frac} "
-                f"scaled_w={scaled_w} fade_d={fade_d} offsets=({intro_offset_x},{intro_offset_y}) "
-                f"round_px={round_px}")
-
-            # Build the card-processing chain; if rounding requested, compute an alpha mask via geq()
-            if round_px > 0:
-                # alpha expression: 255 inside rounded-rect, 0 outside
-                aexpr = (
-                    f"if(lte(hypot("
-                    f"if(lt(X,{round_px}),{round_px}-X,if(lt(W-X,{round_px}),{round_px}-(W-X),0)),"
-                    f"if(lt(Y,{round_px}),{round_px}-Y,if(lt(H-Y,{round_px}),{round_px}-(H-Y),0))"
-                    f"),{round_px}),255,0)"
-                )
-                card_chain = (
-                    f"[cardc]scale={scaled_w}:-1[card_s];"
-                    f"[card_s]format=rgba,"
-                    f"geq=r='r(X,Y)':g='g(X,Y)':b='b(X,Y)':a='{aexpr}'[card_r];"
-                    f"[card_r]fade=t=out:st={intro_secs - fade_d}:d={fade_d}:alpha=1[cardf];"
-                )
-            else:
-                card_chain = (
-                    f"[cardc]scale={scaled_w}:-1[cards];"
-                    f"[cards]fade=t=out:st={intro_secs - fade_d}:d={fade_d}:alpha=1[cardf];"
-                )
-
-            fc = (
-                f"[0:v]{base_chain}[base];"
-                f"[1:v]format=rgba,crop=iw:ih*{crop_keep}:0:0[cardc];"
-                f"{card_chain}"
-                f"[base][cardf]overlay="
-                f"x=(main_w-overlay_w)/2+{int(intro_offset_x)}:"
-                f"y=(main_h-overlay_h)/2+{int(intro_offset_y)}:"
-                f"enable='{enable_expr}'[v];"
-                f"[v]format=yuv420p[vout]"
-            )
+            # the card is a timeline_b overlay (one implementation for every render path);
+            # imported here because timeline_b itself builds on this module
+            from timeline_b import Timeline, Clip, Overlay, CaptionLayer, compile_graph
+            tl = Timeline(duration=probe_duration(video_path) or float(intro_secs), width=PLAY_W, height=PLAY_H, reframe=None,
+                          video=[Clip(video_path)], captions=[CaptionLayer(tmp_path)],
+                          overlays=[Overlay(intro_img, end=intro_secs, scale=intro_scale,
+                                            crop_bottom=intro_crop_bottom, round_px=intro_round_px,
+                                            fade_out=intro_fade, offset_x=intro_offset_x,
+                                            offset_y=intro_offset_y)])
+            inputs, fc, maps = compile_graph(tl)
             print("[debug] filter_complex >>>\n" + fc + "\n<<< end filter_complex")
 
-
             cmd = [
                 "ffmpeg","-y","-hide_banner","-loglevel","info",
-                "-i", str(video_path),
-                "-loop","1","-t", f"{intro_secs + 0.5}","-i", str(intro_img),
+                *inputs,
                 "-filter_complex", fc,
-                "-map","[vout]","-map","0:a?",
-                "-c:v", vcodec, "-preset","veryfast","-crf","18",
+                *maps,"-map","0:a?",
+                *venc,
                 "-c:a","copy",
                 "-movflags","+faststart",
                 str(out_tmp)
             ]
         else:
-            vf_arg = (f"format=yuv444p,ass={tmp_path.as_posix()}{fontsdir_arg},format=yuv420p"
+            vf_arg = (f"{ass_burn_chain(tmp_path)},format=yuv420p"
                       if YUV444_RENDER else
-                      f"ass={tmp_path.as_posix()}{fontsdir_arg}")
+                      ass_burn_chain(tmp_path))
             cmd = [
                 "ffmpeg","-y","-hide_banner","-loglevel","info",
                 "-i", str(video_path),
                 "-vf", vf_arg,
-                "-c:v", vcodec, "-preset","veryfast","-crf","18",
+                *venc,
                 "-c:a","copy",
                 "-movflags","+faststart",
                 str(out_tmp)
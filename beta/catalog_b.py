@@ -0,0 +1,202 @@
+# beta/catalog_b.py
+"""
+Background-footage catalog: scans the background folders, probes every video once with
+ffprobe and keeps duration, fps, resolution, codec and keyframe count in SQLite.
+
+A file is re-probed only when its size or mtime changes, and rows for deleted files are
+dropped, so dropping a new clip into BACKGROUND_DIR is all it takes to use it. Background
+choice and crop maths use these exact numbers instead of hand-kept durations.
+
+The same database keeps the usage ledger: every rendered window is recorded per background,
+crop picks avoid those spans (read once per background into a merged, bisectable index that
+record_usage() keeps current), and choose_background() prefers clips with the most unused
+time, skipping ones that are exhausted.
+"""
+import os, json, time, random, sqlite3, subprocess, threading
+from pathlib import Path
+
+from footage_b import BACKGROUND_DIR, clip_store
+from keyframes_b import keyframe_index
+from intervals_b import merge_intervals, free_intervals, insert_interval
+
+CATALOG_PATH = Path(os.getenv("FOOTAGE_CATALOG", "~/.cache/reddit1_footage/catalog.sqlite")).expanduser()
+SCAN_DIRS    = [Path(p).expanduser() for p in os.getenv("FOOTAGE_DIRS", str(BACKGROUND_DIR)).split(os.pathsep) if p]
+VIDEO_EXTS   = {".mp4", ".mov", ".mkv", ".m4v", ".webm"}
+EXHAUSTED_UNUSED_S = float(os.getenv("FOOTAGE_MIN_UNUSED_S", "300"))   # less unused time than this = exhausted
+
+_COLUMNS = ("path", "name", "size", "mtime", "duration", "fps", "width", "height", "codec", "keyframes")
+
+_lock = threading.Lock()
+_conn = None
+_usage: dict[str, list[tuple[float, float]]] = {}     # name -> merged used spans
+
+def _db() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        CATALOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(CATALOG_PATH, check_same_thread=False, isolation_level=None)
+        _conn.row_factory = sqlite3.Row
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("CREATE TABLE IF NOT EXISTS footage (path TEXT PRIMARY KEY, name TEXT, size INTEGER, "
+                      "mtime INTEGER, duration REAL, fps REAL, width INTEGER, height INTEGER, codec TEXT, "
+                      "keyframes INTEGER)")
+        _conn.execute("CREATE INDEX IF NOT EXISTS footage_name ON footage (name)")
+        _conn.execute("CREATE TABLE IF NOT EXISTS footage_usage (name TEXT, start REAL, end REAL, used_at INTEGER)")
+        _conn.execute("CREATE INDEX IF NOT EXISTS footage_usage_name ON footage_usage (name)")
+    return _conn
+
+def _rate(s: str) -> float:
+    num, _, den = (s or "0/1").partition("/")
+    try:
+        return float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+def probe_footage(path: str | Path) -> dict:
+    """ffprobe one file: duration, fps, width, height, codec and keyframe count."""
+    path = Path(path)
+    cmd = ["ffprobe", "-v", "error", "-select_streams", "v:0",
+           "-show_entries", "stream=codec_name,width,height,avg_frame_rate,r_frame_rate:format=duration",
+           "-of", "json", str(path)]
+    info = json.loads(subprocess.run(cmd, check=True, text=True, capture_output=True).stdout)
+    st = (info.get("streams") or [{}])[0]
+    st_fs = path.stat()
+    return {
+        "path": str(path.resolve()), "name": path.name, "size": st_fs.st_size, "mtime": int(st_fs.st_mtime),
+        "duration": float(info.get("format", {}).get("duration") or 0.0),
+        "fps": _rate(st.get("avg_frame_rate")) or _rate(st.get("r_frame_rate")),
+        "width": int(st.get("width") or 0), "height": int(st.get("height") or 0),
+        "codec": st.get("codec_name") or "",
+        "keyframes": len(keyframe_index(path)),
+    }
+
+def scan(dirs: list[Path] | None = None) -> dict:
+    """Bring the catalog in line with the folders. Returns counts of probed/kept/removed files."""
+    dirs = SCAN_DIRS if dirs is None else [Path(d) for d in dirs]
+    seen, probed, kept = set(), 0, 0
+    db = _db()
+    for d in dirs:
+        if not d.is_dir():
+            print(f"[catalog] skip missing folder {d}", flush=True)
+            continue
+        for f in sorted(d.iterdir()):
+            if not f.is_file() or f.suffix.lower() not in VIDEO_EXTS:
+                continue
+            key = str(f.resolve())
+            seen.add(key)
+            st = f.stat()
+            row = db.execute("SELECT size, mtime FROM footage WHERE path=?", (key,)).fetchone()
+            if row is not None and row["size"] == st.st_size and row["mtime"] == int(st.st_mtime):
+                kept += 1
+                continue
+            try:
+                rec = probe_footage(f)
+            except (subprocess.CalledProcessError, ValueError) as e:
+                print(f"[catalog] probe failed for {f.name}: {e}", flush=True)
+                continue
+            with _lock:
+                db.execute(f"INSERT OR REPLACE INTO footage ({', '.join(_COLUMNS)}) "
+                           f"VALUES ({', '.join('?' * len(_COLUMNS))})", tuple(rec[c] for c in _COLUMNS))
+            probed += 1
+    scanned = [str(d.resolve()) for d in dirs if d.is_dir()]
+    gone = [r["path"] for r in db.execute("SELECT path FROM footage")
+            if r["path"] not in seen and any(r["path"].startswith(s + os.sep) for s in scanned)]
+    with _lock:
+        db.executemany("DELETE FROM footage WHERE path=?", [(p,) for p in gone])
+    print(f"[catalog] probed={probed} unchanged={kept} removed={len(gone)}", flush=True)
+    return {"probed": probed, "unchanged": kept, "removed": len(gone)}
+
+def all_footage() -> list[dict]:
+    return [dict(r) for r in _db().execute("SELECT * FROM footage ORDER BY name")]
+
+def _clip_name(background) -> str:
+    """File name for a background given as a legacy clip_store id (int), a file name, or a path."""
+    return clip_store[background][0] if isinstance(background, int) else Path(str(background)).name
+
+def get_footage(background) -> dict:
+    """
+    Catalog row for `background`: a legacy clip_store id (int), a file name, or a path.
+    Scans once if the file isn't catalogued yet.
+    """
+    name = _clip_name(background)
+    for attempt in range(2):
+        row = _db().execute("SELECT * FROM footage WHERE name=?", (name,)).fetchone()
+        if row is not None:
+            return dict(row)
+        if attempt == 0:
+            scan()
+    raise KeyError(f"background {background!r} not found in {', '.join(map(str, SCAN_DIRS))}")
+
+def _usage_index(name: str) -> list[tuple[float, float]]:
+    idx = _usage.get(name)
+    if idx is None:
+        rows = _db().execute("SELECT start, end FROM footage_usage WHERE name=?", (name,)).fetchall()
+        with _lock:
+            idx = _usage.setdefault(name, merge_intervals((r["start"], r["end"]) for r in rows))
+    return idx
+
+def record_usage(background, start: float, end: float) -> None:
+    """Add [start, end) of `background` (id / name / path) to the usage ledger."""
+    name = _clip_name(background)
+    with _lock:
+        _db().execute("INSERT INTO footage_usage (name, start, end, used_at) VALUES (?, ?, ?, ?)",
+                      (name, float(start), float(end), int(time.time())))
+        if name in _usage:
+            insert_interval(_usage[name], start, end)
+
+def used_intervals(background) -> list[tuple[float, float]]:
+    """Merged spans of `background` already used by earlier renders (the live index; don't mutate)."""
+    return _usage_index(_clip_name(background))
+
+def clear_usage(background=None) -> None:
+    """Forget the ledger for one background (or all of them)."""
+    with _lock:
+        if background is None:
+            _db().execute("DELETE FROM footage_usage")
+            _usage.clear()
+        else:
+            name = _clip_name(background)
+            _db().execute("DELETE FROM footage_usage WHERE name=?", (name,))
+            _usage.pop(name, None)
+
+def footage_usage(clip: dict, window: float, buffer_s: float = 0.0) -> dict:
+    """
+    Ledger summary for a catalog row: unused seconds inside the buffers, seconds of valid
+    starts left for a `window`-second crop, and whether the clip counts as exhausted.
+    """
+    lo, hi = buffer_s, clip["duration"] - buffer_s
+    free = free_intervals(used_intervals(clip["name"]), lo, hi) if hi > lo else []
+    unused = sum(b - a for a, b in free)
+    fits = any(b - a >= window for a, b in free)
+    return {"unused_s": unused, "free_starts_s": sum(max(0.0, b - a - window) for a, b in free),
+            "exhausted": not fits or unused < min(EXHAUSTED_UNUSED_S, hi - lo)}
+
+def choose_background(min_duration: float, rng: random.Random | None = None,
+                      exclude: set[str] | None = None, window: float | None = None) -> dict:
+    """
+    Random catalogued clip long enough for a `min_duration`-second window. With `window` (the
+    crop length; min_duration - window is the buffer margin) the ledger steers the choice:
+    exhausted clips are skipped and the rest are weighted by how much unused time they have.
+    """
+    rows = [r for r in all_footage() if r["duration"] >= min_duration and r["name"] not in (exclude or set())]
+    if not rows:
+        scan()
+        rows = [r for r in all_footage() if r["duration"] >= min_duration and r["name"] not in (exclude or set())]
+    if not rows:
+        raise ValueError(f"no background footage is at least {min_duration:.0f}s long")
+    rng = rng or random.SystemRandom()
+    if window is not None:
+        buffer_s = max(0.0, (min_duration - window) / 2)
+        usage = [footage_usage(r, window, buffer_s) for r in rows]
+        fresh = [(r, u) for r, u in zip(rows, usage) if not u["exhausted"]]
+        if fresh:
+            return rng.choices([r for r, _u in fresh], weights=[u["free_starts_s"] + 1.0 for _r, u in fresh])[0]
+        print(f"[catalog] every background is exhausted for a {window:.0f}s window; reusing footage", flush=True)
+    return rng.choice(rows)
+
+if __name__ == "__main__":
+    scan()
+    for r in all_footage():
+        used = sum(b - a for a, b in used_intervals(r["name"]))
+        print(f"{r['name']:<36} {r['duration']:9.2f}s {r['width']}x{r['height']} {r['fps']:6.2f}fps "
+              f"{r['codec']:<6} kf={r['keyframes']} used={used:.0f}s")
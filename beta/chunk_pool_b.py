@@ -0,0 +1,167 @@
+# beta/chunk_pool_b.py
+"""
+Pre-segmented background pool: every catalogued clip is cut once into fixed-length,
+normalized chunks (same codec, fps and closed GOP, each starting on a keyframe; the clip's own
+aspect ratio, with the long side capped at POOL_LONG and never upscaled, so vertical or
+non-16:9 footage keeps all of its pixels for the crop).
+A video's background is then a run of consecutive chunks read through the concat demuxer
+(render_b feeds the chunk list straight in as the render's input) — no seek into a 2-hour
+source and no separate assembly step.
+
+Layout: POOL_DIR/<clip stem>/chunk_00000.mp4 … plus manifest.json recording the source's
+size/mtime (the pool is rebuilt when the source changes) and the chunk list.
+
+Usage:
+  python chunk_pool_b.py            # prepare/refresh the pool for every catalogued clip
+"""
+import os, json, math, random, shutil, subprocess, tempfile
+from itertools import accumulate
+from pathlib import Path
+
+from catalog_b import all_footage, get_footage, scan
+from intervals_b import window_is_free
+
+POOL_DIR    = Path(os.getenv("BACKGROUND_POOL_DIR", "~/.cache/reddit1_footage/pool")).expanduser()
+CHUNK_SEC   = 10           # chunk length; also the GOP, so each chunk is exactly one closed GOP run
+POOL_LONG   = 1920         # long-side cap for pooled chunks (aspect kept)
+POOL_FPS    = 30
+POOL_VCODEC = "libx264"
+POOL_PRESET = "veryfast"
+POOL_CRF    = 18
+EDGE_SKIP_S = 60           # leave the source's intro/outro out of random runs (cf. CROP_BUFFER_S)
+
+def _pool_dir(clip: dict) -> Path:
+    return POOL_DIR / Path(clip["name"]).stem
+
+def _manifest(clip: dict) -> dict | None:
+    try:
+        m = json.loads((_pool_dir(clip) / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if m.get("size") != clip["size"] or m.get("mtime") != clip["mtime"] or m.get("long_side") != POOL_LONG:
+        return None          # source changed, or an older (letterboxed) pool
+    return m
+
+def _pool_dims(clip: dict) -> tuple[int, int]:
+    """Chunk frame size for `clip`: its own aspect, long side at most POOL_LONG, even dimensions."""
+    w, h = int(clip.get("width") or 0), int(clip.get("height") or 0)
+    if w <= 0 or h <= 0:
+        w, h = 1920, 1080
+    f = min(1.0, POOL_LONG / float(max(w, h)))
+    return max(2, int(round(w * f / 2)) * 2), max(2, int(round(h * f / 2)) * 2)
+
+def pool_size(background) -> tuple[int, int]:
+    """(width, height) of the pooled chunks of `background`."""
+    clip = get_footage(background)
+    m = _manifest(clip)
+    return (m["width"], m["height"]) if m is not None else _pool_dims(clip)
+
+def _chunk_durations(files: list[Path]) -> list[float]:
+    out = []
+    for f in files:
+        cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(f)]
+        out.append(float(subprocess.run(cmd, check=True, text=True, capture_output=True).stdout.strip() or 0.0))
+    return out
+
+def build_pool(clip: dict, force: bool = False) -> dict:
+    """Segment one catalogued clip into the pool (skipped when its manifest is current)."""
+    if not force and (m := _manifest(clip)) is not None:
+        return m
+    if not shutil.which("ffmpeg"):
+        raise SystemExit("FFmpeg not found on PATH. Install it and rerun.")
+    out_dir = _pool_dir(clip)
+    tmp_dir = out_dir.with_name(out_dir.name + ".building")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    gop = CHUNK_SEC * POOL_FPS
+    w, h = _pool_dims(clip)
+    vf = f"scale={w}:{h},fps={POOL_FPS},setsar=1,format=yuv420p"
+    cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error", "-i", clip["path"], "-map", "0:v:0", "-an",
+           "-vf", vf, "-c:v", POOL_VCODEC, "-preset", POOL_PRESET, "-crf", str(POOL_CRF),
+           "-g", str(gop), "-keyint_min", str(gop), "-sc_threshold", "0",
+           "-force_key_frames", f"expr:gte(t,n_forced*{CHUNK_SEC})", "-x264-params", "open-gop=0",
+           "-f", "segment", "-segment_time", str(CHUNK_SEC), "-reset_timestamps", "1",
+           "-segment_format", "mp4", str(tmp_dir / "chunk_%05d.mp4")]
+    print(f"[pool] segmenting {clip['name']} into {CHUNK_SEC}s chunks …", flush=True)
+    run = subprocess.run(cmd, check=False, text=True, capture_output=True)
+    if run.returncode != 0:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise RuntimeError(f"ffmpeg failed (code {run.returncode})\n" + "\n".join((run.stderr or "").splitlines()[-20:]))
+    files = sorted(tmp_dir.glob("chunk_*.mp4"))
+    manifest = {"source": clip["path"], "size": clip["size"], "mtime": clip["mtime"], "chunk_sec": CHUNK_SEC,
+                "long_side": POOL_LONG, "width": w, "height": h, "fps": POOL_FPS,
+                "chunks": [{"file": f.name, "duration": d} for f, d in zip(files, _chunk_durations(files))]}
+    (tmp_dir / "manifest.json").write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+    shutil.rmtree(out_dir, ignore_errors=True)
+    tmp_dir.replace(out_dir)
+    print(f"[pool] {clip['name']}: {len(files)} chunks", flush=True)
+    return manifest
+
+def prepare_pool(force: bool = False) -> None:
+    """Rescan the catalog and (re)build the pool of every clip whose source changed."""
+    scan()
+    for clip in all_footage():
+        try:
+            build_pool(clip, force=force)
+        except (RuntimeError, subprocess.CalledProcessError) as e:
+            print(f"[pool] {clip['name']} failed: {e}", flush=True)
+
+def pick_chunk_run(background, duration: float, rng: random.Random | None = None,
+                   with_durations: bool = False, used: list[tuple[float, float]] | None = None) -> list | None:
+    """
+    Random run of consecutive pool chunks covering `duration` seconds of `background`
+    (clip_store id / name / path): chunk paths, or (path, seconds) pairs with `with_durations`.
+    With `used` (catalog_b.used_intervals: merged source-second spans) the run starts on a
+    chunk whose first `duration` seconds miss them, if any such chunk is left. None if the clip isn't pooled or its pool is too short.
+    """
+    clip = get_footage(background)
+    m = _manifest(clip)
+    if m is None:
+        return None
+    chunks = m["chunks"]
+    need = math.ceil(duration / m["chunk_sec"]) + 1        # +1 covers a short trailing chunk
+    skip = math.ceil(EDGE_SKIP_S / m["chunk_sec"])
+    lo, hi = skip, len(chunks) - skip - need
+    if hi < lo:
+        lo, hi = 0, len(chunks) - need
+    if hi < lo:
+        return None
+    rng = rng or random.SystemRandom()
+    starts = [0.0, *accumulate(float(c["duration"]) for c in chunks)]
+    i = None
+    if used:
+        free = [j for j in range(lo, hi + 1) if window_is_free(used, starts[j], duration)]
+        if free:
+            i = rng.choice(free)
+        else:
+            print(f"[pool] {clip['name']}: no unused run of {duration:.0f}s left; reusing footage", flush=True)
+    if i is None:
+        i = rng.randint(lo, hi)
+    run = chunks[i:i + need]
+    print(f"[pool] {clip['name']}: chunks {i}..{i + need - 1} (start {sum(c['duration'] for c in chunks[:i]):.1f}s)",
+          flush=True)
+    if with_durations:
+        return [(_pool_dir(clip) / c["file"], float(c["duration"])) for c in run]
+    return [_pool_dir(clip) / c["file"] for c in run]
+
+def chunk_run_start(background, first_chunk: Path) -> float:
+    """Source time (seconds) at which pool chunk `first_chunk` of `background` begins."""
+    m = _manifest(get_footage(background)) or {"chunks": []}
+    acc = 0.0
+    for c in m["chunks"]:
+        if c["file"] == Path(first_chunk).name:
+            return acc
+        acc += float(c["duration"])
+    raise KeyError(f"{first_chunk} is not in the pool of {background!r}")
+
+def write_concat_list(files: list[Path], list_path: Path | None = None) -> Path:
+    """Concat-demuxer list for `files` (a temp file unless `list_path` is given; caller deletes it)."""
+    if list_path is None:
+        fd, name = tempfile.mkstemp(suffix=".txt", prefix="pool_")
+        os.close(fd)
+        list_path = Path(name)
+    list_path.write_text("".join(f"file '{f.as_posix()}'\n" for f in files), encoding="utf-8")
+    return list_path
+
+if __name__ == "__main__":
+    prepare_pool()
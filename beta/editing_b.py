@@ -6,34 +6,16 @@ from pathlib import Path
 import pyautogui
 import platform
 import math
-import re
-from datetime import datetime
-import math, random
-from typing import Optional, Tuple
+import random
+
+from footage_b import CLIPSTORE_DIR, pick_random_crop_start, build_timestamp_title, FootageExhausted
+from catalog_b import get_footage, used_intervals, record_usage
+from export_watch_b import wait_for_export
+from screen_probe_b import detect_state, area_has_color_match_snipe
 
 media_options = [(459, 238), (255,358), (453, 357), (253, 478), (453, 475)]
 clip_durations= [7226, 4577, 4813, 3600, 1313]
 
-clip_store = {
-    1 : ("minecraft_single_jumps1.mp4", 7200),  #minecraft_single_jumps1.mp4
-    2 : ("minecraftsingle_player1.mp4", 1800),  #minecraftsingle_player1.mp4
-    3 : ("minecraft_default_parkour1.mp4", 1852), #minecraft_default_parkour1.mp4.  SDSDASDASDASDSADSADASDASDASD
-    4 : ("japan_subway_surfers1.mp4", 440), #japan_subway_surfers1.mp4
-    5 : ("gta_ramp1.mp4", 7200),  #gta_ramp1.mp4
-    6 : ("minecraft_parkour_mega1.mp4", 7226) , #minecraft_parkour_mega1.mp4
-    7 : ("minecraft_parkour_mega2.mp4", 8961),  #minecraft_parkour_mega2.mp4
-
-    8 : ("gta_ramp2.mp4", 454),
-    9 : ("gta_ramp3.mp4", 495), 
-    10 : ("satisfying1.mp4", 600),  
-    11 : ("satisfying2.mp4", 613),  
-    12 : ("satisfying3.mp4", 180),
-    13 : ("mobile_games1.mp4", 1426),
-    14 : ("snowboarding1.mp4", 626),
-    15 : ("ski1.mp4", 868),
-    16 : ("mega_showreel.mp4", 3783)
-}
-
 APP_PATH = "/Applications/Wondershare Filmora Mac.app"
 APP_NAME = "Wondershare Filmora Mac"
 
@@ -100,40 +82,6 @@ def activate_and_fullscreen():
     '''
     subprocess.run(["osascript", "-e", applescript], check=False)
 
-def detect_state():
-    import pyautogui, time
-    size = 4
-    tol = int(round(255 * 0.2))  # 5% per-channel wiggle
-    # --- step 1 ---
-    x, y = 265, 180
-    pyautogui.moveTo(x, y); time.sleep(0.05)
-    img = pyautogui.screenshot(region=(x - size // 2, y - size // 2, size, size))
-    tr, tg, tb = 0, 240, 214
-    w, h = img.size
-    ok = True
-    for px in range(w):
-        for py in range(h):
-            r, g, b = img.getpixel((px, py))[:3]
-            if abs(r - tr) > tol or abs(g - tg) > tol or abs(b - tb) > tol:
-                ok = False
-                break
-        if not ok:
-            break
-    if ok:
-        return 0
-    # --- step 2 ---
-    x, y = 908, 379
-    pyautogui.moveTo(x, y); time.sleep(0.05)
-    img = pyautogui.screenshot(region=(x - size // 2, y - size // 2, size, size))
-    tr, tg, tb = 4, 172, min(255, 256)
-    w, h = img.size
-    for px in range(w):
-        for py in range(h):
-            r, g, b = img.getpixel((px, py))[:3]
-            if abs(r - tr) <= tol and abs(g - tg) <= tol and abs(b - tb) <= tol:
-                return 1
-    return 2
-
 def centre_proj():
     # pyautogui.moveTo(55, 52)
     # time.sleep(0.5)
@@ -176,35 +124,6 @@ def adjust_clip_duration(audio_duration):
     return
 
 #================================================================Typing and saving functions=================================================================
-def _slug(s: str) -> str:
-    s = re.sub(r"\s+", "_", str(s).strip())
-    return re.sub(r"[^A-Za-z0-9_.-]", "", s)
-
-def build_timestamp_title(base: str,
-                          duration_sec: float | int | None = None,
-                          channel: str | None = None,
-                          extra: str | None = None,
-                          max_len: int = 64) -> str:
-    """
-    Make a unique, filesystem-safe title like:
-      2025-09-03_23-41-12_My_Video_29s_main
-    - base: human name for the video
-    - duration_sec/channel/extra: optional bits to encode
-    - max_len: clamp length to keep UI happy
-    """
-    ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    parts = [ts, _slug(base)]
-    if duration_sec is not None:
-        parts.append(f"{int(round(float(duration_sec)))}s")
-    if channel:
-        parts.append(_slug(channel))
-    if extra:
-        parts.append(_slug(extra))
-    name = "_".join(p for p in parts if p)
-    if len(name) > max_len:
-        name = name[:max_len].rstrip("_")
-    return name
-
 def type_export_title(title: str, key_interval: float = 0.02) -> None:
     """Types the given title into the currently focused text box."""
     pyautogui.typewrite(title, interval=key_interval)
@@ -232,105 +151,6 @@ def navigate_open_dialog_to_folder(dir_path: str):
     '''
     subprocess.run(["osascript", "-e", ascript], check=False)
 
-import pyautogui
-
-def area_has_color_match_snipe(x: int, y: int,
-                         target_rgba=(86, 231, 199, 255),
-                         tol: float = 0.15,
-                         size: int = 2) -> bool:
-
-    half = size // 2
-    left, top = int(x - half), int(y - half)
-
-    # Take screenshot of the region
-    img = pyautogui.screenshot(region=(left, top, size, size))
-
-    # Per-channel tolerance (absolute values, e.g. 15% of 255 ≈ 38)
-    thr = int(round(255 * tol))
-    tr, tg, tb, ta = (target_rgba + (255,))[:4]  # ensure 4 values
-
-    w, h = img.size
-    for ix in range(w):
-        for iy in range(h):
-            px = img.getpixel((ix, iy))
-            r, g, b, *rest = (px + (255,))[:4]
-            a = rest[0] if rest else 255
-
-            if (abs(r - tr) <= thr and
-                abs(g - tg) <= thr and
-                abs(b - tb) <= thr and
-                abs(a - ta) <= thr):
-                return True
-    return False
-
-#=========================================================================#=========================================================================
-def area_has_color_match(x: int, y: int,
-                         target_rgba=(86, 231, 199, 255),
-                         tol: float = 0.05,
-                         size: int = 30):
-    """
-    Returns True if ANY pixel in a size×size area centered at (x, y)
-    is within per-channel tolerance of target_rgba. Silent (no prints, no saves).
-    """
-    half = size // 2
-    left, top = int(x - half), int(y - half)
-
-    # Grab the region (no saving)
-    img = pyautogui.screenshot(region=(left, top, size, size)).convert("RGBA")
-
-    # Color match check
-    thr = int(round(255 * tol))
-    tr, tg, tb, ta = (tuple(target_rgba) + (255,))[:4]
-
-    w, h = img.size
-    for iy in range(h):
-        for ix in range(w):
-            r, g, b, a = img.getpixel((ix, iy))
-            if (abs(r - tr) <= thr and
-                abs(g - tg) <= thr and
-                abs(b - tb) <= thr and
-                abs(a - ta) <= thr):
-                return True
-    return False
-
-def pick_random_crop_start(
-    duration: float,
-    clip_total: float,
-    buffer_s: float = 10 * 60.0,
-    integer_seconds: bool = False,
-    rng: Optional[random.Random] = None,
-) -> Tuple[float, str]:
-    if duration <= 0 or clip_total <= 0:
-        raise ValueError("duration and clip_total must be > 0.")
-    if duration + 2 * buffer_s > clip_total:
-        raise ValueError("clip_total too short for duration + buffers.")
-
-    # honor the buffer you pass (don't hardcode 5)
-    start_min = buffer_s
-    start_max = clip_total - buffer_s - duration
-    if start_max < start_min:
-        raise ValueError("No start position fits the constraints.")
-
-    r = rng or random  # use provided RNG or module RNG (no reseeding)
-
-    if integer_seconds:
-        imin = math.ceil(start_min)
-        imax = math.floor(start_max)
-        if imax < imin:
-            raise ValueError("No integer start fits the constraints.")
-        start = float(r.randrange(imin, imax + 1))
-    else:
-        start = r.uniform(start_min, start_max)
-
-    return start, _to_timecode(start)
-
-def _to_timecode(seconds: float) -> str:
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = seconds % 60
-    return f"{h:02d}:{m:02d}:{s:06.3f}"
-
-
 #============================================Random scrolling to stagger start=====================================================================
 import time, platform, pyautogui
 
@@ -640,7 +460,7 @@ def beta_make_edits(background_reddit1, audio_duration, target_dir_audio, target
     pyautogui.leftClick()
 
     time.sleep(1.0)
-    select_file_in_open_dialog(f"/Users/marcus/Downloads/background_short_form_reddit1/{clip_store[background_reddit1][0]}",open_after_select=True)
+    select_file_in_open_dialog(get_footage(background_reddit1)["path"],open_after_select=True)
     time.sleep(1.0)
 
     pyautogui.moveTo(1096, 681)  
@@ -672,9 +492,15 @@ def beta_make_edits(background_reddit1, audio_duration, target_dir_audio, target
 
     "Random cropping to starttime + offset"
     rng = random.SystemRandom()
-    start_s, tc = pick_random_crop_start(duration=audio_duration, clip_total=clip_store[background_reddit1][1], buffer_s = 60, integer_seconds=True,rng = rng)
+    clip = get_footage(background_reddit1)
+    try:
+        start_s, tc = pick_random_crop_start(duration=audio_duration, clip_total=clip["duration"], buffer_s = 60, integer_seconds=True,rng = rng, used=used_intervals(clip["name"]))
+    except FootageExhausted:
+        print(f"{clip['name']}: no unused window left, reusing footage")
+        start_s, tc = pick_random_crop_start(duration=audio_duration, clip_total=clip["duration"], buffer_s = 60, integer_seconds=True,rng = rng)
     print(f"Picked start time: {start_s:.3f} s = {tc}")
     start_s = math.floor(start_s // 5) - 1
+    cut_start = max(0, start_s) * 5.0     # the timeline scrolls in 5 s steps, so the cut lands here
 
     #Pixels 114 -> 5 seconds move around
     time.sleep(2.0)
@@ -814,7 +640,7 @@ def beta_make_edits(background_reddit1, audio_duration, target_dir_audio, target
     pyautogui.click(1077,305)
     time.sleep(0.1)
 
-    navigate_open_dialog_to_folder("/Users/marcus/Downloads/reddit1_filmora_clipstore")
+    navigate_open_dialog_to_folder(str(CLIPSTORE_DIR))
 
     pyautogui.move(1153, 583)
     time.sleep(2.0)
@@ -849,24 +675,10 @@ def beta_make_edits(background_reddit1, audio_duration, target_dir_audio, target
     time.sleep(0.5)
     pyautogui.leftClick(1094, 765)
 
-    #Checking until export is finished exporting LOL
-    
-    if audio_duration > 900:
-        pause_wait = 90
-    elif audio_duration > 400:
-        pause_wait = 30
-    else:
-        pause_wait = 20
-
-    time.sleep(pause_wait)
-    while True:
-        has_match = area_has_color_match(392, 485)   # saves into ./captures/
-
-        print(f"[watch] match={has_match}")
-        if has_match:
-            time.sleep(3.0)
-            continue
-        break
+    #Wait on the exported file itself (size settles, ffprobe reads full duration)
+    wait_for_export(CLIPSTORE_DIR / f"{export_title}.mp4", expected_duration=audio_duration)
+    # log the window actually cut (from the 5 s step the timeline was scrolled to)
+    record_usage(clip["name"], cut_start, cut_start + audio_duration)
 
     pyautogui.moveTo(361, 219)
     time.sleep(1.0)
@@ -0,0 +1,42 @@
+# beta/encoder_profile_b.py
+"""
+Per-machine video encoder choice for the render stages, written by bench_encoders_b.py.
+
+The profile is JSON at ENCODER_PROFILE_PATH:
+    {"machine": ..., "stages": {"render": {"vcodec", "preset", "crf"}, "concat": {...}}, "results": [...]}
+Stages without a measured entry fall back to ENCODER_DEFAULTS (the settings that were
+hard-coded before), so nothing changes until the benchmark has run on this box.
+"""
+import os, json, platform
+from pathlib import Path
+
+ENCODER_PROFILE_PATH = Path(os.getenv("ENCODER_PROFILE", "~/.cache/reddit1_footage/encoder_profile.json")).expanduser()
+
+ENCODER_DEFAULTS = {
+    "render": {"vcodec": "libx264", "preset": "veryfast", "crf": 18},   # captions / single-pass render
+    "concat": {"vcodec": "libx264", "preset": "slow", "crf": 18},       # videos_concat.py segments
+}
+
+def load_profile() -> dict:
+    try:
+        return json.loads(ENCODER_PROFILE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def save_profile(profile: dict) -> Path:
+    ENCODER_PROFILE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = ENCODER_PROFILE_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"machine": platform.node(), **profile}, indent=1), encoding="utf-8")
+    os.replace(tmp, ENCODER_PROFILE_PATH)
+    return ENCODER_PROFILE_PATH
+
+def encoder_for(stage: str) -> dict:
+    """{"vcodec", "preset", "crf"} for `stage` from the profile, else the stage default."""
+    enc = dict(ENCODER_DEFAULTS.get(stage, ENCODER_DEFAULTS["render"]))
+    enc.update(load_profile().get("stages", {}).get(stage, {}))
+    return enc
+
+def encoder_args(stage: str = "render", enc: dict | None = None) -> list[str]:
+    """ffmpeg video-encoder arguments for `stage` (or an explicit `enc` dict)."""
+    enc = enc or encoder_for(stage)
+    return ["-c:v", enc["vcodec"], "-preset", str(enc["preset"]), "-crf", str(enc["crf"])]
@@ -0,0 +1,64 @@
+# beta/export_watch_b.py
+"""
+Export-completion detection from the output file itself, replacing fixed sleeps and pixel
+polling after an editor export.
+
+An export counts as finished once the file exists, its size has stopped changing for a few
+polls, and ffprobe can read a complete container (moov atom present) whose duration matches
+what was expected (within DURATION_TOL_S or DURATION_TOL_FRAC of it, whichever is larger).
+The watcher returns as soon as all of that holds. A readable file whose size then stays
+unchanged for SETTLED_POLLS is accepted with a warning even if its duration is off, so an
+editor that rounds differently can't stall the pipeline until the timeout.
+"""
+import os, time, subprocess
+from pathlib import Path
+
+POLL_SEC       = 0.5
+STABLE_POLLS   = 3        # consecutive polls with an unchanged, non-zero size
+DURATION_TOL_S = 1.0      # editor exports round the timeline to whole seconds/frames
+DURATION_TOL_FRAC = 0.02  # ... and long timelines drift by a few frames per minute
+SETTLED_POLLS  = 20       # a readable file unchanged this long is done, whatever its duration
+
+def probe_duration(path: str | Path) -> float | None:
+    """Container duration in seconds, or None while the file is incomplete/unreadable."""
+    cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(path)]
+    run = subprocess.run(cmd, check=False, text=True, capture_output=True)
+    if run.returncode != 0:
+        return None
+    try:
+        return float(run.stdout.strip())
+    except ValueError:
+        return None
+
+def wait_for_export(path: str | Path, expected_duration: float | None = None, timeout: float | None = 1800.0,
+                    poll: float = POLL_SEC, stable_polls: int = STABLE_POLLS,
+                    tol: float = DURATION_TOL_S) -> Path:
+    """
+    Block until `path` is a finished export and return it.
+    Raises TimeoutError if that hasn't happened within `timeout` seconds (None = wait forever).
+    """
+    path = Path(path)
+    tol_s = max(tol, DURATION_TOL_FRAC * expected_duration) if expected_duration is not None else tol
+    t0 = time.monotonic()
+    last_size, stable = -1, 0
+    while True:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            st = None
+        if st is not None and st.st_size > 0:
+            stable = stable + 1 if st.st_size == last_size else 0
+            last_size = st.st_size
+            if stable >= stable_polls:
+                dur = probe_duration(path)
+                if dur is not None and (expected_duration is None or abs(dur - expected_duration) <= tol_s):
+                    print(f"[export] {path.name} complete | {st.st_size / 1e6:.1f} MB, {dur:.2f}s "
+                          f"after {time.monotonic() - t0:.1f}s", flush=True)
+                    return path
+                if dur is not None and stable >= max(stable_polls, SETTLED_POLLS):
+                    print(f"[export] {path.name} settled at {dur:.2f}s (expected {expected_duration:.2f}s); "
+                          f"accepting | {st.st_size / 1e6:.1f} MB after {time.monotonic() - t0:.1f}s", flush=True)
+                    return path
+        if timeout is not None and time.monotonic() - t0 > timeout:
+            raise TimeoutError(f"export not complete after {timeout:.0f}s: {path}")
+        time.sleep(poll)
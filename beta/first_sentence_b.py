@@ -26,25 +26,16 @@ def _token_before_dot(s: str, i: int) -> str:
         k -= 1
     return s[k+1:i].lower()
 
-def first_sentence(text: str) -> str:
-    """
-    Return the first sentence from `text`.
+def _normalize(text: str) -> str:
+    """Collapse whitespace and apply NFC so offsets are stable across calls."""
+    return unicodedata.normalize("NFC", re.sub(r'\s+', ' ', (text or "").strip()))
 
-    Recognized sentence enders:
-      '.', '!', '?', '…' (or '...'), plus combos like '?!', '!!', '!?'
-    Avoids false stops for decimals (3.14), initials/acronyms (U.S.), and abbreviations (e.g., Dr., p.m.).
-    Includes trailing closers like quotes/brackets immediately after the end mark.
+def _sentence_end(s: str, i: int = 0) -> int:
+    """
+    Scan `s` from index `i` and return the index just past the end of that sentence
+    (terminal punctuation plus any trailing closers). Returns len(s) if no ender is found.
     """
-    if not text:
-        return ""
-
-    # Normalize whitespace and Unicode form
-    s = unicodedata.normalize("NFC", re.sub(r'\s+', ' ', text.strip()))
-    if not s:
-        return ""
-
     n = len(s)
-    i = 0
     while i < n:
         ch = s[i]
 
@@ -57,7 +48,7 @@ def first_sentence(text: str) -> str:
             # include any immediate closing quotes/brackets
             while j < n and s[j] in _CLOSERS:
                 j += 1
-            return s[:j].strip()
+            return j
 
         # Ellipsis as a distinct char
         if ch == '…':
@@ -67,7 +58,7 @@ def first_sentence(text: str) -> str:
                 j += 1
             while j < n and s[j] in _CLOSERS:
                 j += 1
-            return s[:j].strip()
+            return j
 
         # ASCII periods: handle '...' and regular '.'
         if ch == '.':
@@ -84,7 +75,7 @@ def first_sentence(text: str) -> str:
                     j += 1
                 while j < n and s[j] in _CLOSERS:
                     j += 1
-                return s[:j].strip()
+                return j
 
             # Case 3: initials/acronyms like "U.S." or "A.B."
             prev = s[i-1] if i > 0 else ''
@@ -104,9 +95,66 @@ def first_sentence(text: str) -> str:
                 j += 1
             while j < n and s[j] in _CLOSERS:
                 j += 1
-            return s[:j].strip()
+            return j
 
         i += 1
 
-    # No terminal punctuation found → return entire string
-    return s
+    # No terminal punctuation found → sentence runs to the end
+    return n
+
+def first_sentence(text: str) -> str:
+    """
+    Return the first sentence from `text`.
+
+    Recognized sentence enders:
+      '.', '!', '?', '…' (or '...'), plus combos like '?!', '!!', '!?'
+    Avoids false stops for decimals (3.14), initials/acronyms (U.S.), and abbreviations (e.g., Dr., p.m.).
+    Includes trailing closers like quotes/brackets immediately after the end mark.
+    """
+    s = _normalize(text)
+    if not s:
+        return ""
+    return s[:_sentence_end(s, 0)].strip()
+
+def split_sentences(text: str) -> list[str]:
+    """
+    Split `text` into sentences using the same rules as first_sentence(),
+    so split_sentences(t)[0] == first_sentence(t).
+    """
+    s = _normalize(text)
+    out = []
+    i, n = 0, len(s)
+    while i < n:
+        j = _sentence_end(s, i)
+        sent = s[i:j].strip()
+        if sent:
+            out.append(sent)
+        i = j
+    return out
+
+# Clause breaks inside a sentence: , ; : and dashes (" - ", "–", "—"); commas between digits (1,000) are kept.
+_CLAUSE_RE = re.compile(r'(?<!\d),(?!\d)|[;:—–]|\s-\s')
+
+def split_clauses(sentence: str) -> list[tuple[str, str]]:
+    """
+    Split one sentence into (clause_text, break_mark) pairs. break_mark is the punctuation
+    that ended the clause (',', ';', ':', '—') or, for the last clause, the sentence ender
+    ('.', '!', '?', '…') or '' if there is none. Punctuation stays in the clause text.
+    """
+    s = _normalize(sentence)
+    out = []
+    i = 0
+    for m in _CLAUSE_RE.finditer(s):
+        mark = m.group().strip()
+        mark = '—' if mark in ('-', '–') else mark
+        clause = s[i:m.end()].strip() if mark != '—' else s[i:m.start()].strip()
+        if clause.strip(',;:— '):
+            out.append((clause, mark))
+        i = m.end()
+    tail = s[i:].strip()
+    if tail:
+        core = tail.rstrip(_CLOSERS)
+        end = core[-1] if core and core[-1] in _ENDERS else ''
+        end = '…' if core.endswith('...') else ('.' if end == '。' else end)
+        out.append((tail, {'！': '!', '？': '?'}.get(end, end)))
+    return out
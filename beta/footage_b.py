@@ -0,0 +1,129 @@
+# beta/footage_b.py
+"""
+Background-footage bookkeeping shared by the Filmora driver (editing_b) and the headless
+ffmpeg engine (render_b): the clip store, crop-window picking (steered clear of already-used
+stretches by the usage ledger in catalog_b) and export naming.
+No GUI imports here, so it loads on a headless box.
+"""
+import os, re, math, random
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+from keyframes_b import snap_to_keyframe
+from intervals_b import sample_free_start
+
+BACKGROUND_DIR = Path(os.getenv("REDDIT1_BACKGROUND_DIR", "/Users/marcus/Downloads/background_short_form_reddit1"))
+CLIPSTORE_DIR  = Path(os.getenv("REDDIT1_CLIPSTORE_DIR", "/Users/marcus/Downloads/reddit1_filmora_clipstore"))
+
+# Legacy numeric ids -> file names (b_main still picks by id). The durations here are rounded
+# hand-kept values; catalog_b holds the probed metadata and is what crop maths uses.
+clip_store = {
+    1 : ("minecraft_single_jumps1.mp4", 7200),  #minecraft_single_jumps1.mp4
+    2 : ("minecraftsingle_player1.mp4", 1800),  #minecraftsingle_player1.mp4
+    3 : ("minecraft_default_parkour1.mp4", 1852), #minecraft_default_parkour1.mp4.  SDSDASDASDASDSADSADASDASDASD
+    4 : ("japan_subway_surfers1.mp4", 440), #japan_subway_surfers1.mp4
+    5 : ("gta_ramp1.mp4", 7200),  #gta_ramp1.mp4
+    6 : ("minecraft_parkour_mega1.mp4", 7226) , #minecraft_parkour_mega1.mp4
+    7 : ("minecraft_parkour_mega2.mp4", 8961),  #minecraft_parkour_mega2.mp4
+
+    8 : ("gta_ramp2.mp4", 454),
+    9 : ("gta_ramp3.mp4", 495), 
+    10 : ("satisfying1.mp4", 600),  
+    11 : ("satisfying2.mp4", 613),  
+    12 : ("satisfying3.mp4", 180),
+    13 : ("mobile_games1.mp4", 1426),
+    14 : ("snowboarding1.mp4", 626),
+    15 : ("ski1.mp4", 868),
+    16 : ("mega_showreel.mp4", 3783)
+}
+
+class FootageExhausted(ValueError):
+    """No unused window of the requested length is left in a background."""
+
+def pick_random_crop_start(
+    duration: float,
+    clip_total: float,
+    buffer_s: float = 10 * 60.0,
+    integer_seconds: bool = False,
+    rng: Optional[random.Random] = None,
+    keyframes: Optional[Sequence[float]] = None,
+    used: Optional[Sequence[Tuple[float, float]]] = None,
+) -> Tuple[float, str]:
+    """
+    Random start for a `duration` window inside a `clip_total` clip, `buffer_s` clear of
+    either end. With `keyframes` (keyframes_b.keyframe_index) the start is snapped to the
+    nearest keyframe that still fits, so the window can be cut with stream copy.
+    With `used` (catalog_b.used_intervals: merged, sorted spans) the window stays out of them, uniform over
+    the unused time; FootageExhausted if none is left.
+    """
+    if duration <= 0 or clip_total <= 0:
+        raise ValueError("duration and clip_total must be > 0.")
+    if duration + 2 * buffer_s > clip_total:
+        raise ValueError("clip_total too short for duration + buffers.")
+
+    # honor the buffer you pass (don't hardcode 5)
+    start_min = buffer_s
+    start_max = clip_total - buffer_s - duration
+    if start_max < start_min:
+        raise ValueError("No start position fits the constraints.")
+
+    r = rng or random  # use provided RNG or module RNG (no reseeding)
+
+    if used is not None:
+        start = sample_free_start(used, start_min, start_max + duration, duration, r,
+                                  integer=integer_seconds, keyframes=list(keyframes) if keyframes else None)
+        if start is None:
+            raise FootageExhausted(f"no unused {duration:.0f}s window left in {clip_total:.0f}s of footage")
+        return start, _to_timecode(start)
+
+    if integer_seconds:
+        imin = math.ceil(start_min)
+        imax = math.floor(start_max)
+        if imax < imin:
+            raise ValueError("No integer start fits the constraints.")
+        start = float(r.randrange(imin, imax + 1))
+    else:
+        start = r.uniform(start_min, start_max)
+
+    if keyframes:
+        snapped = snap_to_keyframe(list(keyframes), start, start_min, start_max)
+        if snapped is not None:
+            start = snapped
+
+    return start, _to_timecode(start)
+
+def _to_timecode(seconds: float) -> str:
+    h = int(seconds // 3600)
+    m = int((seconds % 3600) // 60)
+    s = seconds % 60
+    return f"{h:02d}:{m:02d}:{s:06.3f}"
+
+def _slug(s: str) -> str:
+    s = re.sub(r"\s+", "_", str(s).strip())
+    return re.sub(r"[^A-Za-z0-9_.-]", "", s)
+
+def build_timestamp_title(base: str,
+                          duration_sec: float | int | None = None,
+                          channel: str | None = None,
+                          extra: str | None = None,
+                          max_len: int = 64) -> str:
+    """
+    Make a unique, filesystem-safe title like:
+      2025-09-03_23-41-12_My_Video_29s_main
+    - base: human name for the video
+    - duration_sec/channel/extra: optional bits to encode
+    - max_len: clamp length to keep UI happy
+    """
+    ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    parts = [ts, _slug(base)]
+    if duration_sec is not None:
+        parts.append(f"{int(round(float(duration_sec)))}s")
+    if channel:
+        parts.append(_slug(channel))
+    if extra:
+        parts.append(_slug(extra))
+    name = "_".join(p for p in parts if p)
+    if len(name) > max_len:
+        name = name[:max_len].rstrip("_")
+    return name
@@ -0,0 +1,123 @@
+# beta/handoff_b.py
+"""
+Hand the finished voiceover from the TTS worker to the caption worker without a file or
+video round trip: the float32 samples are published once in a shared-memory block (or a
+memory-mapped .f32 file when the two sides don't share a host session), and the reader maps
+the same pages instead of decoding the exported MP4 again.
+
+A handle is a plain dict, so it pickles / JSON-encodes across processes:
+    {"kind": "shm" | "memmap", "name": str, "path": str | None, "rate": int, "samples": int}
+"""
+import os, uuid, tempfile
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from pathlib import Path
+import numpy as np
+
+HANDOFF_DIR   = Path(os.getenv("VOICE_HANDOFF_DIR", tempfile.gettempdir()))
+WHISPER_RATE  = 16000      # faster-whisper expects 16 kHz mono float32
+_RESAMPLE_HALF_TAPS = 16   # per-phase taps either side of the interpolated sample
+_ROWS_PER_CHUNK = 1 << 16  # output samples per vectorized resample batch
+
+_OWNED = {}                # name -> SharedMemory kept open by the publisher until release_audio()
+
+def _open_shm(name: str) -> shared_memory.SharedMemory:
+    try:  # 3.13+: don't let this process's resource tracker unlink a block it didn't create
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+def publish_audio(audio: np.ndarray, rate: int, kind: str = "shm") -> dict:
+    """Copy `audio` (mono) once into shared memory or a memmap file and return its handle."""
+    x = np.ascontiguousarray(audio, dtype=np.float32).reshape(-1)
+    name = f"voice_{uuid.uuid4().hex[:12]}"
+    if kind == "shm":
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(1, x.nbytes))
+        np.ndarray(x.shape, dtype=np.float32, buffer=shm.buf)[:] = x
+        _OWNED[name] = shm
+        path = None
+    elif kind == "memmap":
+        HANDOFF_DIR.mkdir(parents=True, exist_ok=True)
+        path = HANDOFF_DIR / f"{name}.f32"
+        x.tofile(path)
+        path = str(path)
+    else:
+        raise ValueError(f"unknown handoff kind {kind!r}; expected 'shm' or 'memmap'")
+    print(f"[handoff] published {x.shape[0]} samples @ {rate} Hz via {kind} ({name})", flush=True)
+    return {"kind": kind, "name": name, "path": path, "rate": int(rate), "samples": int(x.shape[0])}
+
+@contextmanager
+def attach_audio(handle: dict):
+    """Yield a read-only float32 view of the published samples (no copy)."""
+    n = handle["samples"]
+    if handle["kind"] == "shm":
+        shm = _OWNED.get(handle["name"]) or _open_shm(handle["name"])
+        view = np.ndarray((n,), dtype=np.float32, buffer=shm.buf)
+        view.flags.writeable = False
+        try:
+            yield view
+        finally:
+            del view
+            if handle["name"] not in _OWNED:
+                shm.close()
+    else:
+        view = np.memmap(handle["path"], dtype=np.float32, mode="r", shape=(n,))
+        try:
+            yield view
+        finally:
+            del view
+
+def release_audio(handle: dict) -> None:
+    """Free the block/file behind `handle`. Call once, from the publisher, when every reader is done."""
+    if handle["kind"] == "shm":
+        shm = _OWNED.pop(handle["name"], None) or _open_shm(handle["name"])
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+    elif handle.get("path"):
+        Path(handle["path"]).unlink(missing_ok=True)
+
+# ---------- resampling ----------
+def resample(x: np.ndarray, rate_in: int, rate_out: int) -> np.ndarray:
+    """
+    Band-limited rational resampling (Kaiser-windowed sinc, polyphase), NumPy only.
+    Every output sample is one dot product over a window of the input; windows are gathered
+    in fixed-size batches, so memory stays bounded on long tracks.
+    """
+    x = np.asarray(x, dtype=np.float32)
+    if rate_in == rate_out or x.shape[0] == 0:
+        return np.array(x, dtype=np.float32)
+    g = np.gcd(int(rate_in), int(rate_out))
+    up, down = int(rate_out) // g, int(rate_in) // g
+    cutoff = 1.0 / max(up, down)                     # in units of the upsampled Nyquist
+    half = _RESAMPLE_HALF_TAPS
+    k = np.arange(-half * up, half * up + 1)         # taps on the upsampled grid
+    h = cutoff * np.sinc(cutoff * k) * np.kaiser(k.shape[0], 8.0)
+    h *= up / h.sum()
+    # polyphase bank: phase p uses taps k ≡ p (mod up); tap k pairs with input n0 - (k - p)/up
+    n_out = int(np.ceil(x.shape[0] * up / down))
+    m = np.arange(n_out, dtype=np.int64)
+    num = m * down
+    n0, phase = num // up, num % up
+    taps = 2 * half + 1
+    bank = np.zeros((up, taps), dtype=np.float32)
+    for p in range(up):
+        sel = k[(k - p) % up == 0]
+        j = (sel - p) // up + half                   # 0..taps-1, pairs with x[n0 - (j - half)]
+        ok = (j >= 0) & (j < taps)
+        bank[p, j[ok]] = h[np.searchsorted(k, sel[ok])]
+    xp = np.pad(x, (half, half + 1))
+    offs = half - np.arange(taps)                     # x[n0 - (j - half)] -> xp[n0 + half - j + half]
+    y = np.empty(n_out, dtype=np.float32)
+    for r0 in range(0, n_out, _ROWS_PER_CHUNK):
+        rows = slice(r0, r0 + _ROWS_PER_CHUNK)
+        seg = xp[(n0[rows] + half)[:, None] + offs[None, :]]
+        y[rows] = np.einsum("ij,ij->i", seg, bank[phase[rows]])
+    return y
+
+def whisper_input(handle: dict) -> np.ndarray:
+    """16 kHz float32 array for faster-whisper's transcribe(), read straight from the handoff buffer."""
+    with attach_audio(handle) as x:
+        return resample(x, handle["rate"], WHISPER_RATE)
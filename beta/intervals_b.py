@@ -0,0 +1,120 @@
+# beta/intervals_b.py
+"""
+Interval maths for the footage-usage ledger (catalog_b keeps the used spans per background).
+
+A background's used spans are merged into a sorted, disjoint list; insert_interval() keeps it
+that way as renders are recorded, and window_is_free() checks a window against it with one
+bisect. For a window of length d, the valid starts in a free span [a, b] are [a, b - d].
+
+sample_free_start() draws a start uniformly and keeps it if it lands in a free start range
+(one bisect per draw, O(log n)); only when a few draws miss — the range is mostly used — does
+it build the cumulative lengths of all start ranges and bisect over those (O(n)). Both are
+uniform over the unused time.
+"""
+import math, random
+from bisect import bisect_right
+from itertools import accumulate
+
+from keyframes_b import snap_to_keyframe
+
+SAMPLE_TRIES = 8           # O(log n) rejection draws before the O(n) exact pick
+
+def merge_intervals(spans) -> list[tuple[float, float]]:
+    """Sorted, disjoint union of (start, end) spans (touching spans are joined)."""
+    out = []
+    for s, e in sorted((float(s), float(e)) for s, e in spans if e > s):
+        if out and s <= out[-1][1]:
+            if e > out[-1][1]:
+                out[-1] = (out[-1][0], e)
+        else:
+            out.append((s, e))
+    return out
+
+def insert_interval(merged: list[tuple[float, float]], start: float, end: float) -> None:
+    """Fold [start, end) into a merged span list in place (bisect, then splice out what it joins)."""
+    start, end = float(start), float(end)
+    if end <= start:
+        return
+    i = bisect_right(merged, (start, math.inf))
+    if i and merged[i - 1][1] >= start:
+        i -= 1
+    j = i
+    while j < len(merged) and merged[j][0] <= end:
+        j += 1
+    if j > i:
+        start, end = min(start, merged[i][0]), max(end, merged[j - 1][1])
+    merged[i:j] = [(start, end)]
+
+def window_is_free(used: list[tuple[float, float]], t: float, duration: float) -> bool:
+    """True if [t, t + duration) misses every merged `used` span."""
+    i = bisect_right(used, (t, math.inf))
+    if i and used[i - 1][1] > t:
+        return False
+    return i == len(used) or used[i][0] >= t + duration
+
+def _start_range_at(used: list[tuple[float, float]], lo: float, hi: float, duration: float,
+                    t: float) -> tuple[float, float] | None:
+    """The start range (as in start_ranges) containing start `t`, or None if `t` isn't valid."""
+    i = bisect_right(used, (t, math.inf))
+    a = max(lo, used[i - 1][1]) if i else lo
+    b = min(hi, used[i][0]) if i < len(used) else hi
+    return (a, b - duration) if a <= t and t + duration <= b else None
+
+def free_intervals(used: list[tuple[float, float]], lo: float, hi: float) -> list[tuple[float, float]]:
+    """Gaps of the merged `used` spans inside [lo, hi]."""
+    out, cur = [], lo
+    for s, e in used:
+        if e <= cur:
+            continue
+        if s >= hi:
+            break
+        if s > cur:
+            out.append((cur, s))
+        cur = max(cur, e)
+    if cur < hi:
+        out.append((cur, hi))
+    return out
+
+def start_ranges(used: list[tuple[float, float]], lo: float, hi: float,
+                 duration: float) -> list[tuple[float, float]]:
+    """[first, last] start ranges for a `duration` window that stays out of `used` within [lo, hi]."""
+    return [(a, b - duration) for a, b in free_intervals(used, lo, hi) if b - a >= duration]
+
+def sample_free_start(used: list[tuple[float, float]], lo: float, hi: float, duration: float,
+                      rng: random.Random | None = None, integer: bool = False,
+                      keyframes: list[float] | None = None) -> float | None:
+    """
+    Start of a `duration` window inside [lo, hi] that avoids every merged `used` span, uniform over
+    the unused time (None when there is none). With `keyframes` the start is snapped to the
+    nearest keyframe inside the same start range, when it has one.
+    """
+    if hi - lo < duration:
+        return None
+    r = rng or random.SystemRandom()
+    ilo, ihi = math.ceil(lo), math.floor(hi - duration)
+    for _ in range(SAMPLE_TRIES):
+        t = float(r.randrange(ilo, ihi + 1)) if integer and ilo <= ihi else r.uniform(lo, hi - duration)
+        found = _start_range_at(used, lo, hi, duration, t)
+        if found is not None:
+            return _snap(t, *found, keyframes)
+
+    ranges = start_ranges(used, lo, hi, duration)
+    if not ranges:
+        return None
+    cum = list(accumulate(b - a for a, b in ranges))
+    if cum[-1] <= 0:
+        a, b = ranges[r.randrange(len(ranges))]         # only zero-length ranges (exact fits)
+    else:
+        u = r.uniform(0.0, cum[-1])
+        a, b = ranges[min(bisect_right(cum, u), len(ranges) - 1)]
+    t = r.uniform(a, b)
+    if integer and math.ceil(a) <= math.floor(b):
+        t = float(r.randrange(math.ceil(a), math.floor(b) + 1))
+    return _snap(t, a, b, keyframes)
+
+def _snap(t: float, a: float, b: float, keyframes: list[float] | None) -> float:
+    if keyframes:
+        snapped = snap_to_keyframe(keyframes, t, a, b)
+        if snapped is not None:
+            return snapped
+    return t
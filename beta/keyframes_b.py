@@ -0,0 +1,75 @@
+# beta/keyframes_b.py
+"""
+Keyframe index for background footage. Crop picks snap to it (footage_b, intervals_b), so a
+render's input seek (-ss before -i) lands on a keyframe and nothing is decoded and thrown
+away ahead of the window; pool chunks (chunk_pool_b) are cut on keyframes for the same reason.
+
+The index is built once per file from ffprobe's packet list (flags only, no decode) and
+cached as a sidecar JSON next to the footage ("<file>.keyframes.json"), keyed by size and
+mtime so a replaced file is re-indexed. If the footage folder is read-only the sidecar goes
+to KEYFRAME_CACHE_DIR instead.
+"""
+import os, json, subprocess
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+KEYFRAME_CACHE_DIR = Path(os.getenv("KEYFRAME_CACHE_DIR", "~/.cache/reddit1_keyframes")).expanduser()
+SIDECAR_SUFFIX = ".keyframes.json"
+
+def _sidecar_paths(video: Path) -> list[Path]:
+    return [video.with_name(video.name + SIDECAR_SUFFIX), KEYFRAME_CACHE_DIR / (video.name + SIDECAR_SUFFIX)]
+
+def _stamp(video: Path) -> dict:
+    st = video.stat()
+    return {"size": st.st_size, "mtime": int(st.st_mtime)}
+
+def probe_keyframes(video: str | Path) -> list[float]:
+    """Keyframe presentation times (seconds, ascending) of the first video stream."""
+    cmd = ["ffprobe", "-v", "error", "-select_streams", "v:0",
+           "-show_entries", "packet=pts_time,flags", "-of", "csv=p=0", str(video)]
+    out = subprocess.run(cmd, check=True, text=True, capture_output=True).stdout
+    times = []
+    for line in out.splitlines():
+        pts, _, flags = line.partition(",")
+        if "K" in flags and pts not in ("", "N/A"):
+            times.append(float(pts))
+    return sorted(times)
+
+def keyframe_index(video: str | Path) -> list[float]:
+    """Cached keyframe times for `video`; probes and writes the sidecar on first use or change."""
+    video = Path(video)
+    stamp = _stamp(video)
+    for p in _sidecar_paths(video):
+        try:
+            data = json.loads(p.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if data.get("size") == stamp["size"] and data.get("mtime") == stamp["mtime"]:
+            return data["keyframes"]
+    print(f"[keyframes] indexing {video.name} …", flush=True)
+    kf = probe_keyframes(video)
+    payload = json.dumps({**stamp, "keyframes": kf})
+    for p in _sidecar_paths(video):
+        try:
+            p.parent.mkdir(parents=True, exist_ok=True)
+            tmp = p.with_name(p.name + ".tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, p)
+            break
+        except OSError:
+            continue
+    print(f"[keyframes] {video.name}: {len(kf)} keyframes", flush=True)
+    return kf
+
+def snap_to_keyframe(keyframes: list[float], t: float, lo: float | None = None,
+                     hi: float | None = None) -> float | None:
+    """Keyframe nearest to `t` within [lo, hi] (either bound optional); None if none fits."""
+    i0 = 0 if lo is None else bisect_left(keyframes, lo)
+    i1 = len(keyframes) if hi is None else bisect_right(keyframes, hi)
+    if i0 >= i1:
+        return None
+    i = min(max(bisect_left(keyframes, t), i0), i1 - 1)
+    best = keyframes[i]
+    if i > i0 and abs(keyframes[i - 1] - t) <= abs(best - t):
+        best = keyframes[i - 1]
+    return best
@@ -0,0 +1,165 @@
+# beta/loudness_b.py
+"""
+Voiceover post-processing, NumPy only: edge-silence trim, integrated loudness (ITU-R BS.1770
+K-weighting + gating), gain to a LUFS target and a block-based true-peak limiter.
+
+Everything works on whole-buffer reshapes (or fixed-size chunks of rows), so a 15-minute
+24 kHz track is a handful of vectorized passes rather than a per-sample Python loop.
+"""
+import numpy as np
+
+TARGET_LUFS   = -16.0
+CEILING_DBTP  = -1.0
+SILENCE_DBFS  = -50.0      # frames quieter than this at the edges are trimmed
+TRIM_PAD_SEC  = 0.05       # silence kept before the first / after the last voiced frame
+FRAME_SEC     = 0.010      # analysis frame for trimming and the limiter
+LIMIT_HOLD    = 5          # limiter lookahead/release, in frames either side
+
+_SUB_SEC = 0.100           # BS.1770: 400 ms gating blocks with 75% overlap = 4 × 100 ms sub-blocks
+_ROWS_PER_CHUNK = 4096     # sub-blocks per FFT batch (bounds memory on long tracks)
+
+# ---------- K-weighting ----------
+def _biquad_power(b, a, w):
+    z = np.exp(-1j * w)
+    num = b[0] + b[1] * z + b[2] * z * z
+    den = a[0] + a[1] * z + a[2] * z * z
+    return (np.abs(num) ** 2) / (np.abs(den) ** 2)
+
+def k_weight_power(freqs_hz: np.ndarray, rate: int) -> np.ndarray:
+    """|H(f)|² of the BS.1770 K-weighting (high-shelf + RLB high-pass) designed for `rate`."""
+    w = 2 * np.pi * freqs_hz / rate
+    # stage 1: high shelf, +4 dB @ 1500 Hz, Q = 1/sqrt(2)
+    A = 10 ** (4.0 / 40)
+    w0 = 2 * np.pi * 1500.0 / rate
+    cw, alpha = np.cos(w0), np.sin(w0) / (2 * (1 / np.sqrt(2)))
+    sa = 2 * np.sqrt(A) * alpha
+    b1 = (A * ((A + 1) + (A - 1) * cw + sa), -2 * A * ((A - 1) + (A + 1) * cw), A * ((A + 1) + (A - 1) * cw - sa))
+    a1 = ((A + 1) - (A - 1) * cw + sa, 2 * ((A - 1) - (A + 1) * cw), (A + 1) - (A - 1) * cw - sa)
+    # stage 2: high pass @ 38 Hz, Q = 0.5
+    w0 = 2 * np.pi * 38.0 / rate
+    cw, alpha = np.cos(w0), np.sin(w0) / (2 * 0.5)
+    b2 = ((1 + cw) / 2, -(1 + cw), (1 + cw) / 2)
+    a2 = (1 + alpha, -2 * cw, 1 - alpha)
+    return _biquad_power(b1, a1, w) * _biquad_power(b2, a2, w)
+
+def _sub_block_power(x: np.ndarray, rate: int) -> np.ndarray:
+    """Mean square of the K-weighted signal per 100 ms sub-block (Parseval on batched rFFTs)."""
+    n = int(round(_SUB_SEC * rate))
+    rows = x.shape[0] // n
+    if rows == 0:
+        return np.zeros(0)
+    hk = k_weight_power(np.fft.rfftfreq(n, 1.0 / rate), rate)
+    # one-sided spectrum: interior bins count twice
+    wts = np.full(hk.shape, 2.0)
+    wts[0] = 1.0
+    if n % 2 == 0:
+        wts[-1] = 1.0
+    hk = hk * wts / (n * n)
+    frames = x[: rows * n].reshape(rows, n)
+    out = np.empty(rows)
+    for r0 in range(0, rows, _ROWS_PER_CHUNK):
+        spec = np.fft.rfft(frames[r0:r0 + _ROWS_PER_CHUNK], axis=1)
+        out[r0:r0 + _ROWS_PER_CHUNK] = (spec.real ** 2 + spec.imag ** 2) @ hk
+    return out
+
+def integrated_loudness(x: np.ndarray, rate: int) -> float:
+    """Gated integrated loudness in LUFS (mono). Returns -inf for silence or anything shorter
+    than one 400 ms gating block (too short to measure)."""
+    sub = _sub_block_power(np.asarray(x, dtype=np.float32), rate)
+    if sub.shape[0] < 4:
+        return float("-inf")
+    c = np.concatenate(([0.0], np.cumsum(sub)))
+    z = (c[4:] - c[:-4]) / 4.0              # 400 ms blocks, hop 100 ms
+    with np.errstate(divide="ignore"):
+        lk = -0.691 + 10 * np.log10(z)
+    gated = z[lk > -70.0]                    # absolute gate
+    if gated.size == 0:
+        return float("-inf")
+    rel = -0.691 + 10 * np.log10(gated.mean()) - 10.0
+    with np.errstate(divide="ignore"):
+        gated = gated[-0.691 + 10 * np.log10(gated) > rel]   # relative gate
+    if gated.size == 0:
+        return float("-inf")
+    return float(-0.691 + 10 * np.log10(gated.mean()))
+
+# ---------- true peak ----------
+_TP_OS      = 4            # oversampling factor for true-peak estimation
+_TP_CONTEXT = 32           # samples of context either side of an oversampled frame
+_TP_MARGIN  = 0.5          # only frames whose sample peak is within 6 dB of the ceiling are oversampled
+
+def frame_true_peak(x: np.ndarray, frame: int, floor: float = 0.0) -> np.ndarray:
+    """
+    Max |x| per frame of `frame` samples, 4× oversampled (band-limited rFFT interpolation)
+    on frames whose sample peak exceeds `floor`; other frames keep their sample peak.
+    """
+    frames = -(-x.shape[0] // frame)
+    pad = frames * frame - x.shape[0]
+    xp = np.pad(x, (_TP_CONTEXT, pad + _TP_CONTEXT))
+    peak = np.abs(xp[_TP_CONTEXT:_TP_CONTEXT + frames * frame]).reshape(frames, frame).max(axis=1)
+    idx = np.flatnonzero(peak > floor)
+    if idx.size == 0:
+        return peak
+    win = frame + 2 * _TP_CONTEXT
+    n_up = win * _TP_OS
+    lo, hi = _TP_CONTEXT * _TP_OS, (_TP_CONTEXT + frame) * _TP_OS
+    for r0 in range(0, idx.size, _ROWS_PER_CHUNK):
+        rows = idx[r0:r0 + _ROWS_PER_CHUNK]
+        seg = xp[rows[:, None] * frame + np.arange(win)[None, :]]   # (m, win) with context
+        up = np.fft.irfft(np.fft.rfft(seg, axis=1), n=n_up, axis=1) * _TP_OS
+        peak[rows] = np.maximum(peak[rows], np.abs(up[:, lo:hi]).max(axis=1))
+    return peak
+
+def limit_true_peak(x: np.ndarray, rate: int, ceiling_dbtp: float = CEILING_DBTP) -> np.ndarray:
+    """Lookahead block limiter: per-frame gain from true peaks, min-spread ±LIMIT_HOLD frames, interpolated."""
+    ceiling = 10 ** (ceiling_dbtp / 20)
+    frame = max(1, int(round(FRAME_SEC * rate)))
+    if x.shape[0] < frame:
+        return x                             # empty or shorter than one limiter frame
+    peak = frame_true_peak(x, frame, floor=ceiling * _TP_MARGIN)
+    g = np.minimum(1.0, ceiling / np.maximum(peak, 1e-12))
+    if g.min() >= 1.0:
+        return x
+    spread = g.copy()
+    for k in range(1, LIMIT_HOLD + 1):
+        np.minimum(spread[k:], g[:-k], out=spread[k:])
+        np.minimum(spread[:-k], g[k:], out=spread[:-k])
+    centers = (np.arange(spread.shape[0]) + 0.5) * frame
+    gain = np.interp(np.arange(x.shape[0]), centers, spread).astype(np.float32)
+    return x * gain
+
+# ---------- trimming ----------
+def edge_trim_bounds(x: np.ndarray, rate: int, silence_dbfs: float = SILENCE_DBFS,
+                     pad_sec: float = TRIM_PAD_SEC) -> tuple[int, int]:
+    """Return (start, end) sample bounds that drop leading/trailing silence."""
+    frame = max(1, int(round(FRAME_SEC * rate)))
+    frames = x.shape[0] // frame
+    if frames == 0:
+        return 0, x.shape[0]
+    f = x[: frames * frame].reshape(frames, frame)
+    rms = np.sqrt(np.einsum("ij,ij->i", f, f) / frame)
+    voiced = np.flatnonzero(rms > 10 ** (silence_dbfs / 20))
+    if voiced.size == 0:
+        return 0, x.shape[0]
+    pad = int(round(pad_sec * rate))
+    start = max(0, voiced[0] * frame - pad)
+    end = min(x.shape[0], (voiced[-1] + 1) * frame + pad)
+    if voiced[-1] == frames - 1:
+        end = x.shape[0]  # keep the partial tail frame when speech runs to the end
+    return int(start), int(end)
+
+# ---------- one-stop ----------
+def master_voiceover(x: np.ndarray, rate: int, target_lufs: float = TARGET_LUFS,
+                     ceiling_dbtp: float = CEILING_DBTP, trim: bool = True) -> tuple[np.ndarray, dict]:
+    """
+    Trim edge silence, normalize to `target_lufs`, then true-peak limit to `ceiling_dbtp`.
+    Returns (audio, info) where info["trim"] = (start, end) in input samples so callers can
+    shift any timing map, plus the measured/applied loudness numbers.
+    """
+    x = np.asarray(x, dtype=np.float32)
+    start, end = edge_trim_bounds(x, rate) if trim else (0, x.shape[0])
+    y = x[start:end]
+    before = integrated_loudness(y, rate)
+    gain_db = 0.0 if not np.isfinite(before) else target_lufs - before
+    y = y * np.float32(10 ** (gain_db / 20))
+    y = limit_true_peak(y, rate, ceiling_dbtp)
+    return y, {"trim": (start, end), "lufs_in": before, "gain_db": gain_db}
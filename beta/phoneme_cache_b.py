@@ -0,0 +1,109 @@
+# beta/phoneme_cache_b.py
+"""
+Persistent grapheme-to-phoneme cache in front of Kokoro's espeak phonemizer.
+
+- Sentence level (always on): exact text -> phonemes, so re-rendered or lightly edited
+  scripts only phonemize the sentences that changed.
+- Word level (opt-in, PHONEME_WORD_CACHE=1): word -> phonemes learned from sentences whose
+  espeak output aligns one group per word. A missed sentence made only of known words is
+  assembled without calling espeak. Off by default because espeak reduces some function
+  words differently in context; use it when throughput matters more than exact parity.
+
+Stored in SQLite (stdlib) so concurrent runs and crashes never corrupt it.
+"""
+import os, re, sqlite3, threading, unicodedata
+from pathlib import Path
+
+CACHE_PATH = Path(os.getenv("PHONEME_CACHE", "~/.cache/kokoro_assets/phonemes.sqlite")).expanduser()
+WORD_LEVEL = os.getenv("PHONEME_WORD_CACHE", "0").strip().lower() in ("1", "true", "yes")
+
+_WORD_RE  = re.compile(r"[A-Za-z][A-Za-z'’]*")
+_TOKEN_RE = re.compile(r"([A-Za-z][A-Za-z'’]*)|(\d)|([^\sA-Za-z\d]+)|(\s+)")
+_PUNCT    = set(';:,.!?¡¿—…"«»“”()')
+
+STATS = {"sentence_hits": 0, "sentence_misses": 0, "word_hits": 0, "word_misses": 0,
+         "word_assembled": 0, "words_learned": 0}
+
+_lock = threading.Lock()
+_conn = None
+
+def _db() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(CACHE_PATH, check_same_thread=False, isolation_level=None)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("CREATE TABLE IF NOT EXISTS sentences (lang TEXT, text TEXT, ph TEXT, PRIMARY KEY (lang, text))")
+        _conn.execute("CREATE TABLE IF NOT EXISTS words (lang TEXT, word TEXT, ph TEXT, PRIMARY KEY (lang, word))")
+    return _conn
+
+def _norm(text: str) -> str:
+    return unicodedata.normalize("NFC", re.sub(r"\s+", " ", (text or "").strip()))
+
+def _learn_words(text: str, ph: str, lang: str) -> None:
+    """Store word -> phonemes when espeak produced exactly one group per word (no digits)."""
+    if any(ch.isdigit() for ch in text):
+        return
+    words = _WORD_RE.findall(text)
+    groups = [g.strip("".join(_PUNCT)) for g in ph.split()]
+    groups = [g for g in groups if g]
+    if not words or len(words) != len(groups):
+        return
+    rows = [(lang, w.lower(), g) for w, g in zip(words, groups)]
+    _db().executemany("INSERT OR IGNORE INTO words VALUES (?, ?, ?)", rows)
+    STATS["words_learned"] += len(rows)
+
+def _assemble_from_words(text: str, lang: str) -> str | None:
+    """Build phonemes from cached words; None if any word (or any digit) is unknown."""
+    out = []
+    db = _db()
+    for word, digit, punct, space in _TOKEN_RE.findall(text):
+        if digit:
+            return None
+        if word:
+            row = db.execute("SELECT ph FROM words WHERE lang=? AND word=?", (lang, word.lower())).fetchone()
+            if row is None:
+                STATS["word_misses"] += 1
+                return None
+            STATS["word_hits"] += 1
+            out.append(row[0])
+        elif punct:
+            out.append("".join(ch for ch in punct if ch in _PUNCT))
+        elif space:
+            out.append(" ")
+    return re.sub(r"\s+", " ", "".join(out)).strip()
+
+def phonemize_cached(tokenizer, text: str, lang: str = "en-us", word_level: bool | None = None) -> str:
+    """tokenizer.phonemize(text, lang) with the sentence (and optional word) cache in front."""
+    text = _norm(text)
+    word_level = WORD_LEVEL if word_level is None else word_level
+    with _lock:
+        row = _db().execute("SELECT ph FROM sentences WHERE lang=? AND text=?", (lang, text)).fetchone()
+        if row is not None:
+            STATS["sentence_hits"] += 1
+            return row[0]
+        STATS["sentence_misses"] += 1
+        if word_level:
+            ph = _assemble_from_words(text, lang)
+            if ph is not None:
+                STATS["word_assembled"] += 1
+                _db().execute("INSERT OR REPLACE INTO sentences VALUES (?, ?, ?)", (lang, text, ph))
+                return ph
+    ph = tokenizer.phonemize(text, lang)
+    with _lock:
+        _db().execute("INSERT OR REPLACE INTO sentences VALUES (?, ?, ?)", (lang, text, ph))
+        _learn_words(text, ph, lang)
+    return ph
+
+def cache_stats() -> dict:
+    """Counters plus hit rates for this process."""
+    s = dict(STATS)
+    n = s["sentence_hits"] + s["sentence_misses"]
+    s["sentence_hit_rate"] = s["sentence_hits"] / n if n else 0.0
+    w = s["word_hits"] + s["word_misses"]
+    s["word_hit_rate"] = s["word_hits"] / w if w else 0.0
+    return s
+
+def reset_stats() -> None:
+    for k in STATS:
+        STATS[k] = 0
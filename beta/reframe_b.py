@@ -0,0 +1,98 @@
+# beta/reframe_b.py
+"""
+9:16 reframe of landscape background footage, as filter-graph fragments that drop into the
+same ffmpeg pass as the caption burn (render_b), so Shorts need no separate conversion.
+
+Modes:
+  center  scale to cover, centre crop
+  motion  scale to cover, crop window follows where the motion is: a cheap pre-pass decodes
+          a tiny grayscale proxy, scores frame-difference energy per column with NumPy, picks
+          the best window per sample, smooths it, and drives crop x through sendcmd
+  blur    whole frame fitted to the width over a blurred fill; the blur runs on a 1/8-size
+          copy and is scaled back up, which is far cheaper than blurring at full resolution
+"""
+import os, subprocess
+from pathlib import Path
+import numpy as np
+
+REFRAME_MODES   = ("center", "motion", "blur")
+REFRAME_MODE    = os.getenv("REFRAME_MODE", "center")
+
+BLUR_DOWNSCALE  = 8        # blur on a 1/8-size copy
+BLUR_RADIUS     = 12       # boxblur radius at that size
+BLUR_DIM        = -0.08    # darken the fill slightly so the foreground reads
+
+MOTION_FPS      = 4        # analysis samples per second
+MOTION_W        = 160      # analysis proxy width
+MOTION_SMOOTH_S = 1.5      # moving-average window for the crop centre
+MOTION_MAX_PAN  = 0.25     # max pan speed, fraction of frame width per second
+
+def _cover_width(src_w: int, src_h: int, out_h: int) -> int:
+    return int(round(src_w * out_h / float(src_h)))
+
+def reframe_graph(mode: str, in_label: str, out_label: str, out_w: int, out_h: int,
+                  sendcmd_path: Path | None = None, tag: str = "rf") -> str:
+    """filter_complex fragment taking [in_label] (landscape) to [out_label] (out_w×out_h, SAR 1)."""
+    if mode not in REFRAME_MODES:
+        raise ValueError(f"unknown reframe mode {mode!r}; expected one of {REFRAME_MODES}")
+    cover = f"scale={out_w}:{out_h}:force_original_aspect_ratio=increase"
+    if mode == "center" or (mode == "motion" and sendcmd_path is None):
+        return f"[{in_label}]{cover},crop={out_w}:{out_h},setsar=1[{out_label}]"
+    if mode == "motion":
+        return (f"[{in_label}]{cover},sendcmd=f='{sendcmd_path.as_posix()}',"
+                f"crop@{tag}=w={out_w}:h={out_h}:x=(iw-ow)/2:y=(ih-oh)/2,setsar=1[{out_label}]")
+    lw, lh = max(2, out_w // BLUR_DOWNSCALE // 2 * 2), max(2, out_h // BLUR_DOWNSCALE // 2 * 2)
+    return (f"[{in_label}]split=2[{tag}_bg][{tag}_fg];"
+            f"[{tag}_bg]scale={lw}:{lh}:force_original_aspect_ratio=increase,crop={lw}:{lh},"
+            f"boxblur={BLUR_RADIUS}:2,eq=brightness={BLUR_DIM},scale={out_w}:{out_h}:flags=bilinear[{tag}_fill];"
+            f"[{tag}_fg]scale={out_w}:{out_h}:force_original_aspect_ratio=decrease[{tag}_fit];"
+            f"[{tag}_fill][{tag}_fit]overlay=(W-w)/2:(H-h)/2,setsar=1[{out_label}]")
+
+def _motion_energy(input_args: list[str], src_w: int, src_h: int) -> np.ndarray:
+    """(samples, MOTION_W) column energy of absolute frame differences on a grayscale proxy."""
+    ph = max(2, int(round(MOTION_W * src_h / float(src_w))) // 2 * 2)
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", *input_args, "-an",
+           "-vf", f"fps={MOTION_FPS},scale={MOTION_W}:{ph},format=gray", "-f", "rawvideo", "-"]
+    raw = subprocess.run(cmd, check=True, capture_output=True).stdout
+    frames = np.frombuffer(raw, dtype=np.uint8)
+    n = frames.size // (MOTION_W * ph)
+    if n < 2:
+        return np.zeros((max(n, 1), MOTION_W), dtype=np.float32)
+    frames = frames[: n * MOTION_W * ph].reshape(n, ph, MOTION_W).astype(np.int16)
+    diff = np.abs(np.diff(frames, axis=0)).sum(axis=1, dtype=np.float32)    # (n-1, W)
+    return np.concatenate([diff[:1], diff])                                 # keep n samples
+
+def motion_track(energy: np.ndarray, window_frac: float) -> np.ndarray:
+    """Smoothed, speed-limited window centre (fraction of width) per sample."""
+    n, w = energy.shape
+    win = max(1, min(w, int(round(window_frac * w))))
+    c = np.concatenate([np.zeros((n, 1), dtype=np.float32), np.cumsum(energy, axis=1)], axis=1)
+    sums = c[:, win:] - c[:, :-win]                                         # (n, w - win + 1)
+    best = (np.argmax(sums, axis=1) + win / 2.0) / w
+    still = sums.max(axis=1) <= 1e-6
+    best[still] = 0.5                                                        # no motion: centre
+    k = max(1, int(round(MOTION_SMOOTH_S * MOTION_FPS)))
+    pad = np.pad(best, (k // 2, k - 1 - k // 2), mode="edge")
+    smooth = np.convolve(pad, np.ones(k) / k, mode="valid")
+    step = MOTION_MAX_PAN / MOTION_FPS
+    out = np.empty_like(smooth)
+    out[0] = smooth[0]
+    for i in range(1, smooth.shape[0]):                                      # rate limit (n is small)
+        out[i] = out[i - 1] + np.clip(smooth[i] - out[i - 1], -step, step)
+    half = window_frac / 2
+    return np.clip(out, half, 1 - half)
+
+def write_motion_sendcmd(input_args: list[str], src_w: int, src_h: int, out_w: int, out_h: int,
+                         cmd_path: Path, time_offset: float = 0.0, tag: str = "rf") -> Path:
+    """Analyse the background input and write sendcmd lines setting crop@tag x over time."""
+    cover_w = _cover_width(src_w, src_h, out_h)
+    if cover_w <= out_w:
+        cmd_path.write_text("", encoding="utf-8")
+        return cmd_path
+    centres = motion_track(_motion_energy(input_args, src_w, src_h), out_w / float(cover_w))
+    xs = np.clip(np.round(centres * cover_w - out_w / 2.0), 0, cover_w - out_w).astype(int)
+    lines = [f"{time_offset + i / MOTION_FPS:.3f} crop@{tag} x {x};" for i, x in enumerate(xs)]
+    cmd_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    print(f"[reframe] motion track: {len(xs)} samples, x range {xs.min()}..{xs.max()} of {cover_w - out_w}",
+          flush=True)
+    return cmd_path
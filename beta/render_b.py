@@ -0,0 +1,593 @@
+# beta/render_b.py
+"""
+Headless ffmpeg edit engine: the edit beta_make_edits() clicks together in Filmora
+(background window at a random start, trimmed to the voiceover, game audio muted, voice
+laid in, 9:16 for Shorts, exported to the clipstore) as a single ffmpeg command.
+
+No GUI, no fixed sleeps, no pixel polling: it runs on Linux, returns when ffmpeg exits,
+and several renders can run side by side (render_many). The 9:16 reframe (reframe_b:
+centre crop, motion-following crop or blurred fill) sits in the same filter graph.
+"""
+import os, json, math, uuid, random, shutil, subprocess, tempfile, time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from footage_b import CLIPSTORE_DIR, pick_random_crop_start, build_timestamp_title, FootageExhausted
+from catalog_b import get_footage, choose_background, used_intervals, record_usage
+from keyframes_b import keyframe_index
+from encoder_profile_b import encoder_args
+from chunk_pool_b import pick_chunk_run, chunk_run_start, write_concat_list, pool_size
+from reframe_b import reframe_graph, write_motion_sendcmd, REFRAME_MODE
+from timeline_b import Timeline, Clip, Overlay, CaptionLayer, compile_timeline
+from render_cache_b import RENDER_CACHE_DIR, BASE_ENC, base_key, cached_base, store_base, latest_base
+from export_watch_b import probe_duration
+import captions_b
+from captions_b import (transcribe_words, build_ass_text, write_ass_temp, resolve_intro_image, ensure_dir,
+                        timestamp, media_hash)
+
+OUT_W, OUT_H   = 1080, 1920    # Shorts canvas (Filmora's 9:16 project setting)
+AUDIO_CODEC    = "aac"
+AUDIO_BITRATE  = "192k"
+CROP_BUFFER_S  = 60            # same lead-in/tail margin beta_make_edits uses
+MIN_PIECE_S    = 20.0          # shortest range worth its own process in render_chunked
+CHUNK_THREADS  = 4             # encoder threads per piece before adding another piece
+USE_POOL       = os.getenv("BACKGROUND_POOL", "1").strip().lower() in ("1", "true", "yes")  # chunk_pool_b
+
+PREVIEW_W, PREVIEW_H = 360, 640   # proxy preview canvas (360p, 9:16)
+PREVIEW_ENC    = {"vcodec": "libx264", "preset": "ultrafast", "crf": 30}
+PREVIEW_ABITRATE = "96k"
+PREVIEW_SAMPLE_S = 4.0          # length of each sampled segment in render_preview
+
+def _require_ffmpeg() -> None:
+    if not shutil.which("ffmpeg"):
+        raise SystemExit("FFmpeg not found on PATH. Install it and rerun.")
+
+def run_ffmpeg(cmd: list[str], tag: str = "ffmpeg") -> None:
+    """Run an ffmpeg command; on failure print the head/tail of stderr and raise."""
+    print(f"[{tag}] cmd:", " ".join(cmd), flush=True)
+    run = subprocess.run(cmd, check=False, text=True, capture_output=True)
+    if run.returncode != 0:
+        err = (run.stderr or "").splitlines()
+        print(f"\n[{tag} stderr — head]\n" + "\n".join(err[:20]) + "\n")
+        print(f"[{tag} stderr — tail]\n" + "\n".join(err[-20:]) + "\n")
+        raise RuntimeError(f"ffmpeg failed (code {run.returncode})")
+
+def build_edit_cmd(bg_input: list[str], audio_path: str | Path, out_path: str | Path,
+                   threads: int = 0, reframe: str = "center", sendcmd: Path | None = None) -> list[str]:
+    """
+    ffmpeg command for one edit: the background window (`bg_input`, from _background_input)
+    as video only (game audio is never mapped), reframed to 9:16, with the voice laid in.
+    """
+    return [
+        "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+        *bg_input,
+        "-i", str(audio_path),
+        "-filter_complex", reframe_graph(reframe, "0:v", "rf", OUT_W, OUT_H, sendcmd) + ";[rf]format=yuv420p[vout]",
+        "-map", "[vout]", "-map", "1:a:0",
+        *encoder_args("render"), "-threads", str(threads),
+        "-c:a", AUDIO_CODEC, "-b:a", AUDIO_BITRATE,
+        "-movflags", "+faststart",
+        str(out_path),
+    ]
+
+def _pick_window(background_reddit1, audio_duration, rng) -> tuple[Path, float]:
+    """`background_reddit1`: legacy clip_store id, footage file name, or None for a random catalogued clip."""
+    need = math.ceil(audio_duration) + 2 * CROP_BUFFER_S
+    clip = (get_footage(background_reddit1) if background_reddit1 is not None
+            else choose_background(need, rng, window=math.ceil(audio_duration)))
+    bg_path = Path(clip["path"])
+    if not bg_path.exists():
+        raise FileNotFoundError(bg_path)
+    crop = dict(duration=math.ceil(audio_duration), clip_total=clip["duration"], buffer_s=CROP_BUFFER_S,
+                integer_seconds=True, rng=rng, keyframes=keyframe_index(bg_path))
+    try:
+        start_s, tc = pick_random_crop_start(**crop, used=used_intervals(clip["name"]))
+    except FootageExhausted:
+        print(f"[edit] {clip['name']}: no unused window left; reusing footage", flush=True)
+        start_s, tc = pick_random_crop_start(**crop)
+    print(f"[edit] {clip['name']} ({clip['width']}x{clip['height']} {clip['fps']:.2f}fps {clip['codec']}) | "
+          f"start {tc} | duration {audio_duration:.2f}s", flush=True)
+    return bg_path, start_s
+
+def _background_plan(background_reddit1, audio_duration, rng) -> dict:
+    """
+    Where the background window comes from: a run of pre-segmented pool chunks
+    {"kind": "pool", "chunks": [(path, seconds), ...]} (concat demuxer, no seek), or a
+    keyframe-snapped window {"kind": "seek", "path", "start", "keyframes"} in the source.
+    Both carry the background "name", its source "start" (for the usage ledger) and the frame
+    size ("width", "height") the reframe works from.
+    """
+    rng = rng or random.SystemRandom()
+    if USE_POOL:
+        if background_reddit1 is None:
+            background_reddit1 = choose_background(math.ceil(audio_duration) + 2 * CROP_BUFFER_S, rng,
+                                                   window=math.ceil(audio_duration))["name"]
+        name = get_footage(background_reddit1)["name"]
+        chunks = pick_chunk_run(name, float(audio_duration), rng, with_durations=True, used=used_intervals(name))
+        if chunks is not None:
+            width, height = pool_size(name)
+            return {"kind": "pool", "chunks": chunks, "name": name, "start": chunk_run_start(name, chunks[0][0]),
+                    "width": width, "height": height}
+    bg_path, start_s = _pick_window(background_reddit1, audio_duration, rng)
+    clip = get_footage(bg_path)
+    return {"kind": "seek", "path": bg_path, "start": start_s, "keyframes": keyframe_index(bg_path),
+            "name": clip["name"], "width": clip["width"], "height": clip["height"]}
+
+def _record_plan(plan: dict, duration: float) -> None:
+    """Log the window a finished render used, so later crop picks avoid it."""
+    record_usage(plan["name"], plan["start"], plan["start"] + float(duration))
+
+def _plan_input(plan: dict, t0: float, dur: float) -> tuple[list[str], Path | None]:
+    """
+    ffmpeg input args for [t0, t0 + dur) of a background plan (a plan boundary for t0 avoids
+    a decode-and-discard lead-in), plus a temp file for the caller to delete.
+    """
+    if plan["kind"] == "pool":
+        acc, files, first = 0.0, [], None
+        for path, d in plan["chunks"]:
+            if acc + d > t0 + 1e-3 and acc < t0 + dur - 1e-3:
+                files.append(path)
+                first = acc if first is None else first
+            acc += d
+        lst = write_concat_list(files)
+        lead = ["-ss", f"{t0 - first:.3f}"] if first is not None and t0 - first > 1e-3 else []
+        return ["-f", "concat", "-safe", "0", *lead, "-t", f"{dur:.3f}", "-i", str(lst)], lst
+    return ["-ss", f"{plan['start'] + t0:.3f}", "-t", f"{dur:.3f}", "-i", str(plan["path"])], None
+
+def _plan_boundaries(plan: dict, duration: float) -> list[float]:
+    """Times (relative to the window start) at which an input can begin on a keyframe."""
+    if plan["kind"] == "pool":
+        out, acc = [], 0.0
+        for _path, d in plan["chunks"][:-1]:
+            acc += d
+            out.append(acc)
+    else:
+        s0 = plan["start"]
+        out = [k - s0 for k in plan["keyframes"] if s0 < k < s0 + duration]
+    return [t for t in out if 0.0 < t < duration]
+
+def _background_input(background_reddit1, audio_duration, rng) -> tuple[list[str], Path | None]:
+    """ffmpeg input args for the whole background window, plus a temp file for the caller to delete."""
+    return _plan_input(_background_plan(background_reddit1, audio_duration, rng), 0.0, float(audio_duration))
+
+def _reframe_sendcmd(plan: dict, duration: float, reframe: str | None, cmd_path: Path,
+                     out_w: int = OUT_W, out_h: int = OUT_H) -> Path | None:
+    """For the motion reframe: analyse the whole window once and write its crop track to `cmd_path`."""
+    if reframe != "motion":
+        return None
+    args, tmp = _plan_input(plan, 0.0, duration)
+    try:
+        return write_motion_sendcmd(args, plan["width"], plan["height"], out_w, out_h, cmd_path)
+    finally:
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+
+def headless_make_edits(background_reddit1, audio_duration, target_dir_audio, target_name_audio,
+                        out_dir: str | Path = CLIPSTORE_DIR, rng: random.Random | None = None,
+                        threads: int = 0, reframe: str = REFRAME_MODE) -> str:
+    """
+    Drop-in for editing_b.beta_make_edits(): same arguments, same return value (the export
+    title; the file is {out_dir}/{export_title}.mp4).
+    """
+    _require_ffmpeg()
+    audio_path = Path(target_dir_audio) / target_name_audio
+    if not audio_path.exists():
+        raise FileNotFoundError(audio_path)
+    plan = _background_plan(background_reddit1, audio_duration, rng)
+    bg_input, bg_tmp = _plan_input(plan, 0.0, float(audio_duration))
+
+    # a short random suffix keeps titles unique when renders start in the same second
+    export_title = build_timestamp_title(base="My Video", extra=uuid.uuid4().hex[:6])
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_video = out_dir / f"{export_title}.mp4"
+    out_tmp = out_video.with_suffix(".tmp.mp4")
+
+    sendcmd = out_video.with_suffix(".crop.txt")
+    t0 = time.perf_counter()
+    try:
+        sendcmd = _reframe_sendcmd(plan, float(audio_duration), reframe, sendcmd)
+        run_ffmpeg(build_edit_cmd(bg_input, audio_path, out_tmp, threads, reframe, sendcmd), tag="edit")
+        out_tmp.replace(out_video)
+        _record_plan(plan, audio_duration)
+    finally:
+        if bg_tmp is not None:
+            bg_tmp.unlink(missing_ok=True)
+        if sendcmd is not None:
+            sendcmd.unlink(missing_ok=True)
+        if out_tmp.exists():
+            out_tmp.unlink()
+    print(f"[edit] saved {out_video} in {time.perf_counter() - t0:.1f}s", flush=True)
+    return export_title
+
+def _intro_kwargs(intro_secs, intro_fade, intro_scale, intro_crop_bottom,
+                  intro_offset_x, intro_offset_y, intro_round_px) -> dict:
+    return dict(intro_secs=intro_secs, intro_fade=intro_fade, intro_scale=intro_scale,
+                intro_crop_bottom=intro_crop_bottom, intro_offset_x=intro_offset_x,
+                intro_offset_y=intro_offset_y, intro_round_px=intro_round_px)
+
+def _intro_overlay(intro_img: Path, intro: dict, canvas_w: int = OUT_W) -> Overlay:
+    """The intro card (captions_b.INTRO_* settings) as a timeline overlay. On a canvas narrower
+    than OUT_W (the preview) its pixel offsets and rounding shrink to match."""
+    k = canvas_w / float(OUT_W)
+    return Overlay(intro_img, end=intro["intro_secs"], scale=intro["intro_scale"],
+                   crop_bottom=intro["intro_crop_bottom"], round_px=int(round(intro["intro_round_px"] * k)),
+                   fade_out=intro["intro_fade"], offset_x=int(round(intro["intro_offset_x"] * k)),
+                   offset_y=int(round(intro["intro_offset_y"] * k)))
+
+def _prepare_render(target_dir_audio, target_name_audio, audio, intro_card_src, intro_enabled,
+                    until: float | None = None, play_w: int = OUT_W, play_h: int = OUT_H):
+    _require_ffmpeg()
+    audio_path = Path(target_dir_audio) / target_name_audio
+    if not audio_path.exists():
+        raise FileNotFoundError(audio_path)
+    audio_hash = media_hash(audio_path)       # one transcript key whether Whisper reads the handle or the file
+    words = transcribe_words(audio if audio is not None else audio_path, key=audio_hash, until=until)
+    ass_text = build_ass_text(words, play_w, play_h)
+    out_dir = ensure_dir(Path(captions_b.OUTPUT_DIR))
+    out_name = captions_b.FILENAME_TEMPLATE.format(stem=Path(target_name_audio).stem, ts=timestamp(), anim=captions_b.ANIM)
+    out_video = (out_dir / out_name).resolve()
+    intro_img = resolve_intro_image(intro_card_src) if intro_enabled else None
+    return audio_path, audio_hash, ass_text, out_video, intro_img
+
+def render_single_pass(background_reddit1, audio_duration, target_dir_audio, target_name_audio,
+                       audio: dict | None = None,
+                       intro_card_src: Path | None = captions_b.INTRO_CARD_SRC,
+                       intro_enabled: bool = captions_b.INTRO_ENABLED,
+                       intro_secs: float = captions_b.INTRO_SECS,
+                       intro_fade: float = captions_b.INTRO_FADE,
+                       intro_scale: float = captions_b.INTRO_SCALE,
+                       intro_crop_bottom: float = captions_b.INTRO_CROP_BOTTOM,
+                       intro_offset_x: int = captions_b.INTRO_OFFSET_X,
+                       intro_offset_y: int = captions_b.INTRO_OFFSET_Y,
+                       intro_round_px: int = captions_b.INTRO_ROUND_PX,
+                       rng: random.Random | None = None, threads: int = 0,
+                       reframe: str = REFRAME_MODE, plan: dict | None = None) -> str:
+    """
+    headless_make_edits() + beta_captions() in one decode/encode: background trim and 9:16
+    reframe (`reframe`: "center", "motion" or "blur"), voice, ASS caption burn and intro-card
+    overlay share a single filter graph.
+    Words come from the voiceover itself (the `audio` handoff handle, else the voice file),
+    so nothing is transcribed out of an intermediate video. `plan` pins the background window
+    (e.g. the one approved in render_preview). The edit is described as a timeline_b.Timeline
+    and compiled to the command. Returns the captioned MP4 path.
+    """
+    audio_path, audio_hash, ass_text, out_video, intro_img = _prepare_render(
+        target_dir_audio, target_name_audio, audio, intro_card_src, intro_enabled)
+    intro = _intro_kwargs(intro_secs, intro_fade, intro_scale, intro_crop_bottom,
+                          intro_offset_x, intro_offset_y, intro_round_px)
+    plan = plan or _background_plan(background_reddit1, audio_duration, rng)
+    bg_input, bg_tmp = _plan_input(plan, 0.0, float(audio_duration))
+    out_tmp = out_video.with_suffix(".tmp.mp4")
+    ass_path = sendcmd = None
+    t0 = time.perf_counter()
+    try:
+        ass_path = write_ass_temp(ass_text)
+        sendcmd = _reframe_sendcmd(plan, float(audio_duration), reframe, ass_path.with_suffix(".crop.txt"))
+        tl = Timeline(duration=float(audio_duration), width=OUT_W, height=OUT_H, reframe=reframe, sendcmd=sendcmd,
+                      video=[Clip(input_args=bg_input)], audio=[Clip(audio_path)],
+                      captions=[CaptionLayer(ass_path)])
+        if intro_img is not None and intro_secs > 0:
+            tl.overlays.append(_intro_overlay(intro_img, intro))
+        run_ffmpeg(compile_timeline(tl, out_tmp, audio_args=("-c:a", AUDIO_CODEC, "-b:a", AUDIO_BITRATE),
+                                    threads=threads), tag="render")
+        out_tmp.replace(out_video)
+        _record_plan(plan, audio_duration)
+    finally:
+        if bg_tmp is not None:
+            bg_tmp.unlink(missing_ok=True)
+        if ass_path and ass_path.exists():
+            ass_path.unlink()
+        if sendcmd is not None:
+            sendcmd.unlink(missing_ok=True)
+        if out_tmp.exists():
+            out_tmp.unlink()
+    print(f"[render] saved {out_video} in {time.perf_counter() - t0:.1f}s (single pass)", flush=True)
+    return out_video.as_posix()
+
+def split_ranges(boundaries: list[float], duration: float, pieces: int,
+                 min_piece: float = MIN_PIECE_S) -> list[tuple[float, float]]:
+    """
+    Cut [0, duration) into about `pieces` (start, length) ranges of similar length whose
+    starts all fall on `boundaries` (keyframe/chunk starts), none shorter than `min_piece`.
+    """
+    cuts = []
+    for k in range(1, max(1, pieces)):
+        ideal = duration * k / pieces
+        if not boundaries:
+            break
+        b = min(boundaries, key=lambda t: abs(t - ideal))
+        if b - (cuts[-1] if cuts else 0.0) >= min_piece and duration - b >= min_piece:
+            cuts.append(b)
+    edges = [0.0] + sorted(set(cuts)) + [duration]
+    return [(a, b - a) for a, b in zip(edges[:-1], edges[1:])]
+
+def render_chunked(background_reddit1, audio_duration, target_dir_audio, target_name_audio,
+                   audio: dict | None = None,
+                   intro_card_src: Path | None = captions_b.INTRO_CARD_SRC,
+                   intro_enabled: bool = captions_b.INTRO_ENABLED,
+                   intro_secs: float = captions_b.INTRO_SECS,
+                   intro_fade: float = captions_b.INTRO_FADE,
+                   intro_scale: float = captions_b.INTRO_SCALE,
+                   intro_crop_bottom: float = captions_b.INTRO_CROP_BOTTOM,
+                   intro_offset_x: int = captions_b.INTRO_OFFSET_X,
+                   intro_offset_y: int = captions_b.INTRO_OFFSET_Y,
+                   intro_round_px: int = captions_b.INTRO_ROUND_PX,
+                   rng: random.Random | None = None, workers: int | None = None,
+                   reframe: str | None = REFRAME_MODE, plan: dict | None = None,
+                   width: int = OUT_W, height: int = OUT_H) -> str:
+    """
+    render_single_pass() for long-form: the timeline is split into keyframe/chunk-aligned
+    ranges, each rendered (video only, captions time-offset, intro card only where it shows)
+    by its own ffmpeg process in parallel; the pieces are joined by stream-copy concat and
+    the voice is muxed once over the whole thing, so audio has no seams.
+    The canvas is `width`×`height` (Shorts by default); for 16:9 long-form pass
+    width=1920, height=1080, reframe=None, which fits the background to the canvas instead
+    of cropping it to 9:16.
+    """
+    audio_path, audio_hash, ass_text, out_video, intro_img = _prepare_render(
+        target_dir_audio, target_name_audio, audio, intro_card_src, intro_enabled, play_w=width, play_h=height)
+    intro = _intro_kwargs(intro_secs, intro_fade, intro_scale, intro_crop_bottom,
+                          intro_offset_x, intro_offset_y, intro_round_px)
+    duration = float(audio_duration)
+    plan = plan or _background_plan(background_reddit1, duration, rng)
+    cpus = os.cpu_count() or 1
+    workers = workers or max(1, min(cpus // CHUNK_THREADS, int(duration // MIN_PIECE_S)))
+    ranges = split_ranges(_plan_boundaries(plan, duration), duration, workers)
+    threads = max(1, cpus // len(ranges))
+    card = intro_img is not None and intro_secs > 0
+    print(f"[render] chunked: {len(ranges)} pieces × {threads} threads | "
+          + ", ".join(f"{a:.1f}+{d:.1f}s" for a, d in ranges), flush=True)
+
+    out_tmp = out_video.with_suffix(".tmp.mp4")
+    t0 = time.perf_counter()
+    with tempfile.TemporaryDirectory() as td:
+        td = Path(td)
+        ass_path = td / "captions.ass"
+        ass_path.write_text(ass_text, encoding="utf-8")
+        sendcmd = _reframe_sendcmd(plan, duration, reframe, td / "crop.txt", width, height)
+
+        def piece(i_range):
+            i, (start, dur) = i_range
+            inputs, tmp = _plan_input(plan, start, dur)
+            tl = Timeline(duration=dur, width=width, height=height, reframe=reframe, fit=True, sendcmd=sendcmd,
+                          offset=start, video=[Clip(input_args=inputs)], captions=[CaptionLayer(ass_path)])
+            if card:
+                tl.overlays.append(_intro_overlay(intro_img, intro, width))
+            out = td / f"piece_{i:04d}.mp4"
+            try:
+                run_ffmpeg(compile_timeline(tl, out, threads=threads), tag=f"piece {i}")
+            finally:
+                if tmp is not None:
+                    tmp.unlink(missing_ok=True)
+            return out
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as ex:
+            pieces = list(ex.map(piece, enumerate(ranges)))
+        t1 = time.perf_counter()
+
+        lst = write_concat_list(pieces, td / "pieces.txt")
+        try:
+            run_ffmpeg(["ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+                        "-f", "concat", "-safe", "0", "-i", str(lst), "-i", str(audio_path),
+                        "-map", "0:v:0", "-map", "1:a:0", "-c:v", "copy",
+                        "-c:a", AUDIO_CODEC, "-b:a", AUDIO_BITRATE, "-shortest",
+                        "-movflags", "+faststart", str(out_tmp)], tag="concat")
+            out_tmp.replace(out_video)
+            _record_plan(plan, duration)
+        finally:
+            if out_tmp.exists():
+                out_tmp.unlink()
+    print(f"[render] saved {out_video} in {time.perf_counter() - t0:.1f}s "
+          f"(pieces {t1 - t0:.1f}s, concat+mux {time.perf_counter() - t1:.1f}s)", flush=True)
+    return out_video.as_posix()
+
+def preview_ranges(duration: float, first_s: float | None = None, samples: int = 0,
+                   sample_s: float = PREVIEW_SAMPLE_S) -> list[tuple[float, float]]:
+    """(start, length) ranges a preview covers: the first `first_s` seconds, else `samples`
+    evenly spread segments of `sample_s` (always including the start, where the card is), else all."""
+    if first_s:
+        return [(0.0, min(float(first_s), duration))]
+    if samples and samples * sample_s < duration:
+        step = (duration - sample_s) / max(1, samples - 1)
+        return [(round(i * step, 3), sample_s) for i in range(samples)]
+    return [(0.0, duration)]
+
+def save_approved(approved: dict, path: str | Path) -> Path:
+    """Write render_preview's approved parameters as JSON, for a full render in another process."""
+    path = Path(path)
+    path.write_text(json.dumps(approved, indent=1, default=str), encoding="utf-8")
+    return path
+
+def _plan_from_json(plan: dict) -> dict:
+    """Restore the Path members of a background plan read back from JSON."""
+    if plan["kind"] == "pool":
+        plan["chunks"] = [(Path(f), float(d)) for f, d in plan["chunks"]]
+    else:
+        plan["path"] = Path(plan["path"])
+    return plan
+
+def load_approved(path: str | Path) -> dict:
+    """Inverse of save_approved: keyword arguments for render_single_pass / render_chunked."""
+    approved = json.loads(Path(path).read_text(encoding="utf-8"))
+    _plan_from_json(approved["plan"])
+    return approved
+
+def render_preview(background_reddit1, audio_duration, target_dir_audio, target_name_audio,
+                   audio: dict | None = None,
+                   intro_card_src: Path | None = captions_b.INTRO_CARD_SRC,
+                   intro_enabled: bool = captions_b.INTRO_ENABLED,
+                   intro_secs: float = captions_b.INTRO_SECS,
+                   intro_fade: float = captions_b.INTRO_FADE,
+                   intro_scale: float = captions_b.INTRO_SCALE,
+                   intro_crop_bottom: float = captions_b.INTRO_CROP_BOTTOM,
+                   intro_offset_x: int = captions_b.INTRO_OFFSET_X,
+                   intro_offset_y: int = captions_b.INTRO_OFFSET_Y,
+                   intro_round_px: int = captions_b.INTRO_ROUND_PX,
+                   rng: random.Random | None = None, reframe: str = REFRAME_MODE, plan: dict | None = None,
+                   first_s: float | None = None, samples: int = 0,
+                   sample_s: float = PREVIEW_SAMPLE_S) -> tuple[str, dict]:
+    """
+    Proxy of render_single_pass(): the same timeline (background window, reframe, captions,
+    intro card, voice) at PREVIEW_W×PREVIEW_H with ultrafast settings, optionally only the
+    first `first_s` seconds or `samples` segments of `sample_s` each (see preview_ranges).
+
+    Returns (preview path, approved), where `approved` holds everything that was chosen or
+    passed — the background plan included — so the full render reproduces it exactly:
+        render_single_pass(bg, dur, dir, name, audio=audio, **approved)
+    """
+    duration = float(audio_duration)
+    ranges = preview_ranges(duration, first_s, samples, sample_s)
+    span = max(a + d for a, d in ranges)
+    # only the previewed stretch is transcribed (or cut from a cached full transcript)
+    audio_path, audio_hash, ass_text, out_video, intro_img = _prepare_render(
+        target_dir_audio, target_name_audio, audio, intro_card_src, intro_enabled,
+        until=span if span < duration else None)
+    intro = _intro_kwargs(intro_secs, intro_fade, intro_scale, intro_crop_bottom,
+                          intro_offset_x, intro_offset_y, intro_round_px)
+    plan = plan or _background_plan(background_reddit1, duration, rng)
+    card = intro_img is not None and intro_secs > 0
+    out_preview = out_video.with_name(out_video.stem + "_preview.mp4")
+    print(f"[preview] {PREVIEW_W}x{PREVIEW_H} {PREVIEW_ENC['preset']} | "
+          + ", ".join(f"{a:.1f}+{d:.1f}s" for a, d in ranges), flush=True)
+
+    t0 = time.perf_counter()
+    with tempfile.TemporaryDirectory() as td:
+        td = Path(td)
+        ass_path = td / "captions.ass"
+        ass_path.write_text(ass_text, encoding="utf-8")
+        sendcmd = _reframe_sendcmd(plan, span, reframe, td / "crop.txt")
+
+        def piece(i_range):
+            i, (start, dur) = i_range
+            inputs, tmp = _plan_input(plan, start, dur)
+            # the motion track is in full-canvas pixels: reframe at OUT_W×OUT_H, then scale down
+            tl = Timeline(duration=dur, width=PREVIEW_W, height=PREVIEW_H, reframe=reframe, sendcmd=sendcmd,
+                          offset=start, reframe_size=(OUT_W, OUT_H) if sendcmd is not None else None,
+                          video=[Clip(input_args=inputs)], audio=[Clip(audio_path, in_s=start, out_s=start + dur)],
+                          captions=[CaptionLayer(ass_path)])
+            if card:
+                tl.overlays.append(_intro_overlay(intro_img, intro, PREVIEW_W))
+            out = td / f"preview_{i:04d}.mp4"
+            try:
+                run_ffmpeg(compile_timeline(tl, out, video_args=encoder_args(enc=PREVIEW_ENC),
+                                            audio_args=("-c:a", AUDIO_CODEC, "-b:a", PREVIEW_ABITRATE)),
+                           tag=f"preview {i}")
+            finally:
+                if tmp is not None:
+                    tmp.unlink(missing_ok=True)
+            return out
+
+        with ThreadPoolExecutor(max_workers=min(len(ranges), os.cpu_count() or 1)) as ex:
+            pieces = list(ex.map(piece, enumerate(ranges)))
+        if len(pieces) == 1:
+            shutil.move(str(pieces[0]), out_preview)
+        else:
+            lst = write_concat_list(pieces, td / "pieces.txt")
+            run_ffmpeg(["ffmpeg", "-y", "-hide_banner", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                        "-i", str(lst), "-c", "copy", "-movflags", "+faststart", str(out_preview)], tag="preview")
+    print(f"[preview] saved {out_preview} in {time.perf_counter() - t0:.1f}s", flush=True)
+    approved = {"plan": plan, "reframe": reframe, "intro_card_src": intro_card_src,
+                "intro_enabled": intro_enabled, **intro}
+    return out_preview.as_posix(), approved
+
+def render_cached(background_reddit1, audio_duration, target_dir_audio, target_name_audio,
+                  audio: dict | None = None,
+                  intro_card_src: Path | None = captions_b.INTRO_CARD_SRC,
+                  intro_enabled: bool = captions_b.INTRO_ENABLED,
+                  intro_secs: float = captions_b.INTRO_SECS,
+                  intro_fade: float = captions_b.INTRO_FADE,
+                  intro_scale: float = captions_b.INTRO_SCALE,
+                  intro_crop_bottom: float = captions_b.INTRO_CROP_BOTTOM,
+                  intro_offset_x: int = captions_b.INTRO_OFFSET_X,
+                  intro_offset_y: int = captions_b.INTRO_OFFSET_Y,
+                  intro_round_px: int = captions_b.INTRO_ROUND_PX,
+                  rng: random.Random | None = None, threads: int = 0,
+                  reframe: str = REFRAME_MODE, plan: dict | None = None, reuse_base: bool = True) -> str:
+    """
+    render_single_pass() split at the caption burn, for iterating on the caption look:
+    the uncaptioned base (background + reframe + voice) is cached (render_cache_b) and the
+    words come from the transcript cache, so changing FONT_SIZE, ANIM, MAX_WORDS_PER_CAP or
+    the intro card reruns only the burn — one encode, audio stream-copied.
+
+    Without `plan`, the newest cached base for this voiceover is reused (`reuse_base`), so a
+    restyle keeps the same background window; a fresh voiceover renders and caches a base first.
+    """
+    audio_path, audio_hash, ass_text, out_video, intro_img = _prepare_render(
+        target_dir_audio, target_name_audio, audio, intro_card_src, intro_enabled)
+    intro = _intro_kwargs(intro_secs, intro_fade, intro_scale, intro_crop_bottom,
+                          intro_offset_x, intro_offset_y, intro_round_px)
+    duration = float(audio_duration)
+    if plan is None and reuse_base and (meta := latest_base(audio_hash, reframe)) is not None:
+        plan, duration = _plan_from_json(meta["plan"]), float(meta["duration"])
+    plan = plan or _background_plan(background_reddit1, duration, rng)
+    key = base_key(plan, duration, audio_hash, reframe, (OUT_W, OUT_H))
+
+    t0 = time.perf_counter()
+    base = cached_base(key)
+    if base is None:
+        bg_input, bg_tmp = _plan_input(plan, 0.0, duration)
+        RENDER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        base_tmp = RENDER_CACHE_DIR / f"{key}.tmp.mp4"
+        sendcmd = None
+        try:
+            sendcmd = _reframe_sendcmd(plan, duration, reframe, base_tmp.with_suffix(".crop.txt"))
+            tl = Timeline(duration=duration, width=OUT_W, height=OUT_H, reframe=reframe, sendcmd=sendcmd,
+                          video=[Clip(input_args=bg_input)], audio=[Clip(audio_path)])
+            run_ffmpeg(compile_timeline(tl, base_tmp, video_args=encoder_args(enc=BASE_ENC),
+                                        audio_args=("-c:a", AUDIO_CODEC, "-b:a", AUDIO_BITRATE),
+                                        threads=threads), tag="base")
+            base = store_base(key, base_tmp, {"plan": plan, "duration": duration, "audio_hash": audio_hash,
+                                              "reframe": reframe, "audio": audio_path})
+            _record_plan(plan, duration)
+        finally:
+            if bg_tmp is not None:
+                bg_tmp.unlink(missing_ok=True)
+            if sendcmd is not None:
+                sendcmd.unlink(missing_ok=True)
+            base_tmp.unlink(missing_ok=True)
+        print(f"[render] base {key} rendered in {time.perf_counter() - t0:.1f}s", flush=True)
+    else:
+        print(f"[render] base {key} from cache", flush=True)
+
+    t1 = time.perf_counter()
+    out_tmp = out_video.with_suffix(".tmp.mp4")
+    ass_path = None
+    try:
+        ass_path = write_ass_temp(ass_text)
+        tl = Timeline(duration=duration, width=OUT_W, height=OUT_H, reframe=None,
+                      video=[Clip(base)], audio=[Clip(base)], captions=[CaptionLayer(ass_path)])
+        if intro_img is not None and intro_secs > 0:
+            tl.overlays.append(_intro_overlay(intro_img, intro))
+        run_ffmpeg(compile_timeline(tl, out_tmp, audio_args=("-c:a", "copy"), threads=threads), tag="burn")
+        out_tmp.replace(out_video)
+    finally:
+        if ass_path and ass_path.exists():
+            ass_path.unlink()
+        if out_tmp.exists():
+            out_tmp.unlink()
+    print(f"[render] saved {out_video} in {time.perf_counter() - t0:.1f}s (burn {time.perf_counter() - t1:.1f}s)",
+          flush=True)
+    return out_video.as_posix()
+
+def render_many(jobs: list[dict], max_workers: int | None = None) -> list[str]:
+    """
+    Run several headless_make_edits() at once. Each job is a dict of its keyword arguments.
+    Cores are split evenly between workers (x264 -threads) so jobs don't oversubscribe the box.
+    Returns the export titles in job order.
+    """
+    workers = max_workers or min(len(jobs), max(1, (os.cpu_count() or 1) // 4)) or 1
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futs = [ex.submit(headless_make_edits, **{"threads": threads, **job}) for job in jobs]
+        return [f.result() for f in futs]
+
+if __name__ == "__main__":
+    # restyle: re-burn captions/intro card over the cached base for a voiceover
+    #   python render_b.py /path/to/voice.wav
+    import sys
+    voice = Path(sys.argv[1]).expanduser().resolve()
+    voice_duration = probe_duration(voice)
+    if voice_duration is None:
+        raise SystemExit(f"could not read a duration from {voice} (missing, not audio, or ffprobe not on PATH)")
+    print(render_cached(None, voice_duration, voice.parent.as_posix(), voice.name))
@@ -0,0 +1,60 @@
+# beta/render_cache_b.py
+"""
+Cache of uncaptioned base renders (background window, reframe and voice, no captions or
+intro card), so a caption or card restyle only reruns the final burn.
+
+A base is keyed by background, crop start, duration, audio hash, reframe mode and canvas:
+    RENDER_CACHE_DIR/<key>.mp4   the base video
+    RENDER_CACHE_DIR/<key>.json  what produced it (plan, duration, audio hash, reframe)
+The newest RENDER_CACHE_MAX bases are kept.
+"""
+import os, json, hashlib
+from pathlib import Path
+
+RENDER_CACHE_DIR = Path(os.getenv("RENDER_CACHE_DIR", "~/.cache/reddit1_footage/base_renders")).expanduser()
+RENDER_CACHE_MAX = int(os.getenv("RENDER_CACHE_MAX", "20"))
+BASE_ENC         = {"vcodec": "libx264", "preset": "veryfast", "crf": 12}   # near-transparent intermediate
+
+def base_key(plan: dict, duration: float, audio_hash: str, reframe: str, size: tuple[int, int]) -> str:
+    ident = json.dumps([plan["name"], round(float(plan["start"]), 3), round(float(duration), 3),
+                        audio_hash, reframe, list(size)])
+    return hashlib.blake2b(ident.encode(), digest_size=12).hexdigest()
+
+def cached_base(key: str) -> Path | None:
+    path = RENDER_CACHE_DIR / f"{key}.mp4"
+    if not (path.exists() and path.with_suffix(".json").exists()):
+        return None
+    os.utime(path)              # most recently used survives prune()
+    return path
+
+def store_base(key: str, tmp_video: Path, meta: dict) -> Path:
+    """Move a finished base render into the cache with its metadata, then prune."""
+    RENDER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = RENDER_CACHE_DIR / f"{key}.mp4"
+    os.replace(tmp_video, path)
+    path.with_suffix(".json").write_text(json.dumps(meta, indent=1, default=str), encoding="utf-8")
+    prune()
+    return path
+
+def latest_base(audio_hash: str, reframe: str) -> dict | None:
+    """Metadata of the newest cached base for this voiceover and reframe, if any."""
+    best, best_t = None, -1.0
+    for meta_path in RENDER_CACHE_DIR.glob("*.json"):
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if meta.get("audio_hash") != audio_hash or meta.get("reframe") != reframe:
+            continue
+        if not meta_path.with_suffix(".mp4").exists():
+            continue
+        t = meta_path.stat().st_mtime
+        if t > best_t:
+            best, best_t = meta, t
+    return best
+
+def prune(keep: int = RENDER_CACHE_MAX) -> None:
+    bases = sorted(RENDER_CACHE_DIR.glob("*.mp4"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in bases[keep:]:
+        old.unlink(missing_ok=True)
+        old.with_suffix(".json").unlink(missing_ok=True)
@@ -0,0 +1,124 @@
+# beta/screen_probe_b.py
+"""
+Screen-state probes for the Filmora driver: named colour checks at fixed screen points,
+all evaluated against ONE screenshot per poll with NumPy.
+
+Every probe's pixels are gathered into a single (N, 4) array, compared to their targets in
+one vectorized pass, and reduced per probe with reduceat, so a poll costs one capture plus
+a few microseconds instead of a screenshot, a mouse move and a getpixel loop per check.
+
+Probes are evaluated against any RGBA array, so saved PNGs work as fixtures:
+  python screen_probe_b.py capture.png [more.png ...]
+"""
+import sys, time
+from typing import NamedTuple
+import numpy as np
+
+class Probe(NamedTuple):
+    name: str
+    x: int                      # centre, in screen points (pyautogui coordinates)
+    y: int
+    size: int                   # side of the square region
+    rgba: tuple                 # target colour; alpha defaults to 255
+    tol: float                  # per-channel tolerance as a fraction of 255
+    mode: str = "any"           # "any" pixel matches, or "all" pixels match
+
+# The checks editing_b used to make one screenshot at a time.
+PROBES = {
+    "startup_screen": Probe("startup_screen", 265, 180, 4, (0, 240, 214), 0.20, "all"),
+    "main_window":    Probe("main_window", 908, 379, 4, (4, 172, 255), 0.20, "any"),
+    "resolution_ask": Probe("resolution_ask", 932, 512, 2, (86, 231, 199, 255), 0.15, "any"),
+    "exporting":      Probe("exporting", 392, 485, 30, (86, 231, 199, 255), 0.05, "any"),
+}
+
+def to_rgba_array(img) -> np.ndarray:
+    """PIL image (any mode) or array -> (H, W, 4) uint8."""
+    if isinstance(img, np.ndarray):
+        a = img
+    else:
+        a = np.asarray(img.convert("RGBA"))
+    if a.ndim == 3 and a.shape[2] == 3:
+        a = np.concatenate([a, np.full(a.shape[:2] + (1,), 255, dtype=a.dtype)], axis=2)
+    return a.astype(np.uint8, copy=False)
+
+def load_fixture(path) -> np.ndarray:
+    from PIL import Image
+    with Image.open(path) as im:
+        return to_rgba_array(im)
+
+def capture() -> tuple[np.ndarray, float]:
+    """One full-screen grab -> (RGBA array, pixels-per-point scale, 2.0 on Retina)."""
+    import pyautogui
+    img = to_rgba_array(pyautogui.screenshot())
+    return img, img.shape[1] / float(pyautogui.size()[0])
+
+def _layout(probes: tuple, shape: tuple, scale: float):
+    """Flat pixel indices of every probe region, the per-pixel target/threshold and segment starts."""
+    h, w = shape[:2]
+    idx, tgt, thr, starts = [], [], [], []
+    n = 0
+    for p in probes:
+        half = p.size // 2
+        x0, y0 = int(round((p.x - half) * scale)), int(round((p.y - half) * scale))
+        side = max(1, int(round(p.size * scale)))
+        xs = np.clip(np.arange(x0, x0 + side), 0, w - 1)
+        ys = np.clip(np.arange(y0, y0 + side), 0, h - 1)
+        flat = (ys[:, None] * w + xs[None, :]).ravel()
+        idx.append(flat)
+        tgt.append(np.broadcast_to(np.array((tuple(p.rgba) + (255,))[:4], dtype=np.int16), (flat.size, 4)))
+        thr.append(np.full(flat.size, int(round(255 * p.tol)), dtype=np.int16))
+        starts.append(n)
+        n += flat.size
+    return np.concatenate(idx), np.concatenate(tgt), np.concatenate(thr), np.array(starts)
+
+def evaluate(probes, img: np.ndarray, scale: float = 1.0) -> dict:
+    """{probe name: bool} for every probe against one RGBA image."""
+    probes = tuple(probes.values()) if isinstance(probes, dict) else tuple(probes)
+    if not probes:
+        return {}
+    idx, tgt, thr, starts = _layout(probes, img.shape, scale)
+    px = img.reshape(-1, 4)[idx].astype(np.int16)
+    ok = (np.abs(px - tgt) <= thr[:, None]).all(axis=1)
+    any_hit = np.logical_or.reduceat(ok, starts)
+    all_hit = np.logical_and.reduceat(ok, starts)
+    return {p.name: bool(all_hit[i] if p.mode == "all" else any_hit[i]) for i, p in enumerate(probes)}
+
+def poll(probes=None, img: np.ndarray | None = None, scale: float = 1.0) -> dict:
+    """Capture once (unless `img` is given) and evaluate `probes` (default: PROBES)."""
+    if img is None:
+        img, scale = capture()
+    return evaluate(PROBES if probes is None else probes, img, scale)
+
+def wait_while(name: str, interval: float = 0.5, timeout: float | None = None) -> bool:
+    """Poll until probe `name` stops matching; False on timeout."""
+    t0 = time.monotonic()
+    while poll({name: PROBES[name]})[name]:
+        if timeout is not None and time.monotonic() - t0 > timeout:
+            return False
+        time.sleep(interval)
+    return True
+
+# ---------- editing_b compatibility ----------
+def detect_state(img: np.ndarray | None = None, scale: float = 1.0) -> int:
+    """0 = startup screen, 1 = main window needs full-screen, 2 = inside a project."""
+    hits = poll((PROBES["startup_screen"], PROBES["main_window"]), img, scale)
+    if hits["startup_screen"]:
+        return 0
+    return 1 if hits["main_window"] else 2
+
+def area_has_color_match(x: int, y: int, target_rgba=(86, 231, 199, 255), tol: float = 0.05,
+                         size: int = 30, img: np.ndarray | None = None, scale: float = 1.0) -> bool:
+    """True if ANY pixel in a size×size area centred at (x, y) is within tolerance of target_rgba."""
+    return poll((Probe("area", x, y, size, tuple(target_rgba), tol),), img, scale)["area"]
+
+def area_has_color_match_snipe(x: int, y: int, target_rgba=(86, 231, 199, 255), tol: float = 0.15,
+                               size: int = 2, img: np.ndarray | None = None, scale: float = 1.0) -> bool:
+    return area_has_color_match(x, y, target_rgba, tol, size, img, scale)
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        arr = load_fixture(path)
+        t0 = time.perf_counter()
+        res = evaluate(PROBES, arr)
+        dt = (time.perf_counter() - t0) * 1000
+        print(f"{path}: {res} | detect_state={detect_state(arr)} | {dt:.2f} ms")
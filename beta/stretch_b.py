@@ -0,0 +1,91 @@
+# beta/stretch_b.py
+"""
+Pitch-preserving time-stretch (phase vocoder, NumPy only) to fit a finished voiceover to a
+duration limit without re-synthesizing at another `speed`.
+
+All frames of a block are analysed, phase-advanced (cumsum) and overlap-added with array ops;
+blocks only exist to bound memory on long tracks, and the running phase is carried across them.
+"""
+import numpy as np
+
+N_FFT      = 1024          # ~43 ms at 24 kHz
+HOP        = N_FFT // 4    # synthesis hop (75% overlap)
+BLOCK      = 2048          # output frames processed per vectorized block
+MAX_RATE   = 1.25          # refuse to squeeze harder than this (speech turns chipmunky-fast)
+
+def _frames(xp: np.ndarray, idx: np.ndarray, win: np.ndarray) -> np.ndarray:
+    """rFFT of the analysis frames starting at HOP * idx (idx may repeat)."""
+    seg = xp[(idx * HOP)[:, None] + np.arange(N_FFT)[None, :]]
+    return np.fft.rfft(seg * win, axis=1)
+
+def time_stretch(x: np.ndarray, rate: float) -> np.ndarray:
+    """
+    Play `x` `rate` times faster (rate > 1 shortens) at the same pitch.
+    Output length is round(len(x) / rate).
+    """
+    x = np.asarray(x, dtype=np.float32)
+    if rate <= 0:
+        raise ValueError("rate must be > 0")
+    if abs(rate - 1.0) < 1e-6 or x.shape[0] == 0:
+        return x.copy()
+    win = np.hanning(N_FFT + 1)[:-1].astype(np.float32)
+    pad = N_FFT // 2
+    xp = np.pad(x, (pad, pad + N_FFT))
+    n_in = 1 + (xp.shape[0] - N_FFT) // HOP             # analysis frames available
+    t = np.arange(0, n_in - 1, rate)                    # fractional input frame per output frame
+    n_out = t.shape[0]
+    expected = 2 * np.pi * HOP * np.arange(N_FFT // 2 + 1) / N_FFT
+
+    out = np.zeros((n_out + N_FFT // HOP) * HOP, dtype=np.float32)
+    norm = np.zeros_like(out)
+    wsq = win * win
+    phase = None
+    for o0 in range(0, n_out, BLOCK):
+        tb = t[o0:o0 + BLOCK]
+        i0 = np.floor(tb).astype(np.int64)
+        frac = (tb - i0)[:, None]
+        s0, s1 = _frames(xp, i0, win), _frames(xp, i0 + 1, win)
+        mag = (1 - frac) * np.abs(s0) + frac * np.abs(s1)
+        dphi = np.angle(s1) - np.angle(s0) - expected
+        dphi -= 2 * np.pi * np.round(dphi / (2 * np.pi))
+        adv = dphi + expected
+        start = np.angle(s0[:1]) if phase is None else phase
+        acc = start + np.concatenate([np.zeros((1, adv.shape[1])), np.cumsum(adv[:-1], axis=0)])
+        phase = acc[-1:] + adv[-1:]
+        frames = np.fft.irfft(mag * np.exp(1j * acc), n=N_FFT, axis=1).astype(np.float32) * win
+        # overlap-add: each frame spans N_FFT/HOP hop-sized blocks
+        nb = frames.shape[0]
+        ob = out[o0 * HOP:(o0 + nb + N_FFT // HOP - 1) * HOP].reshape(-1, HOP)
+        nbk = norm[o0 * HOP:(o0 + nb + N_FFT // HOP - 1) * HOP].reshape(-1, HOP)
+        for j in range(N_FFT // HOP):
+            ob[j:j + nb] += frames[:, j * HOP:(j + 1) * HOP]
+            nbk[j:j + nb] += wsq[j * HOP:(j + 1) * HOP]
+    y = out / np.maximum(norm, 1e-3)
+    n_target = int(round(x.shape[0] / rate))
+    y = y[pad:pad + n_target]
+    if y.shape[0] < n_target:
+        y = np.pad(y, (0, n_target - y.shape[0]))
+    return y.astype(np.float32)
+
+def fit_to_duration(x: np.ndarray, rate_hz: int, target_sec: float, timings: dict | None = None,
+                    shrink_only: bool = True, max_rate: float = MAX_RATE) -> tuple[np.ndarray, float]:
+    """
+    Time-stretch `x` so it lasts `target_sec` (default: only if it is longer).
+    Scales the per-sentence timing map in place to match. Returns (audio, stretch_rate).
+    """
+    cur = x.shape[0] / float(rate_hz)
+    if target_sec <= 0 or cur <= 0:
+        return x, 1.0
+    rate = cur / target_sec
+    if shrink_only and rate <= 1.0:
+        return x, 1.0
+    if rate > max_rate:
+        raise ValueError(f"voiceover is {cur:.1f}s; fitting into {target_sec:.1f}s needs x{rate:.2f} "
+                         f"(> max_rate {max_rate}). Shorten the script instead.")
+    y = time_stretch(x, rate)
+    if timings is not None:
+        n = y.shape[0]
+        for s in timings["sentences"]:
+            s["start"] = min(n, int(round(s["start"] / rate)))
+            s["end"] = min(n, int(round(s["end"] / rate)))
+    return y, rate
@@ -0,0 +1,209 @@
+# beta/timeline_b.py
+"""
+Declarative edit timeline compiled to a single ffmpeg command.
+
+A Timeline is a canvas plus:
+  video     clips laid end to end (each with an in/out point), reframed to the canvas
+  audio     clips placed at a timeline position, each with its own gain, mixed together
+  overlays  images/videos composited on top inside an enable window (intro card, watermark)
+  captions  ASS layers burned in order (a second caption track is just another layer)
+
+compile_timeline() turns that into one filter graph and command line: identical inputs are
+opened once, in/out points become input seeks (not trim filters), a lone unity-gain audio
+clip at 0 is mapped straight through, and everything is encoded in one pass.
+
+A Timeline can also be a piece of a longer edit (render_b's parallel chunks and previews):
+with `offset` its video is stamped with the edit's clock while the captions, motion track and
+overlay windows are applied, then reset to 0, and overlays outside the piece are left out.
+
+    tl = Timeline(duration=42.0)
+    tl.video.append(Clip("bg.mp4", in_s=600, out_s=642))
+    tl.audio.append(Clip("voice.wav"))
+    tl.overlays.append(Overlay("card.png", end=3.0, scale=0.8, crop_bottom=0.25, round_px=45, fade_out=0.1))
+    tl.captions.append(CaptionLayer("captions.ass"))
+    run_ffmpeg(compile_timeline(tl, "out.mp4"))
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from reframe_b import reframe_graph
+from captions_b import ass_burn_chain
+from encoder_profile_b import encoder_args
+
+@dataclass
+class Clip:
+    """A span [in_s, out_s) of `src` (out_s None = to the end). `input_args` replaces the
+    default `-ss/-t -i src` (e.g. a concat-demuxer list); `start` is the timeline position
+    (audio only; video clips play back to back); `gain` is linear audio gain."""
+    src: str | Path | None = None
+    in_s: float = 0.0
+    out_s: float | None = None
+    start: float = 0.0
+    gain: float = 1.0
+    input_args: list[str] | None = None
+
+    def args(self) -> list[str]:
+        if self.input_args is not None:
+            return list(self.input_args)
+        seek = ["-ss", f"{self.in_s:.3f}"] if self.in_s else []
+        length = ["-t", f"{self.out_s - self.in_s:.3f}"] if self.out_s is not None else []
+        return [*seek, *length, "-i", str(self.src)]
+
+@dataclass
+class Overlay:
+    """An image (looped) or video composited over [start, end). `scale` is the width as a
+    fraction of the canvas; `x`/`y` are overlay expressions (default: centred + offsets)."""
+    src: str | Path
+    start: float = 0.0
+    end: float | None = None
+    scale: float = 1.0
+    crop_bottom: float = 0.0
+    round_px: int = 0
+    fade_out: float = 0.0
+    offset_x: int = 0
+    offset_y: int = 0
+    x: str | None = None
+    y: str | None = None
+    image: bool = True
+
+@dataclass
+class CaptionLayer:
+    ass_path: str | Path
+
+@dataclass
+class Timeline:
+    duration: float
+    width: int = 1080
+    height: int = 1920
+    reframe: str | None = "center"       # reframe_b mode; None = no reframe (video kept as is, or fitted)
+    fit: bool = False                    # with reframe None: scale/letterbox the video onto the canvas
+    sendcmd: Path | None = None          # reframe_b motion track for the video clips
+    offset: float = 0.0                  # edit time at which this timeline (a piece) starts
+    reframe_size: tuple[int, int] | None = None   # reframe here (the motion track's pixels), then scale to the canvas
+    video: list[Clip] = field(default_factory=list)
+    audio: list[Clip] = field(default_factory=list)
+    overlays: list[Overlay] = field(default_factory=list)
+    captions: list[CaptionLayer] = field(default_factory=list)
+
+class _Inputs:
+    """ffmpeg inputs, each distinct argument list opened once."""
+    def __init__(self):
+        self.args: list[list[str]] = []
+
+    def add(self, args: list[str]) -> int:
+        if args not in self.args:
+            self.args.append(args)
+        return self.args.index(args)
+
+    def flat(self) -> list[str]:
+        return [a for args in self.args for a in args]
+
+def _rounded_alpha(r: int) -> str:
+    return (f"if(lte(hypot("
+            f"if(lt(X,{r}),{r}-X,if(lt(W-X,{r}),{r}-(W-X),0)),"
+            f"if(lt(Y,{r}),{r}-Y,if(lt(H-Y,{r}),{r}-(H-Y),0))"
+            f"),{r}),255,0)")
+
+def _overlay_graph(ov: Overlay, i: int, idx: int, base: str, out: str, tl: Timeline) -> str:
+    end = min(tl.offset + tl.duration, tl.offset + tl.duration if ov.end is None else ov.end)
+    w = max(2, int(round(tl.width * max(0.05, min(2.0, ov.scale)))) // 2 * 2)
+    keep = max(0.0, min(1.0, 1.0 - ov.crop_bottom))
+    chain = ["format=rgba"]
+    if keep < 1.0:
+        chain.append(f"crop=iw:ih*{keep}:0:0")
+    chain.append(f"scale={w}:-1")
+    if ov.round_px > 0:
+        chain.append(f"geq=r='r(X,Y)':g='g(X,Y)':b='b(X,Y)':a='{_rounded_alpha(int(ov.round_px))}'")
+    fade = max(0.0, min(ov.fade_out, end - ov.start))
+    if fade > 0:
+        chain.append(f"fade=t=out:st={end - ov.start - fade}:d={fade}:alpha=1")
+    if ov.start:
+        chain.append(f"setpts=PTS+{ov.start:.6f}/TB")
+    x = ov.x or f"(main_w-overlay_w)/2+{int(ov.offset_x)}"
+    y = ov.y or f"(main_h-overlay_h)/2+{int(ov.offset_y)}"
+    return (f"[{idx}:v]{','.join(chain)}[ov{i}];"
+            f"[{base}][ov{i}]overlay=x={x}:y={y}:enable='between(t\\,{ov.start}\\,{end})'[{out}]")
+
+def compile_graph(tl: Timeline) -> tuple[list[str], str, list[str]]:
+    """(input args, filter_complex, -map args) for `tl`."""
+    if not tl.video:
+        raise ValueError("timeline has no video clips")
+    inputs, parts = _Inputs(), []
+
+    # video track: each clip reframed to the canvas, played back to back (a motion track
+    # is timed from 0 of the edit, so it only drives a single-clip track)
+    single = len(tl.video) == 1
+    sendcmd = tl.sendcmd if single else None
+    shift = f"setpts=PTS+{tl.offset:.6f}/TB" if tl.offset else None
+    rw, rh = tl.reframe_size or (tl.width, tl.height)
+    for n, clip in enumerate(tl.video):
+        src = f"{inputs.add(clip.args())}:v"
+        if shift and single:                          # on the edit's clock before the motion crop
+            parts.append(f"[{src}]{shift}[vs0]")
+            src, shift = "vs0", None
+        if tl.reframe is None:
+            fit = (f"scale={tl.width}:{tl.height}:force_original_aspect_ratio=decrease,"
+                   f"pad={tl.width}:{tl.height}:(ow-iw)/2:(oh-ih)/2,setsar=1") if tl.fit else "null"
+            parts.append(f"[{src}]{fit}[vc{n}]")
+            continue
+        parts.append(reframe_graph(tl.reframe, src, f"vc{n}", rw, rh, sendcmd,
+                                   tag="rf" if n == 0 else f"rf{n}"))
+    if not single:
+        parts.append("".join(f"[vc{n}]" for n in range(len(tl.video))) + f"concat=n={len(tl.video)}:v=1:a=0[v0]")
+        cur = "v0"
+    else:
+        cur = "vc0"
+    if shift:
+        parts.append(f"[{cur}]{shift}[vsh]")
+        cur = "vsh"
+    if tl.reframe is not None and (rw, rh) != (tl.width, tl.height):
+        parts.append(f"[{cur}]scale={tl.width}:{tl.height}[vsc]")
+        cur = "vsc"
+
+    # captions, then overlays on top (the card covers the captions while it shows); a
+    # piece only carries the overlays that show inside it
+    for n, layer in enumerate(tl.captions):
+        parts.append(f"[{cur}]{ass_burn_chain(Path(layer.ass_path))}[cap{n}]")
+        cur = f"cap{n}"
+    t_end = tl.offset + tl.duration
+    for n, ov in enumerate(tl.overlays):
+        end = t_end if ov.end is None else ov.end
+        if end <= tl.offset or ov.start >= t_end:
+            continue
+        loop = ["-loop", "1", "-t", f"{end - ov.start + 0.5:.3f}"] if ov.image else []
+        idx = inputs.add([*loop, "-i", str(ov.src)])
+        parts.append(_overlay_graph(ov, n, idx, cur, f"o{n}", tl))
+        cur = f"o{n}"
+    parts.append(f"[{cur}]{'setpts=PTS-STARTPTS,' if tl.offset else ''}format=yuv420p[vout]")
+    maps = ["-map", "[vout]"]
+
+    # audio: straight map for a lone unity clip at 0, else per-clip gain/delay and a mix
+    if len(tl.audio) == 1 and tl.audio[0].gain == 1.0 and not tl.audio[0].start:
+        maps += ["-map", f"{inputs.add(tl.audio[0].args())}:a:0"]
+    elif tl.audio:
+        for n, clip in enumerate(tl.audio):
+            idx = inputs.add(clip.args())
+            chain = ["asetpts=PTS-STARTPTS"]
+            if clip.gain != 1.0:
+                chain.append(f"volume={clip.gain}")
+            if clip.start:
+                chain.append(f"adelay={int(round(clip.start * 1000))}:all=1")
+            parts.append(f"[{idx}:a]{','.join(chain)}[a{n}]")
+        if len(tl.audio) > 1:
+            parts.append("".join(f"[a{n}]" for n in range(len(tl.audio)))
+                         + f"amix=inputs={len(tl.audio)}:normalize=0:duration=longest[aout]")
+        else:
+            parts[-1] = parts[-1][:-len("[a0]")] + "[aout]"
+        maps += ["-map", "[aout]"]
+    return inputs.flat(), ";".join(parts), maps
+
+def compile_timeline(tl: Timeline, out_path: str | Path, video_args: list[str] | None = None,
+                     audio_args: tuple[str, ...] = ("-c:a", "aac", "-b:a", "192k"),
+                     threads: int = 0) -> list[str]:
+    """Complete ffmpeg command rendering `tl` to `out_path` in one pass."""
+    inputs, graph, maps = compile_graph(tl)
+    return ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error", *inputs,
+            "-filter_complex", graph, *maps,
+            *(video_args or encoder_args("render")), "-threads", str(threads),
+            *(audio_args if tl.audio else ("-an",)),
+            "-t", f"{tl.duration:.3f}", "-movflags", "+faststart", str(out_path)]
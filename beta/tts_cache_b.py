@@ -0,0 +1,90 @@
+# beta/tts_cache_b.py
+"""
+Persistent per-clause TTS cache.
+
+voice_b synthesizes a script clause by clause (split at , ; : — and sentence ends), and each
+clause's audio is stored as a float32 .npy file under CACHE_DIR, keyed by
+sha1(normalized clause text, voice, speed, model fingerprint). Pauses between clauses are
+laid in afterwards, so they never enter the cache. Hits are memory-mapped so the
+only copy made is the one into compile_audio's output track. Eviction is LRU by total
+size: hits bump the file mtime, eviction removes the oldest files first.
+"""
+import os, re, hashlib, unicodedata, functools
+from pathlib import Path
+import numpy as np
+
+CACHE_DIR       = Path(os.getenv("KOKORO_TTS_CACHE", "~/.cache/kokoro_tts_cache")).expanduser()
+CACHE_MAX_BYTES = int(os.getenv("KOKORO_TTS_CACHE_MAX_MB", "2048")) * 1024 * 1024
+
+def normalize_text(text: str) -> str:
+    """NFC + collapsed whitespace, so cosmetic edits don't miss the cache."""
+    return unicodedata.normalize("NFC", re.sub(r"\s+", " ", (text or "").strip()))
+
+@functools.lru_cache(maxsize=8)
+def _fingerprint(path: str, size: int, mtime_ns: int) -> str:
+    h = hashlib.sha1(f"{size}".encode())
+    with open(path, "rb") as f:
+        h.update(f.read(1 << 20))            # first MiB
+        if size > (2 << 20):
+            f.seek(-(1 << 20), os.SEEK_END)   # last MiB
+            h.update(f.read(1 << 20))
+    return h.hexdigest()[:16]
+
+def model_fingerprint(path: str | Path) -> str:
+    """Cheap content hash of the model file (size + head + tail); memoized per mtime."""
+    st = os.stat(path)
+    return _fingerprint(str(path), st.st_size, st.st_mtime_ns)
+
+def cache_key(text: str, voice: str, speed: float, model_hash: str) -> str:
+    raw = "\x1f".join([normalize_text(text), str(voice), f"{float(speed):.4f}", model_hash])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+def _path_for(key: str) -> Path:
+    return CACHE_DIR / key[:2] / f"{key}.npy"
+
+def cache_get(key: str) -> np.ndarray | None:
+    """Return a read-only memmap of the cached samples, or None on a miss."""
+    p = _path_for(key)
+    try:
+        a = np.load(p, mmap_mode="r")
+    except (FileNotFoundError, ValueError, OSError):
+        return None
+    try:
+        os.utime(p, None)  # LRU touch
+    except OSError:
+        pass
+    return a
+
+def cache_put(key: str, audio: np.ndarray) -> None:
+    p = _path_for(key)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_name(f"{p.stem}.{os.getpid()}.tmp.npy")
+    np.save(tmp, np.ascontiguousarray(audio, dtype=np.float32))
+    os.replace(tmp, p)  # atomic, so concurrent runs never read half a file
+
+def cache_evict(max_bytes: int = CACHE_MAX_BYTES) -> int:
+    """Delete least-recently-used entries until the cache fits in max_bytes. Returns bytes freed."""
+    if not CACHE_DIR.exists():
+        return 0
+    entries = []
+    total = 0
+    for p in CACHE_DIR.glob("*/*.npy"):
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, p))
+        total += st.st_size
+    freed = 0
+    if total <= max_bytes:
+        return 0
+    for _mtime, size, p in sorted(entries):
+        try:
+            p.unlink()
+        except FileNotFoundError:
+            continue
+        total -= size
+        freed += size
+        if total <= max_bytes:
+            break
+    return freed
@@ -1,7 +1,9 @@
 # alpha/voice.py
 print('Hi from alpha/voice.py')
 
-import os, glob, io, time
+import os, glob, io, time, json, shutil, subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import soundfile as sf
 
@@ -14,16 +16,44 @@ except Exception:
         def __init__(self, *_a, **_k): ...
     def display(*_a, **_k): ...
 
+import onnxruntime as ort
 from kokoro_onnx import Kokoro, SAMPLE_RATE
+from kokoro_onnx.tokenizer import Tokenizer
+
+from first_sentence_b import split_sentences, split_clauses
+from tts_cache_b import cache_key, cache_get, cache_put, cache_evict, model_fingerprint
+from loudness_b import master_voiceover, limit_true_peak, TARGET_LUFS
+from stretch_b import fit_to_duration
+from handoff_b import publish_audio
+from phoneme_cache_b import phonemize_cached, cache_stats
 
 # ----- asset discovery -----
-def _resolve_kokoro_assets():
-    print("[kokoro] resolving asset paths…", flush=True)
-    m = os.getenv("KOKORO_MODEL")
+KOKORO_ASSET_DIR = os.path.expanduser("~/.cache/kokoro_assets")
+
+# Model variants (file names as published with kokoro-onnx v1.0), looked up in KOKORO_ASSET_DIR.
+# bench_variants_b.py measures speed / memory / audio difference of each against fp32.
+MODEL_VARIANTS = {
+    "fp32": "kokoro-v1.0.onnx",
+    "fp16": "kokoro-v1.0.fp16.onnx",
+    "int8": "kokoro-v1.0.int8.onnx",
+}
+DEFAULT_VARIANT = os.getenv("KOKORO_VARIANT", "fp32")
+# Per-channel choice, keyed like upload_youtube2(channel_api_json=...)
+CHANNEL_MODEL_VARIANT = {
+    "whatreallyhappened.json": "fp32",
+}
+
+def variant_for_channel(channel_api_json: str | None) -> str:
+    return CHANNEL_MODEL_VARIANT.get(channel_api_json or "", DEFAULT_VARIANT)
+
+def _resolve_kokoro_assets(variant: str | None = None):
+    print(f"[kokoro] resolving asset paths… | variant={variant or DEFAULT_VARIANT}", flush=True)
+    # KOKORO_MODEL stands in for the default variant; only a different variant overrides it
+    m = os.getenv("KOKORO_MODEL") if variant in (None, DEFAULT_VARIANT) else None
     v = os.getenv("KOKORO_VOICES")
 
     def pick(patterns):
-        base = os.path.expanduser("~/.cache/kokoro_assets")
+        base = KOKORO_ASSET_DIR
         for pat in patterns:
             hits = sorted(glob.glob(os.path.join(base, pat)))
             if hits:
@@ -31,8 +61,12 @@ def _resolve_kokoro_assets():
         return None
 
     if not m or not os.path.exists(m):
-        print("[kokoro] env KOKORO_MODEL not set or missing; searching ~/.cache/kokoro_assets/*.onnx", flush=True)
-        m = pick(["*.onnx"])
+        variant = variant or DEFAULT_VARIANT
+        if variant not in MODEL_VARIANTS:
+            raise KeyError(f"Unknown Kokoro variant {variant!r}; choose from {sorted(MODEL_VARIANTS)}")
+        m = os.path.join(KOKORO_ASSET_DIR, MODEL_VARIANTS[variant])
+        if not os.path.exists(m):
+            raise FileNotFoundError(f"Kokoro {variant} model not found: {m}")
     if not v or not os.path.exists(v):
         print("[kokoro] env KOKORO_VOICES not set or missing; searching ~/.cache/kokoro_assets/*voices*.* / voices.* / *.bin / *.json", flush=True)
         v = pick(["*voices*.*", "voices.*", "*.bin", "*.json"])
@@ -48,10 +82,96 @@ def _resolve_kokoro_assets():
     print(f"[kokoro] using voices: {v}", flush=True)
     return m, v
 
-MODEL_PATH, VOICES_PATH = _resolve_kokoro_assets()
-print("[kokoro] initializing TTS engine…", flush=True)
-_TTS = Kokoro(MODEL_PATH, VOICES_PATH)
-print("[kokoro] TTS engine initialized.", flush=True)
+# ----- lazy engine + ONNX Runtime tuning -----
+# Saved by bench_ort_b.py; env vars KOKORO_INTRA_OP / KOKORO_INTER_OP / KOKORO_GRAPH_OPT /
+# KOKORO_MEM_ARENA / KOKORO_EXEC_MODE override it for a single run.
+ORT_PROFILE_PATH = Path(os.path.expanduser("~/.cache/kokoro_assets/ort_profile.json"))
+ORT_DEFAULTS = {
+    "intra_op_threads": 0,         # 0 = let ORT decide (physical cores)
+    "inter_op_threads": 0,
+    "graph_opt": "all",            # disable | basic | extended | all
+    "mem_arena": True,             # CPU memory arena + memory pattern planning
+    "exec_mode": "sequential",     # sequential | parallel (inter_op only matters for parallel)
+}
+_GRAPH_OPT = {
+    "disable":  ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic":    ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all":      ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+
+_ASSETS = {}   # variant -> (model_path, voices_path)
+_TTS = {}      # variant -> Kokoro
+_TOKENIZER = None
+
+def load_ort_settings() -> dict:
+    """Defaults <- saved benchmark profile <- env overrides."""
+    cfg = dict(ORT_DEFAULTS)
+    if ORT_PROFILE_PATH.exists():
+        try:
+            saved = json.loads(ORT_PROFILE_PATH.read_text(encoding="utf-8"))
+            cfg.update({k: v for k, v in saved.get("settings", {}).items() if k in ORT_DEFAULTS})
+        except Exception as e:
+            print(f"[kokoro] ignoring unreadable ORT profile {ORT_PROFILE_PATH}: {e}", flush=True)
+    env = {
+        "intra_op_threads": ("KOKORO_INTRA_OP", int),
+        "inter_op_threads": ("KOKORO_INTER_OP", int),
+        "graph_opt":        ("KOKORO_GRAPH_OPT", str),
+        "mem_arena":        ("KOKORO_MEM_ARENA", lambda x: x.strip().lower() not in ("0", "false", "no")),
+        "exec_mode":        ("KOKORO_EXEC_MODE", str),
+    }
+    for k, (var, cast) in env.items():
+        if os.getenv(var):
+            cfg[k] = cast(os.getenv(var))
+    return cfg
+
+def save_ort_profile(settings: dict, extra: dict | None = None) -> Path:
+    ORT_PROFILE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"settings": {k: settings[k] for k in ORT_DEFAULTS}, **(extra or {})}
+    ORT_PROFILE_PATH.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return ORT_PROFILE_PATH
+
+def make_session_options(settings: dict) -> ort.SessionOptions:
+    so = ort.SessionOptions()
+    so.intra_op_num_threads = int(settings["intra_op_threads"])
+    so.inter_op_num_threads = int(settings["inter_op_threads"])
+    so.graph_optimization_level = _GRAPH_OPT[str(settings["graph_opt"]).lower()]
+    so.enable_cpu_mem_arena = bool(settings["mem_arena"])
+    so.enable_mem_pattern = bool(settings["mem_arena"])
+    so.execution_mode = (ort.ExecutionMode.ORT_PARALLEL if str(settings["exec_mode"]).lower() == "parallel"
+                         else ort.ExecutionMode.ORT_SEQUENTIAL)
+    return so
+
+def kokoro_assets(variant: str | None = None) -> tuple[str, str]:
+    """(model_path, voices_path) for `variant`. None or DEFAULT_VARIANT use KOKORO_MODEL when it
+    points at an existing file, else the variant's file in KOKORO_ASSET_DIR."""
+    if variant not in _ASSETS:
+        _ASSETS[variant] = _resolve_kokoro_assets(variant)
+    return _ASSETS[variant]
+
+def build_tts(settings: dict | None = None, variant: str | None = None) -> Kokoro:
+    """Create a Kokoro engine for `variant` on an ONNX Runtime session built from `settings`."""
+    settings = settings or load_ort_settings()
+    model, voices = kokoro_assets(variant)
+    providers = [os.getenv("ONNX_PROVIDER", "CPUExecutionProvider")]
+    print(f"[kokoro] initializing TTS engine… | ort={settings} providers={providers}", flush=True)
+    sess = ort.InferenceSession(model, sess_options=make_session_options(settings), providers=providers)
+    tts = Kokoro.from_session(sess, voices)
+    print("[kokoro] TTS engine initialized.", flush=True)
+    return tts
+
+def get_tts(variant: str | None = None) -> Kokoro:
+    """The shared engine for `variant`, created on first synthesis rather than at import."""
+    if variant not in _TTS:
+        _TTS[variant] = build_tts(variant=variant)
+    return _TTS[variant]
+
+def get_tokenizer() -> Tokenizer:
+    """Standalone espeak tokenizer (no ONNX session), created on first phonemization."""
+    global _TOKENIZER
+    if _TOKENIZER is None:
+        _TOKENIZER = Tokenizer()
+    return _TOKENIZER
 
 def _to_mono_float32(y):
     if isinstance(y, (list, tuple)) and len(y) > 0:
@@ -61,19 +181,195 @@ def _to_mono_float32(y):
         a = np.mean(a, axis=0).astype(np.float32)
     return a
 
-def compile_audio(text: str, voice: str = "am_adam", speed: float = 1.05, rate: int = SAMPLE_RATE):
-    print(f"[kokoro] synth start | voice={voice} speed={speed} sr={rate} text_len={len(text)}", flush=True)
+# ----- output encodings -----
+# name -> (container, subtype, suffix). "aac" is encoded by ffmpeg as ADTS so it can be
+# stream-copied into the final MP4 (-c:a copy) without another encode.
+AUDIO_FORMATS = {
+    "wav_f32": ("WAV",  "FLOAT",  ".wav"),   # legacy: 4 bytes/sample
+    "wav16":   ("WAV",  "PCM_16", ".wav"),
+    "flac":    ("FLAC", "PCM_16", ".flac"),
+    "opus":    ("OGG",  "OPUS",   ".ogg"),
+    "aac":     ("ADTS", "AAC",    ".aac"),
+}
+# Which encoding each pipeline stage consumes
+STAGE_FORMATS = {
+    "edit":    "wav16",   # editor import (Filmora / headless edit)
+    "mux":     "aac",     # muxed straight into the final MP4
+    "archive": "flac",    # lossless, ~half of PCM16
+}
+AAC_BITRATE = "160k"
+
+def audio_suffix(fmt: str) -> str:
+    return AUDIO_FORMATS[STAGE_FORMATS.get(fmt, fmt)][2]
+
+def encode_audio(audio: np.ndarray, rate: int, fmt: str = "wav16") -> bytes:
+    """Encode mono float32 samples to `fmt` (a key of AUDIO_FORMATS or STAGE_FORMATS)."""
+    fmt = STAGE_FORMATS.get(fmt, fmt)
+    container, subtype, _ = AUDIO_FORMATS[fmt]
+    if fmt == "aac":
+        if not shutil.which("ffmpeg"):
+            raise RuntimeError("ffmpeg not found on PATH; needed for AAC output")
+        cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error",
+               "-f", "f32le", "-ar", str(rate), "-ac", "1", "-i", "pipe:0",
+               "-c:a", "aac", "-b:a", AAC_BITRATE, "-f", "adts", "pipe:1"]
+        run = subprocess.run(cmd, input=np.ascontiguousarray(audio, dtype="<f4").tobytes(),
+                             capture_output=True, check=False)
+        if run.returncode != 0:
+            raise RuntimeError(f"ffmpeg AAC encode failed: {run.stderr.decode(errors='replace')[-500:]}")
+        return run.stdout
+    buf = io.BytesIO()
+    # Opus uses libsndfile's default VBR quality (compression_level needs soundfile >= 0.13)
+    with sf.SoundFile(buf, mode="w", samplerate=rate, channels=1, format=container, subtype=subtype) as f:
+        f.write(audio)
+    return buf.getvalue()
+
+# ----- pause engine -----
+# Each clause is synthesized on its own (Kokoro trims its edges), then exact silence is laid
+# after it according to the punctuation that ended it. Text is no longer rewritten to coax
+# pauses out of the model (clean_script_text(replace_commas=False)).
+PAUSE_SEC = {
+    ",": 0.14,
+    ";": 0.24,
+    ":": 0.22,
+    "—": 0.20,
+    ".": 0.34,
+    "!": 0.34,
+    "?": 0.38,
+    "…": 0.55,
+    "":  0.30,   # sentence without terminal punctuation
+}
+LANG = "en-us"
+
+def prepare_script(text: str, lang: str = LANG, variant: str | None = None) -> list[dict]:
+    """
+    Split `text` into sentences and clauses. The result is voice-independent, so one prepared
+    script can be rendered in any voice/speed:
+        [{"text": sentence, "clauses": [{"text", "lang", "phonemes", "pause"}, ...]}, ...]
+    "phonemes" stays None until a clause misses the TTS cache (clause_phonemes), so a fully
+    cached rerun never runs espeak or builds the ONNX session. `variant` is accepted for
+    call-site symmetry with render_prepared; phonemes don't depend on it.
+    """
+    prepared = []
+    for s in split_sentences(text):
+        clauses = [{"text": c, "lang": lang, "phonemes": None, "pause": PAUSE_SEC.get(mark, PAUSE_SEC[""])}
+                   for c, mark in split_clauses(s)]
+        if clauses:
+            prepared.append({"text": s, "clauses": clauses})
+    return prepared
+
+def clause_phonemes(cl: dict) -> str:
+    """Phonemes of a prepared clause, phonemized (through phoneme_cache_b) on first use and kept."""
+    if cl["phonemes"] is None:
+        cl["phonemes"] = phonemize_cached(get_tokenizer(), cl["text"], cl["lang"])
+    return cl["phonemes"]
+
+def _synth(phonemes: str, voice: str, speed: float, variant: str | None = None) -> np.ndarray:
+    y = get_tts(variant).create(phonemes, voice=voice, speed=speed, is_phonemes=True)  # ndarray or (L,R)
+    return _to_mono_float32(y)
+
+def render_prepared(prepared: list[dict], voice: str = "am_adam", speed: float = 1.05, rate: int = SAMPLE_RATE,
+                    use_cache: bool = True, target_lufs: float | None = TARGET_LUFS,
+                    variant: str | None = None, max_duration: float | None = None) -> tuple[np.ndarray, dict]:
+    """
+    Synthesize a prepare_script() result into (mono float32 track, timing map).
+    If the track is longer than `max_duration` seconds it is time-stretched (pitch kept)
+    to fit, and the timing map is rescaled to match.
+    """
+    tag = f"{voice}@{speed}" + (f"/{variant}" if variant else "")
     t0 = time.perf_counter()
-    y = _TTS.create(text, voice=voice, speed=speed)  # ndarray or (L,R)
+    model_hash = model_fingerprint(kokoro_assets(variant)[0]) if use_cache else None
+    units, hits = [], 0   # (sentence index, samples, pause samples) per clause, in order
+    for si, p in enumerate(prepared):
+        for cl in p["clauses"]:
+            key = cache_key(cl["text"], voice, speed, model_hash) if use_cache else None
+            c = cache_get(key) if use_cache else None
+            if c is None:
+                c = _synth(clause_phonemes(cl), voice, speed, variant)
+                if use_cache:
+                    cache_put(key, c)
+            else:
+                hits += 1
+            units.append((si, c, int(round(cl["pause"] * rate))))
     t1 = time.perf_counter()
-    try:
-        y_shape = np.asarray(y).shape
-    except Exception:
-        y_shape = "<unknown>"
-    print(f"[kokoro] synth done in {(t1 - t0)*1000:.0f} ms | raw_shape={y_shape}", flush=True)
+    st = cache_stats()
+    print(f"[kokoro] {tag} synth done in {(t1 - t0)*1000:.0f} ms | cache hits={hits}/{len(units)} | "
+          f"phoneme sentence hit rate={st['sentence_hit_rate']:.0%} word hit rate={st['word_hit_rate']:.0%}",
+          flush=True)
+
+    # One allocation for the whole track: clause audio + its pause (none after the last clause)
+    total = sum(c.shape[0] + gap for _si, c, gap in units) - (units[-1][2] if units else 0)
+    audio = np.zeros(total, dtype=np.float32)
+    spans = [{"text": p["text"], "start": None, "end": 0} for p in prepared]
+    pos = 0
+    for si, c, gap in units:
+        audio[pos:pos + c.shape[0]] = c
+        if spans[si]["start"] is None:
+            spans[si]["start"] = pos
+        spans[si]["end"] = pos + c.shape[0]
+        pos += c.shape[0] + gap
+    timings = {"rate": rate, "sentences": spans}
+    del units  # release cache memmaps
+    if use_cache:
+        freed = cache_evict()
+        if freed:
+            print(f"[kokoro] cache evicted {freed / 1e6:.1f} MB (LRU)", flush=True)
+    print(f"[kokoro] {tag} joined to mono float32 | samples={audio.shape[0]}", flush=True)
+
+    if target_lufs is not None:
+        t0 = time.perf_counter()
+        audio, info = master_voiceover(audio, rate, target_lufs=target_lufs)
+        shift_timings(timings, -info["trim"][0], audio.shape[0])
+        print(f"[kokoro] {tag} mastered in {(time.perf_counter() - t0)*1000:.0f} ms | "
+              f"{info['lufs_in']:.1f} LUFS → {target_lufs:.1f} (gain {info['gain_db']:+.1f} dB) | "
+              f"trim={info['trim']}", flush=True)
+
+    if max_duration and audio.shape[0] > max_duration * rate:
+        t0 = time.perf_counter()
+        before = audio.shape[0] / float(rate)
+        audio, factor = fit_to_duration(audio, rate, max_duration, timings)
+        if target_lufs is not None:
+            audio = limit_true_peak(audio, rate)  # resynthesized frames can nudge peaks
+        print(f"[kokoro] {tag} stretched x{factor:.3f} in {(time.perf_counter() - t0)*1000:.0f} ms | "
+              f"{before:.2f}s → {audio.shape[0] / float(rate):.2f}s", flush=True)
+    return audio, timings
+
+def compile_audio(text: str, voice: str = "am_adam", speed: float = 1.05, rate: int = SAMPLE_RATE,
+                  use_cache: bool = True, fmt: str = "edit", target_lufs: float | None = TARGET_LUFS,
+                  variant: str | None = None, max_duration: float | None = None, handoff: str | None = None):
+    """
+    Synthesize `text` sentence by sentence and return (audio_bytes, duration_sec, timings).
+
+    `fmt` picks the encoding of audio_bytes: a stage name from STAGE_FORMATS ("edit",
+    "mux", "archive") or a format from AUDIO_FORMATS ("wav16", "flac", "opus", "aac",
+    "wav_f32"). Use audio_suffix(fmt) for the matching file extension.
+
+    `timings` is the per-sentence timing map:
+        {"rate": rate, "sentences": [{"text": str, "start": int, "end": int}, ...]}
+    where start/end are sample offsets into the returned track (end exclusive).
+    Use showtime()/sentence_span() to read it instead of synthesizing again.
+
+    With use_cache=True, clauses already synthesized with the same voice/speed/model
+    are read back from the on-disk clause cache (tts_cache_b) and only new or edited
+    clauses go through Kokoro.
+
+    With target_lufs set (default -16), the joined track has its edge silence trimmed, is
+    gained to that integrated loudness and true-peak limited (loudness_b); the timing map
+    is shifted to match. Pass target_lufs=None for the raw Kokoro output.
+
+    `variant` picks a model from MODEL_VARIANTS ("fp32", "fp16", "int8"); see
+    variant_for_channel() for the per-channel choice. None or DEFAULT_VARIANT keep an existing
+    KOKORO_MODEL; any other variant loads its own file.
 
-    audio = _to_mono_float32(y)
-    print(f"[kokoro] converted to mono float32 | samples={audio.shape[0]}", flush=True)
+    `max_duration` (seconds) fits an over-long track under a hard limit (e.g. Shorts) with a
+    pitch-preserving time-stretch instead of re-synthesizing at another speed.
+
+    `handoff` ("shm" or "memmap") also publishes the final float32 samples for the caption
+    worker (handoff_b) and stores the handle as timings["audio"]; release it with
+    handoff_b.release_audio() once captions are done.
+    """
+    print(f"[kokoro] synth start | voice={voice} speed={speed} sr={rate} text_len={len(text)}", flush=True)
+    prepared = prepare_script(text, variant=variant)
+    audio, timings = render_prepared(prepared, voice, speed, rate, use_cache, target_lufs, variant, max_duration)
 
     if _HAS_IPY:
         try:
@@ -82,33 +378,60 @@ def compile_audio(text: str, voice: str = "am_adam", speed: float = 1.05, rate:
         except Exception as e:
             print(f"[kokoro] IPython preview skipped: {e}", flush=True)
 
-    buf = io.BytesIO()
-    print("[kokoro] writing WAV to in-memory buffer…", flush=True)
-    with sf.SoundFile(buf, mode="w", samplerate=rate, channels=1, format="WAV", subtype="FLOAT") as f:
-        f.write(audio)
-    byte_len = buf.getbuffer().nbytes
-    buf.seek(0)
-    dur = sf.info(buf).duration
-    print(f"[kokoro] done | duration={dur:.2f}s bytes={byte_len}", flush=True)
-    return buf.getvalue(), dur
+    print(f"[kokoro] encoding {STAGE_FORMATS.get(fmt, fmt)} to in-memory buffer…", flush=True)
+    data = encode_audio(audio, rate, fmt)
+    dur = audio.shape[0] / float(rate)
+    if handoff:
+        timings["audio"] = publish_audio(audio, rate, handoff)
+    print(f"[kokoro] done | duration={dur:.2f}s bytes={len(data)}", flush=True)
+    return data, dur, timings
+
+def compile_audio_multi(text: str, voices=(("am_adam", 1.05),), rate: int = SAMPLE_RATE,
+                        use_cache: bool = True, fmt: str = "edit", target_lufs: float | None = TARGET_LUFS,
+                        max_workers: int | None = None, variant: str | None = None) -> dict:
+    """
+    Render one script in several voices/speeds for A/B comparison.
 
-def showtime(text: str, voice: str = "am_adam", speed: float = 1.05, rate: int = SAMPLE_RATE) -> float:
+    The script is split once (prepare_script; each clause is phonemized at most once), then every (voice, speed) pair
+    is synthesized from that shared form on a thread pool (ONNX Runtime releases the GIL).
+    Returns {"voice@speed": (audio_bytes, duration_sec, timings)} in the order given.
+    `voices` items may be (voice, speed) pairs or bare voice ids (speed 1.05).
     """
-    Synthesize with Kokoro and return ONLY the duration (seconds).
-    No bytes are returned and no prints/logging are emitted here.
+    pairs = [(v, 1.05) if isinstance(v, str) else (v[0], float(v[1])) for v in voices]
+    t0 = time.perf_counter()
+    prepared = prepare_script(text, variant=variant)
+    print(f"[kokoro] multi-voice | {len(pairs)} renders | prepared {len(prepared)} sentences in "
+          f"{(time.perf_counter() - t0)*1000:.0f} ms", flush=True)
+
+    def one(pair):
+        voice, speed = pair
+        audio, timings = render_prepared(prepared, voice, speed, rate, use_cache, target_lufs, variant)
+        return encode_audio(audio, rate, fmt), audio.shape[0] / float(rate), timings
 
-    Args:
-        text:   Input text to speak
-        voice:  Kokoro voice id (e.g., "am_adam")
-        speed:  Speech speed multiplier
-        rate:   Sample rate to assume for duration
+    with ThreadPoolExecutor(max_workers=max_workers or min(len(pairs), os.cpu_count() or 1) or 1) as ex:
+        results = list(ex.map(one, pairs))
+    print(f"[kokoro] multi-voice done in {(time.perf_counter() - t0):.1f} s", flush=True)
+    return {f"{v}@{sp}": r for (v, sp), r in zip(pairs, results)}
 
-    Returns:
-        float duration in seconds
+def shift_timings(timings: dict, offset: int, length: int) -> dict:
+    """Move every sentence by `offset` samples (in place), clamped to [0, length]."""
+    for s in timings["sentences"]:
+        s["start"] = min(max(s["start"] + offset, 0), length)
+        s["end"] = min(max(s["end"] + offset, 0), length)
+    return timings
+
+def sentence_span(timings: dict, index: int) -> tuple[float, float]:
+    """Return (start_sec, end_sec) of sentence `index` from a compile_audio timing map."""
+    rate = float(timings["rate"])
+    s = timings["sentences"][index]
+    return s["start"] / rate, s["end"] / rate
+
+def showtime(timings: dict, index: int = 0) -> float:
+    """
+    Return how long (seconds) from the start of the track until sentence `index`
+    has finished speaking. With index=0 this is the intro-card display time.
+    Reads the timing map from compile_audio(); no synthesis happens here.
     """
-    # Generate audio (ndarray or (L,R)), convert to mono, compute length/rate
-    y = _TTS.create(text, voice=voice, speed=speed)
-    audio = _to_mono_float32(y)
-    if audio.size == 0:
+    if not timings or not timings.get("sentences"):
         return 0.0
-    return float(audio.shape[-1]) / float(rate)
\ No newline at end of file
+    return sentence_span(timings, index)[1]
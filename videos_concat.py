@@ -16,6 +16,13 @@ import subprocess, sys, shlex, tempfile, re, random, math
 from pathlib import Path
 from datetime import datetime
 
+REPO_ROOT = Path(__file__).resolve().parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+# Per-machine encoder pick written by beta/bench_encoders_b.py ("concat" stage)
+from beta.encoder_profile_b import encoder_for
+
 VIDEO_EXTS = {".mp4", ".mov", ".mkv", ".m4v", ".avi", ".webm"}
 
 # -------------------------
@@ -53,6 +60,13 @@ def ffprobe_duration(path: Path) -> float:
     except Exception:
         return 0.0
 
+def concat_encoder(crf: int | None, preset: str | None) -> tuple[str, int, str]:
+    """(vcodec, crf, preset) from the benchmarked profile (encoder_profile_b); explicit arguments win."""
+    enc = encoder_for("concat")
+    return (enc["vcodec"],
+            crf if crf is not None else int(enc["crf"]),
+            preset if preset is not None else str(enc["preset"]))
+
 def build_concat_list_file(paths, list_path: Path):
     with list_path.open("w", encoding="utf-8") as f:
         for p in paths:
@@ -85,8 +99,8 @@ def concatenate_folder_random_slices_seamless(
     seed: int | None = None,
     target_height: int = 1080,
     target_fps: int = 30,
-    crf: int = 18,
-    preset: str = "slow",
+    crf: int | None = None,
+    preset: str | None = None,
 ):
     """
     For each clip, pick a random integer N in [lower_sec, upper_sec],
@@ -97,6 +111,8 @@ def concatenate_folder_random_slices_seamless(
         raise SystemExit("Invalid bounds: ensure integers lower_sec>=1, upper_sec>=lower_sec.")
 
     has_ffmpeg()
+    vcodec, crf, preset = concat_encoder(crf, preset)
+    print(f"Encoder: {vcodec} preset={preset} crf={crf}")
     if seed is not None:
         random.seed(seed)
 
@@ -158,7 +174,7 @@ def concatenate_folder_random_slices_seamless(
                 f"-vf {shlex.quote(vf)} -af {shlex.quote(af)} "
                 f"-sn "
                 f"-fps_mode cfr "
-                f"-c:v libx264 -crf {crf} -preset {preset} "
+                f"-c:v {vcodec} -crf {crf} -preset {preset} "
                 f"-c:a aac -b:a 320k -ar 48000 -ac 2 "
                 f"-movflags +faststart "
                 f"-fflags +genpts -avoid_negative_ts make_zero "
@@ -183,7 +199,7 @@ def concatenate_folder_random_slices_seamless(
                     f"-ss 0 -t {take_n} -i {shlex.quote(str(src))} "
                     f"-vf {shlex.quote(vf_simple)} -af {shlex.quote(af)} "
                     f"-sn -fps_mode cfr "
-                    f"-c:v libx264 -crf {crf} -preset {preset} "
+                    f"-c:v {vcodec} -crf {crf} -preset {preset} "
                     f"-c:a aac -b:a 320k -ar 48000 -ac 2 "
                     f"-movflags +faststart "
                     f"-fflags +genpts -avoid_negative_ts make_zero "
@@ -232,8 +248,8 @@ if __name__ == "__main__":
         seed=seed,
         target_height=1080,   # raise to 2160 to keep 4K height, or swap to vf_simple fallback always
         target_fps=30,        # set to 60 if your sources are 60fps
-        crf=18,
-        preset="slow",
+        crf=None,             # None = encoder profile (bench_encoders_b.py), else 18
+        preset=None,          # None = encoder profile, else "slow"
     )
 
 